@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+本体备份仓库
+Content-Addressed Backup Store for TCH Ontology
+
+功能 / Features:
+- 按内容 SHA-256 保存 gzip 压缩的备份，相同内容只保存一份
+- 每次备份在索引文件中追加一条引用（时间戳、哈希、大小、原因），不复制文件
+- 每次备份都重新计算哈希（修改时间和大小相同不代表内容相同），内容已存在时不重复写入
+- 保留策略：保留最近 N 次备份，删除超过 N 天的备份，清理不再被引用的压缩文件
+- 按时间戳（可只写前缀）恢复
+
+目录结构 / Layout:
+    tmp/backups/
+        index.jsonl                 # 每行一次备份
+        objects/ab/abcdef....gz     # 按内容哈希保存的压缩文件
+
+用法 / Usage:
+    python backup_store.py list
+    python backup_store.py restore 20261018_142010
+    python backup_store.py prune
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+TIMESTAMP_FORMAT = '%Y%m%d_%H%M%S'
+
+# 未配置时的默认值（term-import-config.yaml import_options）
+DEFAULT_BACKUP_DIR = 'tmp/backups'
+DEFAULT_KEEP = 20
+DEFAULT_KEEP_DAYS = 30
+
+
+def _file_sha256(path: Path) -> str:
+    """流式计算文件内容哈希"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BackupStore:
+    """按内容寻址的备份仓库"""
+
+    def __init__(self, root, keep: int = DEFAULT_KEEP, keep_days: int = DEFAULT_KEEP_DAYS):
+        """
+        Args:
+            root: 仓库目录
+            keep: 保留最近多少次备份，0 为不按次数限制
+            keep_days: 删除超过多少天的备份（最近一次总是保留），0 为不按时间限制
+        """
+        self.root = Path(root)
+        self.keep = keep
+        self.keep_days = keep_days
+        self.index_path = self.root / 'index.jsonl'
+        self.objects_dir = self.root / 'objects'
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / f"{sha256}.gz"
+
+    def entries(self) -> List[Dict]:
+        """全部备份记录（按时间先后）"""
+        if not self.index_path.exists():
+            return []
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def backup(self, source, reason: str = 'import') -> Tuple[Dict, bool]:
+        """
+        备份一个文件
+
+        Args:
+            source: 要备份的文件
+            reason: 备份原因（写入索引，list 时显示）
+
+        Returns:
+            (备份记录, 是否新写入了压缩文件)
+        """
+        source = Path(source)
+        stat = source.stat()
+        entries = self.entries()
+
+        # 始终按当前内容计算哈希：修改时间可能被保留或回拨，不能据此判断内容未变
+        sha256 = _file_sha256(source)
+
+        blob_path = self._blob_path(sha256)
+        created = not blob_path.exists()
+        if created:
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob_path.with_name(f".{blob_path.name}.{os.getpid()}.tmp")
+            try:
+                with open(source, 'rb') as src, gzip.open(tmp_path, 'wb', compresslevel=6) as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+                os.replace(tmp_path, blob_path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+        taken = {e['timestamp'] for e in entries}
+        suffix = 1
+        unique = timestamp
+        while unique in taken:
+            suffix += 1
+            unique = f"{timestamp}.{suffix}"
+
+        entry = {
+            'timestamp': unique,
+            'source': str(source.resolve()),
+            'sha256': sha256,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'reason': reason,
+        }
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        return entry, created
+
+    def find(self, timestamp: str) -> Dict:
+        """按时间戳查找备份，可只写前缀（多条匹配时取最近的一条）"""
+        matches = [e for e in self.entries() if e['timestamp'].startswith(timestamp)]
+        if not matches:
+            raise KeyError(f"没有时间戳为 {timestamp} 的备份")
+        return matches[-1]
+
+    def restore(self, timestamp: str, target=None) -> Tuple[Dict, Path]:
+        """
+        将备份恢复到 target（默认恢复到原文件位置）
+
+        目标文件存在时先备份当前内容（原因 restore），再原子替换
+
+        Returns:
+            (恢复的备份记录, 写入的文件路径)
+        """
+        entry = self.find(timestamp)
+        target = Path(target) if target else Path(entry['source'])
+        blob_path = self._blob_path(entry['sha256'])
+        if not blob_path.exists():
+            raise FileNotFoundError(f"备份内容缺失: {blob_path}")
+
+        if target.exists():
+            self.backup(target, reason='restore')
+
+        tmp_path = target.with_name(f".{target.name}.restore.tmp")
+        try:
+            with gzip.open(blob_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return entry, target
+
+    def prune(self, now: Optional[datetime] = None) -> Tuple[int, int]:
+        """
+        按保留策略删除旧备份记录，并删除不再被引用的压缩文件
+
+        Returns:
+            (删除的记录数, 删除的压缩文件数)
+        """
+        entries = self.entries()
+        kept = entries
+        if self.keep:
+            kept = kept[-self.keep:]
+        if self.keep_days and kept:
+            cutoff = (now or datetime.now()) - timedelta(days=self.keep_days)
+            latest = kept[-1]
+            kept = [e for e in kept
+                    if e is latest or datetime.strptime(e['timestamp'][:15], TIMESTAMP_FORMAT) >= cutoff]
+
+        removed_entries = len(entries) - len(kept)
+        if removed_entries:
+            tmp_path = self.index_path.with_name(f".{self.index_path.name}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for entry in kept:
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            os.replace(tmp_path, self.index_path)
+
+        referenced = {e['sha256'] for e in kept}
+        removed_blobs = 0
+        if self.objects_dir.is_dir():
+            for blob_path in self.objects_dir.glob('*/*.gz'):
+                if blob_path.name[:-len('.gz')] not in referenced:
+                    blob_path.unlink()
+                    removed_blobs += 1
+        return removed_entries, removed_blobs
+
+
+def store_from_config(config: Dict, ontology_path) -> BackupStore:
+    """根据导入配置（import_options.backup_*）创建备份仓库，相对路径以本体文件所在目录为准"""
+    options = config.get('import_options', {})
+    root = Path(options.get('backup_dir', DEFAULT_BACKUP_DIR))
+    if not root.is_absolute():
+        root = Path(ontology_path).parent / root
+    return BackupStore(
+        root,
+        keep=options.get('backup_keep', DEFAULT_KEEP),
+        keep_days=options.get('backup_keep_days', DEFAULT_KEEP_DAYS)
+    )
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(
+        description='TCH 本体备份仓库',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+示例:
+  # 查看备份
+  python backup_store.py list
+
+  # 恢复某次备份（时间戳可只写前缀，如 20261018_14）
+  python backup_store.py restore 20261018_142010
+
+  # 恢复到其他文件，不覆盖 tch-edit.owl
+  python backup_store.py restore 20261018_142010 --output /tmp/tch-edit.owl
+
+  # 按保留策略清理
+  python backup_store.py prune
+        """
+    )
+    parser.add_argument('--config', default='term-import-config.yaml',
+                        help='配置文件路径 (默认: term-import-config.yaml)')
+    parser.add_argument('--ontology', default='tch-edit.owl',
+                        help='本体文件路径 (默认: tch-edit.owl)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('list', help='列出备份')
+    restore_parser = subparsers.add_parser('restore', help='恢复备份')
+    restore_parser.add_argument('timestamp', help='备份时间戳（可只写前缀）')
+    restore_parser.add_argument('--output', help='恢复到该文件（默认: 原文件位置）')
+    subparsers.add_parser('prune', help='按保留策略清理备份')
+    args = parser.parse_args()
+
+    config = {}
+    if Path(args.config).exists():
+        with open(args.config, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    store = store_from_config(config, args.ontology)
+
+    if args.command == 'list':
+        entries = store.entries()
+        if not entries:
+            print(f"没有备份: {store.root}")
+            return
+        print(f"{'时间戳':<20} {'SHA-256':<14} {'大小':>12}  原因  文件")
+        for entry in entries:
+            print(f"{entry['timestamp']:<20} {entry['sha256'][:12]:<14} {entry['size']:>12}  "
+                  f"{entry['reason']}  {entry['source']}")
+        blob_count = len({e['sha256'] for e in entries})
+        print(f"\n共 {len(entries)} 次备份，{blob_count} 个不同版本")
+    elif args.command == 'restore':
+        try:
+            entry, target = store.restore(args.timestamp, args.output)
+        except (KeyError, FileNotFoundError) as e:
+            print(f"恢复失败: {e.args[0] if isinstance(e, KeyError) else e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"已恢复 {entry['timestamp']} ({entry['sha256'][:12]}) -> {target}")
+    else:
+        removed_entries, removed_blobs = store.prune()
+        print(f"已删除 {removed_entries} 条备份记录，{removed_blobs} 个压缩文件")
+
+
+if __name__ == '__main__':
+    main()
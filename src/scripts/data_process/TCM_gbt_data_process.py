@@ -0,0 +1,745 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TCM GB/T 层级术语数据处理脚本 - 临时ID版本
+用于从MySQL数据库中提取并处理中医临床诊疗术语(GB/T 16751)中按层级code组织的术语，
+生成符合各类别模板格式的标准化文件
+
+主要功能:
+1. 按类别配置(查询表与code过滤、临时ID配置、模板字段、ROOT节点、映射指南内容)处理数据
+2. 一次运行可处理任意多个类别，共用一个数据库连接
+3. 使用临时ID系统(TmpTCH:<类别>_XXXXX)进行ID分配
+4. 处理术语的层级关系，验证层级完整性和循环引用
+5. 生成ID映射指南文档(Markdown + 分页HTML)
+
+支持类别:
+- disease: clinical_disease (GB/T 16751.3—2021)
+- pattern: clinical_syndrome (GB/T 16751.2—2021)
+- method: clinical_treatment, code以3开头 (第4部分:治法治则)
+- principle: clinical_treatment, code以2开头 (第4部分:治法治则)
+
+用法:
+    python TCM_gbt_data_process.py                    # 处理所有类别
+    python TCM_gbt_data_process.py disease pattern    # 只处理指定类别
+
+创建时间: 2026.10.18
+版本: 3.0 (统一处理引擎)
+"""
+
+import argparse
+import pymysql
+import pandas as pd
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from hierarchy_stats import compute_hierarchy_stats, format_hierarchy_stats
+from hierarchy_utils import check_hierarchy
+from mapping_guide import MappingGuideIndex, write_html_guide, write_markdown_guide
+
+
+# MySQL连接配置
+SQL_CONFIG = {
+    'host': 'eggabc.site',
+    'port': 19104,
+    'user': 'tcm',
+    'password': 'tcm@123',
+    'database': 'clinical_diagnosis_and_treatment',
+    'charset': 'utf8mb4'
+}
+
+# 输出目录
+OUTPUT_DIR = Path(__file__).parent.parent.parent.parent / 'data' / 'data_temp_ids'
+
+# 从数据库提取的字段
+RAW_COLUMNS = ['id', 'code', 'term_cn', 'term_synonym', 'term_en',
+               'definition', 'source_file', 'upload_time']
+
+# 类别配置
+# - table / code_prefix: 查询的表和code前缀过滤(None 表示整张表)
+# - temp_id: 临时ID前缀、起始编号(各类别互不冲突)、编号位数
+# - relation_fields: 模板中 parents 与 xrefs 之间的关系字段(需要后续补充)
+# - root: ROOT节点内容
+# - guide: 映射指南中与类别相关的内容(文字与各类别原脚本生成的指南逐字一致)
+
+# 映射指南注意事项中各类别共有的条目
+GUIDE_NOTES = ['临时ID仅用于审核阶段,不应用于生产环境',
+               '删除术语时注意检查是否有子术语依赖',
+               '最终ID分配时需保持层级关系的一致性']
+BACKUP_NOTE = '建议在ID重分配前备份数据'
+
+CATEGORY_CONFIGS = {
+    'disease': {
+        'name_zh': '疾病',
+        'name_en': 'Disease',
+        'table': 'clinical_disease',
+        'code_prefix': None,
+        'temp_id': {'prefix': 'TmpTCH:DISEASE_', 'start_number': 20000, 'padding': 5},
+        'relation_fields': ['has_sign', 'has_symptom', 'has_pathomechanism', 'typical_tcm_patterns',
+                            'treated_by_principle', 'treated_by_method', 'treated_by_formula',
+                            'anatomical_site_uberon', 'etiologic_agent', 'icd11_mms'],
+        'default_source': 'GB/T 16751.3-2021',
+        'notes_suffix': '',
+        'root': {
+            'label_zh': '疾病',
+            'label_en': 'Disease',
+            'definition_zh': '中医疾病根类别，包含所有疾病术语',
+            'definition_en': 'Root category for all TCM disease terms',
+            'sources': 'GB/T 16751.3-2021',
+            'notes': 'ROOT category for Disease hierarchy',
+        },
+        'guide': {
+            'example_codes': ['1', '1.1', '1.1.1', '1.1.1.1'],
+            'examples_intro': '以下是几个典型的层级关系示例:',
+            'final_id_range': 'TCH:0100000-0199999',
+            'review_step': '补充疾病相关字段(症状、证候、治疗方法等)',
+            'reassign_start': 100000,
+            'template_fields': [
+                ('has_sign', '疾病的体征(多个用;分隔)'),
+                ('has_symptom', '疾病的症状(多个用;分隔)'),
+                ('has_pathomechanism', '疾病的病机'),
+                ('typical_tcm_patterns', '典型证候(多个用;分隔)'),
+                ('treated_by_principle', '治疗原则(多个用;分隔)'),
+                ('treated_by_method', '治疗方法(多个用;分隔)'),
+                ('treated_by_formula', '治疗方剂(多个用;分隔)'),
+                ('anatomical_site_uberon', '解剖部位(UBERON编码)'),
+                ('etiologic_agent', '病因病原'),
+                ('icd11_mms', 'ICD-11编码'),
+                ('xrefs', '外部参考(多个用;分隔)'),
+            ],
+            'notes': GUIDE_NOTES + [BACKUP_NOTE, 'Disease数据的ID范围是 TCH:0100000-0199999'],
+        },
+    },
+    'pattern': {
+        'name_zh': '证候',
+        'name_en': 'Pattern',
+        'table': 'clinical_syndrome',
+        'code_prefix': None,
+        'temp_id': {'prefix': 'TmpTCH:PATTERN_', 'start_number': 10000, 'padding': 5},
+        'relation_fields': ['has_sign', 'has_symptom', 'reflected_by_pathomechanism', 'treated_by_principle',
+                            'diagnosed_by_differentiation', 'associated_disease'],
+        'default_source': 'GB/T 16751.2-2021',
+        'notes_suffix': '; Database: clinical_syndrome',
+        'root': {
+            'label_zh': '证候',
+            'label_en': 'Pattern',
+            'definition_zh': '中医证候根类别，包含所有证候术语',
+            'definition_en': 'Root category for all TCM pattern terms',
+            'sources': 'GB/T 16751.2-2021',
+            'notes': 'ROOT category for Pattern hierarchy; Database: clinical_syndrome',
+        },
+        'guide': {
+            'example_codes': ['2', '2.3', '2.3.2', '2.3.2.1'],
+            'examples_intro': '以下是几个典型的层级关系示例:',
+            'final_id_range': 'TCH:0001000-0099999',
+            'reassign_start': 1000,
+            'reassign_braces_doubled': True,  # 原脚本指南中的示例代码为 {{}}，保持一致
+            'notes': GUIDE_NOTES + [BACKUP_NOTE],
+        },
+    },
+    'method': {
+        'name_zh': '治法',
+        'name_en': 'Method',
+        'table': 'clinical_treatment',
+        'code_prefix': '3',
+        'temp_id': {'prefix': 'TmpTCH:METHOD_', 'start_number': 61000, 'padding': 5},
+        'relation_fields': ['realizes_principle', 'treats_pattern', 'treats_disease', 'employs_herb',
+                            'employs_formula'],
+        'default_source': '',
+        'notes_suffix': '; Database: clinical_treatment',
+        'root': {
+            'label_zh': '治法',
+            'label_en': 'Therapeutic Method',
+            'definition_zh': '中医治法根类别,包含所有治法术语',
+            'definition_en': 'Root category for all TCM therapeutic method terms',
+            'sources': '',
+            'notes': 'ROOT category for Method hierarchy',
+        },
+        'guide': {
+            'example_codes': ['3', '3.1', '3.1.1'],
+            'final_id_range': 'TCH:6100000-6199999',
+            'review_step': '补充关系字段(realizes_principle, treats_pattern, treats_disease等)',
+            'relation_docs': [
+                ('realizes_principle', '该治法实现的治则(TCH ID,分号分隔)'),
+                ('treats_pattern', '该治法治疗的证候(TCH ID,分号分隔)'),
+                ('treats_disease', '该治法治疗的疾病(TCH ID,分号分隔)'),
+                ('employs_herb', '该治法使用的中药(TCH ID,分号分隔)'),
+                ('employs_formula', '该治法使用的方剂(TCH ID,分号分隔)'),
+            ],
+            'notes': GUIDE_NOTES + ['关系字段需要与principle、pattern、disease、herb、formula数据交叉引用', BACKUP_NOTE],
+        },
+    },
+    'principle': {
+        'name_zh': '治则',
+        'name_en': 'Principle',
+        'table': 'clinical_treatment',
+        'code_prefix': '2',
+        'temp_id': {'prefix': 'TmpTCH:PRINCIPLE_', 'start_number': 60000, 'padding': 5},
+        'relation_fields': ['applied_to_pattern', 'applied_to_disease', 'realized_by_method',
+                            'constrains_formula'],
+        'default_source': '',
+        'notes_suffix': '; Database: clinical_treatment',
+        'root': {
+            'label_zh': '治则',
+            'label_en': 'Therapeutic Principle',
+            'definition_zh': '中医治则根类别,包含所有治则术语',
+            'definition_en': 'Root category for all TCM therapeutic principle terms',
+            'sources': '',
+            'notes': 'ROOT category for Principle hierarchy',
+        },
+        'guide': {
+            'example_codes': ['2', '2.1', '2.1.1'],
+            'final_id_range': 'TCH:6000000-6099999',
+            'review_step': '补充关系字段(applied_to_pattern, applied_to_disease, realized_by_method等)',
+            'relation_docs': [
+                ('applied_to_pattern', '该治则适用的证候(TCH ID,分号分隔)'),
+                ('applied_to_disease', '该治则适用的疾病(TCH ID,分号分隔)'),
+                ('realized_by_method', '实现该治则的治法(TCH ID,分号分隔)'),
+                ('constrains_formula', '该治则约束的方剂(TCH ID,分号分隔)'),
+            ],
+            'notes': GUIDE_NOTES + ['关系字段需要与pattern、disease、method、formula数据交叉引用', BACKUP_NOTE],
+        },
+    },
+}
+
+# 映射指南中的ID重分配脚本示例(函数体内的空行为4个空格，与原脚本生成的指南一致)
+REASSIGN_SCRIPT_TEMPLATE = '\n'.join([
+    "```python",
+    "# 示例:ID重分配脚本框架",
+    "def reassign_final_ids(temp_csv_path, id_range_start=%d):",
+    "    df = pd.read_csv(temp_csv_path)",
+    "    ",
+    "    # 建立临时ID到最终ID的映射",
+    "    temp_to_final = {}",
+    "    current_id = id_range_start",
+    "    ",
+    "    for temp_id in df['tch_id']:",
+    "        if temp_id not in temp_to_final:",
+    "            temp_to_final[temp_id] = f\"TCH:{str(current_id).zfill(7)}\"",
+    "            current_id += 1",
+    "    ",
+    "    # 替换ID",
+    "    df['tch_id'] = df['tch_id'].map(temp_to_final)",
+    "    df['parents'] = df['parents'].apply(",
+    "        lambda x: temp_to_final.get(x, '') if x else ''",
+    "    )",
+    "    ",
+    "    return df",
+    "```",
+    "",
+])
+
+
+def connect_db(config: Dict, verbose: bool = True):
+    """连接MySQL数据库(verbose 为 False 时不输出信息，失败时只抛出异常，供工作线程使用)"""
+    try:
+        connection = pymysql.connect(
+            host=config['host'],
+            port=config['port'],
+            user=config['user'],
+            password=config['password'],
+            database=config['database'],
+            charset=config['charset']
+        )
+    except Exception as e:
+        if verbose:
+            print(f"❌ 数据库连接失败: {e}")
+        raise
+    if verbose:
+        print("✅ 数据库连接成功")
+        print(f"   连接到: {config['host']}:{config['port']}/{config['database']}")
+    return connection
+
+
+class GBTDataProcessor:
+    """GB/T 层级术语数据处理器 - 临时ID版本"""
+
+    def __init__(self, category: str, output_dir: Path = OUTPUT_DIR):
+        """
+        初始化处理器
+
+        Args:
+            category: 类别名称(CATEGORY_CONFIGS 中的键)
+            output_dir: 输出目录
+        """
+        if category not in CATEGORY_CONFIGS:
+            raise ValueError(f"不支持的类别: {category}（可选: {', '.join(CATEGORY_CONFIGS)}）")
+        self.category = category
+        self.spec = CATEGORY_CONFIGS[category]
+        self.temp_id_config = self.spec['temp_id']
+
+        self.output_dir = Path(output_dir)
+        self.output_file = self.output_dir / f'{category}_data_temp_ids.csv'
+        self.mapping_guide_file = self.output_dir / f'{category}_temp_id_mapping_guide.md'
+        self.mapping_guide_html_dir = self.output_dir / f'{category}_temp_id_mapping_guide_html'
+
+        self.raw_data = None
+        self.raw_codes = set()        # 原始数据中的code集合(判断父级是否为占位符)
+        self.processed_data = []
+        self.code_to_temp_id = {}     # code -> 临时ID 映射
+        self.temp_id_to_code = {}     # 临时ID -> code 映射
+        self.used_temp_ids = set()    # 已使用的临时ID集合
+        self.current_temp_number = self.temp_id_config['start_number']
+
+    @property
+    def title(self) -> str:
+        """类别显示名称，如 疾病(disease)"""
+        return f"{self.spec['name_zh']}({self.category})"
+
+    @property
+    def data_source(self) -> str:
+        """数据来源说明"""
+        source = f"{SQL_CONFIG['database']}.{self.spec['table']}"
+        if self.spec['code_prefix']:
+            source += f" (code {self.spec['code_prefix']}开头)"
+        return source
+
+    def build_query(self) -> Tuple[str, tuple]:
+        """构建提取数据的SQL及参数"""
+        query = f"SELECT {', '.join(RAW_COLUMNS)} FROM {self.spec['table']}"
+        params = ()
+        if self.spec['code_prefix']:
+            query += " WHERE code LIKE %s"
+            params = (f"{self.spec['code_prefix']}%",)
+        return query + " ORDER BY code", params
+
+    def fetch_data(self, connection) -> bool:
+        """从数据库提取数据"""
+        print("\n" + "="*70)
+        print(f"📥 从数据库提取{self.spec['name_zh']}数据 ({self.data_source})")
+        print("="*70)
+
+        try:
+            self.query_raw_data(connection)
+        except Exception as e:
+            print(f"❌ 数据提取失败: {e}")
+            return False
+
+        print(f"✅ 成功提取 {len(self.raw_data)} 条原始数据")
+        print(f"   数据字段: {', '.join(RAW_COLUMNS)}")
+        return True
+
+    def query_raw_data(self, connection):
+        """执行查询并设置原始数据(不输出信息，失败时抛出异常)"""
+        query, params = self.build_query()
+        with connection.cursor() as cursor:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+        self.set_raw_data(pd.DataFrame(rows, columns=RAW_COLUMNS))
+
+    def set_raw_data(self, raw_data: pd.DataFrame):
+        """设置原始数据(过滤掉列名行和空术语)"""
+        self.raw_data = raw_data[
+            (raw_data['term_cn'] != 'term_cn') &
+            (raw_data['term_cn'].notna())
+        ]
+        self.raw_codes = set(self.raw_data['code'])
+
+    def allocate_temp_id(self, code: str) -> str:
+        """分配临时ID"""
+        if code in self.code_to_temp_id:
+            return self.code_to_temp_id[code]
+
+        # 生成新的临时ID
+        prefix = self.temp_id_config['prefix']
+        padding = self.temp_id_config['padding']
+
+        while True:
+            temp_id = f"{prefix}{str(self.current_temp_number).zfill(padding)}"
+            if temp_id not in self.used_temp_ids:
+                break
+            self.current_temp_number += 1
+
+        # 记录映射关系
+        self.code_to_temp_id[code] = temp_id
+        self.temp_id_to_code[temp_id] = code
+        self.used_temp_ids.add(temp_id)
+        self.current_temp_number += 1
+
+        return temp_id
+
+    def format_temp_id(self, number: int) -> str:
+        """按临时ID配置格式化编号"""
+        return f"{self.temp_id_config['prefix']}{str(number).zfill(self.temp_id_config['padding'])}"
+
+    def get_parent_code(self, code: str) -> Optional[str]:
+        """获取父级code
+
+        层级关系规则:
+        - 2.3.2.1 的父级是 2.3.2
+        - 2.3 的父级是 2
+        - 2 的父级是 ROOT(顶层类别)
+        - ROOT 无父级
+        """
+        if not code or code == 'ROOT':
+            return None
+
+        # 拆分code
+        parts = code.split('.')
+
+        if len(parts) == 1:
+            # 单级code(如 "2"),父级是ROOT
+            return 'ROOT'
+        else:
+            # 多级code,去掉最后一级
+            return '.'.join(parts[:-1])
+
+    def get_parent_temp_id(self, code: str) -> str:
+        """获取父级的临时ID"""
+        parent_code = self.get_parent_code(code)
+
+        if parent_code is None:
+            return ''  # 顶层无父级
+
+        if parent_code == 'ROOT':
+            # ROOT类别的临时ID
+            if 'ROOT' not in self.code_to_temp_id:
+                self.allocate_temp_id('ROOT')
+            return self.code_to_temp_id['ROOT']
+
+        # 确保父级已分配临时ID
+        if parent_code not in self.code_to_temp_id:
+            # 如果父级不在原始数据中,创建占位符
+            if parent_code not in self.raw_codes:
+                self.allocate_temp_id(parent_code)
+
+        return self.code_to_temp_id.get(parent_code, '')
+
+    def _empty_relations(self) -> Dict[str, str]:
+        """模板关系字段(需要后续补充)"""
+        return dict.fromkeys(self.spec['relation_fields'], '')
+
+    def process_data(self):
+        """处理数据"""
+        print("\n" + "="*70)
+        print(f"🔄 开始处理{self.spec['name_zh']}数据")
+        print("="*70)
+
+        # 先为ROOT分配临时ID
+        root_temp_id = self.allocate_temp_id('ROOT')
+        print(f"📌 ROOT类别临时ID: {root_temp_id}")
+
+        # 收集所有需要的父级code
+        codes = self.raw_data['code'].tolist()
+        all_parent_codes = set()
+        for code in codes:
+            parent_code = self.get_parent_code(code)
+            while parent_code and parent_code != 'ROOT' and parent_code not in all_parent_codes:
+                all_parent_codes.add(parent_code)
+                parent_code = self.get_parent_code(parent_code)
+
+        # 为所有code(包括占位符)分配临时ID
+        for code in sorted(all_parent_codes):
+            if code not in self.code_to_temp_id:
+                self.allocate_temp_id(code)
+
+        for code in codes:
+            if code not in self.code_to_temp_id:
+                self.allocate_temp_id(code)
+
+        print(f"✅ 已分配 {len(self.code_to_temp_id)} 个临时ID")
+
+        date_accessed = datetime.now().strftime('%Y-%m-%d')
+        root = self.spec['root']
+
+        # 先添加ROOT节点
+        root_data = {
+            'tch_id': root_temp_id,
+            'data_category': self.category,
+            'label_zh': root['label_zh'],
+            'label_en': root['label_en'],
+            'definition_zh': root['definition_zh'],
+            'definition_en': root['definition_en'],
+            'has_synonym_zh': '',
+            'has_synonym_en': '',
+            'parents': '',
+            **self._empty_relations(),
+            'xrefs': '',
+            'sources': root['sources'],
+            'date_accessed': date_accessed,
+            'notes': root['notes']
+        }
+        self.processed_data.append(root_data)
+
+        # 处理每条记录
+        for row in self.raw_data.to_dict('records'):
+            code = row['code']
+
+            # 构建processed_data条目
+            term_data = {
+                'tch_id': self.code_to_temp_id[code],
+                'data_category': self.category,
+                'label_zh': row['term_cn'] if pd.notna(row['term_cn']) else '',
+                'label_en': row['term_en'] if pd.notna(row['term_en']) else '',
+                'definition_zh': row['definition'] if pd.notna(row['definition']) else '',
+                'definition_en': '',
+                'has_synonym_zh': row['term_synonym'] if pd.notna(row['term_synonym']) else '',
+                'has_synonym_en': '',
+                'parents': self.get_parent_temp_id(code),
+                **self._empty_relations(),
+                'xrefs': '',
+                'sources': row['source_file'] if pd.notna(row['source_file']) else self.spec['default_source'],
+                'date_accessed': date_accessed,
+                'notes': f"Original code: {code}{self.spec['notes_suffix']}"
+            }
+
+            self.processed_data.append(term_data)
+
+        print(f"✅ 成功处理 {len(self.processed_data)} 条数据(包含ROOT节点)")
+
+    def validate_hierarchy(self) -> Tuple[bool, List[str]]:
+        """验证层级关系完整性"""
+        print("\n" + "="*70)
+        print(f"🔍 验证{self.spec['name_zh']}层级关系")
+        print("="*70)
+
+        # 一次遍历检查重复ID、自身为父级、孤儿节点和循环引用
+        issues = check_hierarchy(self.processed_data).messages()
+
+        if issues:
+            print(f"❌ 发现 {len(issues)} 个层级问题:")
+            for issue in issues[:10]:  # 只显示前10个
+                print(f"   - {issue}")
+            return False, issues
+        else:
+            print("✅ 层级关系验证通过")
+            return True, []
+
+    def _guide_footer(self) -> str:
+        """映射指南中与类别相关的后续步骤、字段说明和注意事项"""
+        guide = self.spec['guide']
+
+        review_steps = ['审核 `%s` 文件中的术语' % self.output_file.name,
+                        '删除不需要的术语行',
+                        '修正术语信息(如有需要)']
+        if guide.get('review_step'):
+            review_steps.append(guide['review_step'])
+
+        text = "\n\n## 3. 后续处理步骤\n\n### 3.1 人工审核阶段\n"
+        text += ''.join(f"{number}. {step}\n" for number, step in enumerate(review_steps, start=1))
+        text += f"""
+### 3.2 最终ID分配阶段
+1. 确定保留的术语列表
+2. 按照TCH ID分配策略分配正式ID({guide['final_id_range']})
+3. 更新parents字段为正式ID
+4. 生成最终的{self.category}_data_processed.csv
+
+"""
+        if guide.get('relation_docs'):
+            text += "### 3.3 关系字段说明\n"
+            text += ''.join(f"- **{name}**: {description}\n" for name, description in guide['relation_docs'])
+        else:
+            script = REASSIGN_SCRIPT_TEMPLATE % guide['reassign_start']
+            if guide.get('reassign_braces_doubled'):
+                script = script.replace('{', '{{').replace('}', '}}')
+            text += "### 3.3 ID重分配脚本\n可以使用以下脚本将临时ID替换为正式ID:\n\n"
+            text += script
+
+        section = 4
+        if guide.get('template_fields'):
+            name_en = self.spec['name_en']
+            text += f"\n## {section}. {name_en}模板特有字段说明\n\n{name_en}模板包含以下特有字段，需要在人工审核阶段补充:\n\n"
+            text += ''.join(f"- **{name}**: {description}\n" for name, description in guide['template_fields'])
+            section += 1
+
+        text += f"\n## {section}. 注意事项\n\n⚠️ **重要提醒**:\n"
+        text += ''.join(f"- {note}\n" for note in guide['notes'])
+        # 指南注明的生成脚本为该类别的入口脚本
+        text += f"\n---\n*本文档由 TCM_{self.category}_data_process.py 自动生成*\n"
+        return text
+
+    def generate_id_mapping_guide(self):
+        """生成临时ID映射指南"""
+        print("\n" + "="*70)
+        print(f"📄 生成{self.spec['name_zh']}ID映射指南")
+        print("="*70)
+
+        name_en = self.spec['name_en']
+        # 一次建立索引，避免每个code都扫描 processed_data
+        index = MappingGuideIndex(self.processed_data, self.code_to_temp_id, self.get_parent_code,
+                                  root_label=f"{self.spec['name_zh']}(根类别)")
+
+        header = f"""# {name_en}临时ID映射指南
+
+**生成时间**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**数据来源**: {self.data_source}
+**临时ID范围**: {self.format_temp_id(self.temp_id_config['start_number'])} - {self.format_temp_id(self.current_temp_number - 1)}
+**总术语数**: {len(self.code_to_temp_id)}
+
+## 1. 映射关系概览
+
+| 临时ID | 原始Code | 中文术语 | 父级临时ID |
+|--------|----------|----------|------------|
+"""
+
+        examples = f"""
+
+## 2. 层级结构示例
+
+{self.spec['guide'].get('examples_intro', '以下是典型的层级关系示例:')}
+
+"""
+        examples += index.examples(self.spec['guide']['example_codes'])
+
+        # 按章节流式写出，映射表逐行写入
+        write_markdown_guide(self.mapping_guide_file,
+                             [header, index.markdown_rows(), examples, self._guide_footer()])
+        print(f"✅ ID映射指南已保存: {self.mapping_guide_file}")
+
+        pages = write_html_guide(self.mapping_guide_html_dir, f'{name_en}临时ID映射指南', index)
+        print(f"✅ HTML版映射指南已保存: {self.mapping_guide_html_dir / 'index.html'} ({pages} 页)")
+
+    def save_data(self):
+        """保存处理后的数据"""
+        print("\n" + "="*70)
+        print(f"💾 保存{self.spec['name_zh']}处理结果")
+        print("="*70)
+
+        # 转换为DataFrame
+        df = pd.DataFrame(self.processed_data)
+
+        # 确保输出目录存在
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # 保存CSV
+        df.to_csv(self.output_file, index=False, encoding='utf-8')
+
+        print(f"✅ 数据已保存到: {self.output_file}")
+        print(f"   记录数: {len(df)}")
+        print(f"   文件大小: {self.output_file.stat().st_size / 1024:.2f} KB")
+
+        # 显示统计信息
+        self.print_statistics(df)
+
+    def print_statistics(self, df: pd.DataFrame):
+        """打印统计信息"""
+        print("\n" + "="*70)
+        print(f"📊 {self.spec['name_zh']}数据统计")
+        print("="*70)
+
+        # 基本统计
+        print(f"总术语数: {len(df)}")
+        print(f"临时ID范围: {df['tch_id'].min()} - {df['tch_id'].max()}")
+
+        # 字段完整性
+        print("\n字段完整性:")
+        print(f"  - 中文名称: {df['label_zh'].notna().sum()} ({df['label_zh'].notna().sum()/len(df)*100:.1f}%)")
+        print(f"  - 英文名称: {df['label_en'].notna().sum()} ({df['label_en'].notna().sum()/len(df)*100:.1f}%)")
+        print(f"  - 中文定义: {df['definition_zh'].notna().sum()} ({df['definition_zh'].notna().sum()/len(df)*100:.1f}%)")
+        print(f"  - 中文同义词: {(df['has_synonym_zh'].notna() & (df['has_synonym_zh'] != '')).sum()} ({(df['has_synonym_zh'].notna() & (df['has_synonym_zh'] != '')).sum()/len(df)*100:.1f}%)")
+
+        # 层级统计(深度、子节点数、顶级类别子树规模)
+        print(f"\n层级关系:")
+        for line in format_hierarchy_stats(compute_hierarchy_stats(df, root_id=self.code_to_temp_id.get('ROOT'))):
+            print(line)
+
+        print("\n" + "="*70)
+
+    def process(self) -> bool:
+        """处理已提取的数据: 分配ID、验证层级、生成映射指南、保存"""
+        self.process_data()
+
+        valid, issues = self.validate_hierarchy()
+        if not valid:
+            print("\n⚠️ 警告: 发现层级关系问题,但继续处理...")
+
+        self.generate_id_mapping_guide()
+        self.save_data()
+        return valid
+
+
+def run_categories(categories: Optional[List[str]] = None, config: Dict = SQL_CONFIG,
+                   output_dir: Path = OUTPUT_DIR) -> Dict[str, bool]:
+    """
+    处理多个类别，共用一个数据库连接
+
+    Args:
+        categories: 类别列表，None 表示全部类别
+        config: 数据库连接配置
+        output_dir: 输出目录
+
+    Returns:
+        类别 -> 是否成功(提取失败或处理出错为 False)
+    """
+    categories = categories or list(CATEGORY_CONFIGS)
+    unknown = [category for category in categories if category not in CATEGORY_CONFIGS]
+    if unknown:
+        raise ValueError(f"不支持的类别: {', '.join(unknown)}（可选: {', '.join(CATEGORY_CONFIGS)}）")
+
+    print("="*70)
+    print("TCM GB/T 术语数据处理程序 - 临时ID版本".center(70))
+    print("="*70)
+    print(f"开始时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"处理类别: {', '.join(categories)}")
+
+    results = {}
+    processors = {}
+    connection = None
+    try:
+        # 1. 连接数据库(所有类别共用)
+        connection = connect_db(config)
+
+        for category in categories:
+            processor = GBTDataProcessor(category, output_dir)
+            processors[category] = processor
+            print("\n" + "#"*70)
+            print(f"📂 处理类别: {processor.title}")
+            print("#"*70)
+            try:
+                # 2. 提取数据
+                if not processor.fetch_data(connection):
+                    results[category] = False
+                    continue
+                # 3-6. 处理、验证、生成映射指南、保存
+                processor.process()
+                results[category] = True
+            except Exception as e:
+                print(f"\n❌ 处理{processor.title}时出现错误: {e}")
+                import traceback
+                traceback.print_exc()
+                results[category] = False
+
+    except Exception as e:
+        print(f"\n❌ 处理过程中出现错误: {e}")
+        import traceback
+        traceback.print_exc()
+
+    finally:
+        if connection:
+            connection.close()
+            print("✅ 数据库连接已关闭")
+
+    print("\n" + "="*70)
+    print("✅ 处理完成!".center(70))
+    print("="*70)
+    print(f"结束时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    for category, processor in processors.items():
+        status = "✅" if results.get(category) else "❌"
+        print(f"\n{status} {processor.title}:")
+        if results.get(category):
+            print(f"  - 数据文件: {processor.output_file}")
+            print(f"  - 映射指南: {processor.mapping_guide_file}")
+            print(f"  - 映射指南(HTML): {processor.mapping_guide_html_dir / 'index.html'}")
+
+    return results
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description='TCM GB/T 层级术语数据处理(临时ID版本)')
+    parser.add_argument('categories', nargs='*',
+                        help=f"要处理的类别: {', '.join(CATEGORY_CONFIGS)} (默认: 全部)")
+    parser.add_argument('--output-dir', type=Path, default=OUTPUT_DIR,
+                        help=f'输出目录 (默认: {OUTPUT_DIR})')
+    args = parser.parse_args()
+
+    unknown = [category for category in args.categories if category not in CATEGORY_CONFIGS]
+    if unknown:
+        parser.error(f"不支持的类别: {', '.join(unknown)}")
+
+    run_categories(args.categories or None, output_dir=args.output_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+TCM GB/T 层级术语并发处理脚本
+同时处理疾病、证候、治法、治则等类别，总耗时接近最慢的一个类别，而不是各类别之和
+
+主要功能:
+1. 线程池并发提取各类别数据，每个线程使用自己的数据库连接
+2. 某个类别提取完成后立即提交到进程池，分配ID、验证层级、生成映射指南、保存(CPU密集部分)
+3. 工作线程和子进程不直接输出，各类别的提取结果和处理日志由主线程按完成顺序整段输出，不互相穿插
+4. 最后输出汇总: 各类别术语数、层级校验结果、提取/处理耗时和输出文件
+
+处理逻辑和类别配置见 TCM_gbt_data_process.py
+
+用法:
+    python TCM_gbt_parallel_process.py                      # 处理所有类别
+    python TCM_gbt_parallel_process.py disease pattern      # 只处理指定类别
+    python TCM_gbt_parallel_process.py --workers 2 --quiet  # 限制进程数，不输出各类别日志
+
+创建时间: 2026.10.18
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from TCM_gbt_data_process import CATEGORY_CONFIGS, OUTPUT_DIR, SQL_CONFIG, GBTDataProcessor, connect_db
+
+
+@dataclass
+class CategoryResult:
+    """单个类别的处理结果"""
+    category: str
+    title: str
+    success: bool = False
+    valid: Optional[bool] = None   # 层级校验是否通过，未处理时为 None
+    raw_count: int = 0
+    term_count: int = 0
+    fetch_seconds: float = 0.0
+    process_seconds: float = 0.0
+    error: str = ''
+    log: str = ''
+    output_file: str = ''
+    mapping_guide_file: str = ''
+    mapping_guide_html: str = ''
+
+
+def _title(category: str) -> str:
+    """类别显示名称，如 疾病(disease)"""
+    return f"{CATEGORY_CONFIGS[category]['name_zh']}({category})"
+
+
+def fetch_category(category: str, config: Dict, output_dir: Path) -> GBTDataProcessor:
+    """在线程中提取一个类别的数据(独立的数据库连接，不输出信息，结果和异常由主线程输出)"""
+    processor = GBTDataProcessor(category, output_dir)
+    connection = connect_db(config, verbose=False)
+    try:
+        processor.query_raw_data(connection)
+    finally:
+        connection.close()
+    return processor
+
+
+def process_category(processor: GBTDataProcessor) -> CategoryResult:
+    """在子进程中处理一个类别，日志收集到结果中"""
+    result = CategoryResult(processor.category, processor.title, raw_count=len(processor.raw_data))
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(buffer):
+        try:
+            result.valid = processor.process()
+            result.success = True
+        except Exception as e:
+            result.error = str(e)
+            traceback.print_exc(file=buffer)
+    result.process_seconds = time.perf_counter() - start
+    result.log = buffer.getvalue()
+    result.term_count = len(processor.processed_data)
+    result.output_file = str(processor.output_file)
+    result.mapping_guide_file = str(processor.mapping_guide_file)
+    result.mapping_guide_html = str(processor.mapping_guide_html_dir / 'index.html')
+    return result
+
+
+def run_parallel(categories: Optional[List[str]] = None, config: Dict = SQL_CONFIG,
+                 output_dir: Path = OUTPUT_DIR, workers: Optional[int] = None,
+                 show_logs: bool = True) -> Dict[str, CategoryResult]:
+    """
+    并发处理多个类别
+
+    Args:
+        categories: 类别列表，None 表示全部类别
+        config: 数据库连接配置
+        output_dir: 输出目录
+        workers: 处理进程数，默认为类别数与CPU核数中的较小值
+        show_logs: 是否输出各类别的处理日志
+
+    Returns:
+        类别 -> CategoryResult
+    """
+    categories = categories or list(CATEGORY_CONFIGS)
+    unknown = [category for category in categories if category not in CATEGORY_CONFIGS]
+    if unknown:
+        raise ValueError(f"不支持的类别: {', '.join(unknown)}（可选: {', '.join(CATEGORY_CONFIGS)}）")
+    workers = workers or min(len(categories), os.cpu_count() or 1)
+
+    print("="*70)
+    print("TCM GB/T 术语并发处理程序 - 临时ID版本".center(70))
+    print("="*70)
+    print(f"开始时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"处理类别: {', '.join(categories)} (提取线程 {len(categories)}, 处理进程 {workers})")
+    print(f"数据库: {config['host']}:{config['port']}/{config['database']}")
+
+    results: Dict[str, CategoryResult] = {}
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=len(categories)) as threads, \
+            ProcessPoolExecutor(max_workers=workers) as processes:
+        fetching = {}
+        fetch_started = {}
+        for category in categories:
+            fetch_started[category] = time.perf_counter()
+            fetching[threads.submit(fetch_category, category, config, output_dir)] = category
+        processing = {}
+
+        # 提取完成一个类别就提交处理，处理完成一个就输出一个
+        while fetching or processing:
+            done, _ = wait(list(fetching) + list(processing), return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in fetching:
+                    category = fetching.pop(future)
+                    fetch_seconds = time.perf_counter() - fetch_started[category]
+                    try:
+                        processor = future.result()
+                    except Exception as e:
+                        print(f"❌ {category} 数据提取失败: {e}")
+                        results[category] = CategoryResult(category, _title(category), fetch_seconds=fetch_seconds,
+                                                           error=f"数据提取失败: {e}")
+                        continue
+                    print(f"📥 {processor.title} 提取完成: {len(processor.raw_data)} 条 ({fetch_seconds:.1f}s)")
+                    processing[processes.submit(process_category, processor)] = (category, fetch_seconds)
+                else:
+                    category, fetch_seconds = processing.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = CategoryResult(category, _title(category), error=f"处理进程异常: {e}")
+                    result.fetch_seconds = fetch_seconds
+                    results[category] = result
+                    status = "✅" if result.success else "❌"
+                    print(f"{status} {result.title} 处理完成 ({result.process_seconds:.1f}s)")
+                    if show_logs and result.log:
+                        print("\n" + "#"*70)
+                        print(f"📂 {result.title} 处理日志")
+                        print("#"*70)
+                        print(result.log.rstrip())
+
+    print_summary([results[category] for category in categories if category in results],
+                  time.perf_counter() - started)
+    return results
+
+
+def print_summary(results: List[CategoryResult], elapsed: float):
+    """输出汇总信息"""
+    print("\n" + "="*70)
+    print("📊 处理汇总")
+    print("="*70)
+    print(f"{'类别':<16}{'原始':>8}{'术语':>8}{'层级':>8}{'提取(s)':>10}{'处理(s)':>10}")
+    for result in results:
+        hierarchy = '-' if result.valid is None else ('通过' if result.valid else '有问题')
+        print(f"{result.title:<16}{result.raw_count:>8}{result.term_count:>8}{hierarchy:>8}"
+              f"{result.fetch_seconds:>10.1f}{result.process_seconds:>10.1f}")
+
+    serial = sum(result.fetch_seconds + result.process_seconds for result in results)
+    print(f"\n总耗时: {elapsed:.1f}s (各类别耗时之和 {serial:.1f}s)")
+
+    failed = [result for result in results if not result.success]
+    for result in failed:
+        print(f"❌ {result.title}: {result.error}")
+
+    print(f"\n输出文件:")
+    for result in results:
+        if result.success:
+            print(f"  {result.title}:")
+            print(f"    - 数据文件: {result.output_file}")
+            print(f"    - 映射指南: {result.mapping_guide_file}")
+            print(f"    - 映射指南(HTML): {result.mapping_guide_html}")
+
+    print("\n" + "="*70)
+    print(("✅ 处理完成!" if not failed else f"⚠️ 处理完成，{len(failed)} 个类别失败").center(70))
+    print("="*70)
+    print(f"结束时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description='TCM GB/T 层级术语并发处理(临时ID版本)')
+    parser.add_argument('categories', nargs='*',
+                        help=f"要处理的类别: {', '.join(CATEGORY_CONFIGS)} (默认: 全部)")
+    parser.add_argument('--output-dir', type=Path, default=OUTPUT_DIR,
+                        help=f'输出目录 (默认: {OUTPUT_DIR})')
+    parser.add_argument('--workers', type=int, help='处理进程数 (默认: 类别数与CPU核数中的较小值)')
+    parser.add_argument('--quiet', action='store_true', help='不输出各类别的处理日志，只输出汇总')
+    args = parser.parse_args()
+
+    unknown = [category for category in args.categories if category not in CATEGORY_CONFIGS]
+    if unknown:
+        parser.error(f"不支持的类别: {', '.join(unknown)}")
+
+    results = run_parallel(args.categories or None, output_dir=args.output_dir,
+                           workers=args.workers, show_logs=not args.quiet)
+    if not all(result.success for result in results.values()):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
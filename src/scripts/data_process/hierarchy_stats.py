@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+术语层级统计工具
+供各数据处理脚本共用，也可直接统计已生成的临时ID文件(含多源数据文件)
+
+主要功能:
+1. 建立父级索引，一次遍历并记忆化计算全部节点的层级深度(无递归、无重复过滤)
+2. 层级深度分布、子节点数(fan-out)分布、叶节点数
+3. 每个顶级类别的子树规模
+
+用法:
+    python hierarchy_stats.py ../../../data/data_temp_ids/disease_data_temp_ids.csv
+    python hierarchy_stats.py ../../../data/data_temp_ids/*.csv --json stats.json
+    python hierarchy_stats.py ../../../data/data_temp_ids/pattern_data_temp_ids.csv --root-id TmpTCH:PATTERN_10000
+
+创建时间: 2026.10.18
+"""
+
+import argparse
+import json
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+# 计算中的深度标记(用于发现循环引用)
+_IN_PROGRESS = -1
+
+# 打印子节点数分布时的分组 (下限, 上限)
+FAN_OUT_BUCKETS = [(1, 1), (2, 5), (6, 10), (11, 20), (21, 50), (51, float('inf'))]
+
+
+@dataclass
+class HierarchyStats:
+    """层级统计结果"""
+    total: int = 0
+    max_depth: int = 0
+    leaf_count: int = 0
+    depth_histogram: Dict[int, int] = field(default_factory=dict)   # 深度 -> 节点数
+    fan_out: Dict[int, int] = field(default_factory=dict)           # 子节点数 -> 节点数(仅非叶节点)
+    top_level: List[Tuple[str, str, int]] = field(default_factory=list)  # (ID, 中文术语, 子树规模)，按规模降序
+    root_count: int = 0
+    orphan_count: int = 0  # 父级不存在的节点(如占位父级)，不计为根节点
+    cyclic_count: int = 0  # 处于循环引用中或挂在循环上的节点(不计入深度统计)
+
+
+def compute_hierarchy_stats(df: pd.DataFrame, id_column: str = 'tch_id', parent_column: str = 'parents',
+                            label_column: str = 'label_zh', root_id: Optional[str] = None) -> HierarchyStats:
+    """
+    计算层级统计
+
+    根节点为父级为空的节点。指定 root_id 或只有一个根节点(如 ROOT 类别)时，顶级类别为该根节点的
+    直接子节点；否则为各根节点。父级不存在的节点(占位父级)不算根节点，只计入 orphan_count，
+    深度按缺失的父级占一层计算(与原逐条向上查找的结果一致)。
+
+    Args:
+        df: 术语数据
+        id_column: ID列名
+        parent_column: 父级列名，不存在时所有术语视为顶层
+        label_column: 中文术语列名
+        root_id: ROOT 节点的ID，None 时自动判断
+
+    Returns:
+        HierarchyStats
+    """
+    ids = df[id_column].tolist()
+    raw_parents = df[parent_column].tolist() if parent_column in df.columns else [None] * len(ids)
+    labels = df[label_column].tolist() if label_column in df.columns else [''] * len(ids)
+
+    # 父级索引: ID -> 父级ID(父级为空、不存在或为自身时为 None)
+    id_set = set(ids)
+    parent_of: Dict[str, Optional[str]] = {}
+    label_of: Dict[str, str] = {}
+    orphans = set()
+    for node_id, parent_id, label in zip(ids, raw_parents, labels):
+        if node_id in parent_of:
+            continue
+        if not isinstance(parent_id, str) or not parent_id or parent_id == node_id:
+            parent_id = None
+        elif parent_id not in id_set:
+            orphans.add(node_id)
+            parent_id = None
+        parent_of[node_id] = parent_id
+        label_of[node_id] = label if isinstance(label, str) else ''
+
+    # 记忆化深度: 沿父级链向上走到已知深度的节点，再沿原路回填
+    depth: Dict[str, Optional[int]] = {}
+    for start in parent_of:
+        if start in depth:
+            continue
+        path = []
+        node = start
+        while node is not None and node not in depth:
+            depth[node] = _IN_PROGRESS
+            path.append(node)
+            node = parent_of[node]
+        if node is not None and (depth[node] is None or depth[node] == _IN_PROGRESS):
+            for node in path:
+                depth[node] = None
+        else:
+            if node is not None:
+                base = depth[node]
+            else:
+                base = 0 if path[-1] in orphans else -1
+            for node in reversed(path):
+                base += 1
+                depth[node] = base
+
+    valid = [node for node, d in depth.items() if d is not None]
+    children = Counter(parent_of[node] for node in valid if parent_of[node] is not None)
+
+    # 子树规模: 按深度从深到浅累加到父级
+    by_depth: Dict[int, List[str]] = {}
+    for node in valid:
+        by_depth.setdefault(depth[node], []).append(node)
+    size = dict.fromkeys(valid, 1)
+    for level in sorted(by_depth, reverse=True):
+        for node in by_depth[level]:
+            parent_id = parent_of[node]
+            if parent_id is not None:
+                size[parent_id] += size[node]
+
+    roots = by_depth.get(0, [])
+    if root_id is None and len(roots) == 1:
+        root_id = roots[0]
+    if root_id is not None:
+        top_level = [node for node in valid if parent_of[node] == root_id]
+    else:
+        top_level = roots
+
+    return HierarchyStats(
+        total=len(parent_of),
+        max_depth=max(by_depth) if by_depth else 0,
+        leaf_count=sum(1 for node in valid if node not in children),
+        depth_histogram={level: len(by_depth[level]) for level in sorted(by_depth)},
+        fan_out=dict(sorted(Counter(children.values()).items())),
+        top_level=sorted(((node, label_of[node], size[node]) for node in top_level), key=lambda t: -t[2]),
+        root_count=len(roots),
+        orphan_count=len(orphans),
+        cyclic_count=len(parent_of) - len(valid),
+    )
+
+
+def format_hierarchy_stats(stats: HierarchyStats, top: int = 10) -> List[str]:
+    """格式化为打印用的文本行"""
+    lines = [
+        f"  - 顶级类别数: {len(stats.top_level)}",
+        f"  - 最大层级深度: {stats.max_depth}",
+        f"  - 叶节点数: {stats.leaf_count} ({stats.leaf_count / stats.total * 100:.1f}%)" if stats.total
+        else "  - 叶节点数: 0",
+    ]
+    if stats.orphan_count:
+        lines.append(f"  - 父级不存在的节点: {stats.orphan_count}")
+    if stats.cyclic_count:
+        lines.append(f"  - 循环引用中的节点: {stats.cyclic_count} (未计入深度统计)")
+
+    lines.append("  - 层级深度分布:")
+    for level, count in stats.depth_histogram.items():
+        lines.append(f"      深度 {level}: {count}")
+
+    if stats.fan_out:
+        parents = sum(stats.fan_out.values())
+        child_total = sum(k * v for k, v in stats.fan_out.items())
+        lines.append(f"  - 子节点数分布 (非叶节点 {parents} 个, 平均 {child_total / parents:.1f}, "
+                     f"最多 {max(stats.fan_out)}):")
+        for low, high in FAN_OUT_BUCKETS:
+            count = sum(v for k, v in stats.fan_out.items() if low <= k <= high)
+            if count:
+                label = str(low) if low == high else (f"{low}+" if high == float('inf') else f"{low}-{high}")
+                lines.append(f"      {label} 个子节点: {count}")
+
+    if stats.top_level:
+        shown = stats.top_level[:top]
+        lines.append(f"  - 顶级类别子树规模 (前 {len(shown)} 个):")
+        for node_id, label, size in shown:
+            lines.append(f"      {node_id} {label}: {size}")
+    return lines
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description='术语层级统计')
+    parser.add_argument('files', nargs='+', help='临时ID数据文件(CSV)')
+    parser.add_argument('--id-column', default='tch_id', help='ID列名 (默认: tch_id)')
+    parser.add_argument('--parent-column', default='parents', help='父级列名 (默认: parents)')
+    parser.add_argument('--label-column', default='label_zh', help='中文术语列名 (默认: label_zh)')
+    parser.add_argument('--root-id', help='ROOT 节点的ID，顶级类别为其直接子节点 (默认: 只有一个根节点时自动判断)')
+    parser.add_argument('--top', type=int, default=10, help='显示规模最大的前 N 个顶级类别 (默认: 10)')
+    parser.add_argument('--json', help='同时将统计结果写入 JSON 文件')
+    args = parser.parse_args()
+
+    results = {}
+    for file_path in args.files:
+        df = pd.read_csv(file_path, dtype=str, keep_default_na=False, encoding='utf-8')
+        stats = compute_hierarchy_stats(df, args.id_column, args.parent_column, args.label_column, args.root_id)
+        results[Path(file_path).name] = asdict(stats)
+
+        print("\n" + "="*70)
+        print(f"📊 {file_path}")
+        print("="*70)
+        print(f"总术语数: {stats.total}")
+        if args.parent_column not in df.columns:
+            print(f"  - 无 {args.parent_column} 列，所有术语视为顶层")
+        for line in format_hierarchy_stats(stats, args.top):
+            print(line)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n✅ 统计结果已保存: {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+术语层级关系校验工具
+供各数据处理脚本共用(疾病、证候、治法、治则等)
+
+主要功能:
+1. 一次性建立 ID -> 父级 映射
+2. 单次迭代遍历找出: 重复ID、自身为父级、孤儿节点(父级不存在)、循环引用(含完整路径)
+3. 时间复杂度 O(节点数 + 父子关系数)，无递归，百万级节点可在数秒内完成
+
+用法:
+    from hierarchy_utils import check_hierarchy
+    report = check_hierarchy(processor.processed_data)
+    if not report.ok:
+        for message in report.messages():
+            print(message)
+
+创建时间: 2026.10.18
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass
+class HierarchyReport:
+    """层级校验结果"""
+    duplicates: List[str] = field(default_factory=list)         # 重复出现的ID
+    self_parents: List[str] = field(default_factory=list)       # 父级为自身的ID
+    orphans: List[Tuple[str, str]] = field(default_factory=list)  # (ID, 不存在的父级ID)
+    cycles: List[List[str]] = field(default_factory=list)       # 循环路径，首尾为同一ID
+    labels: Dict[str, str] = field(default_factory=dict)        # ID -> 中文术语，用于输出
+
+    @property
+    def ok(self) -> bool:
+        return not (self.duplicates or self.self_parents or self.orphans or self.cycles)
+
+    def _name(self, node_id: str) -> str:
+        label = self.labels.get(node_id)
+        return f"{node_id} ({label})" if label else node_id
+
+    def messages(self) -> List[str]:
+        """按问题类型生成说明文字"""
+        messages = [f"重复ID: {self._name(node_id)}" for node_id in self.duplicates]
+        messages += [f"自身为父级: {self._name(node_id)}" for node_id in self.self_parents]
+        messages += [f"孤儿节点: {self._name(node_id)} 的父级 {parent_id} 不存在"
+                     for node_id, parent_id in self.orphans]
+        messages += [f"循环引用: {' → '.join(cycle)}" for cycle in self.cycles]
+        return messages
+
+
+def _find_cycles_single(parents_of: Dict[str, Tuple[str, ...]], cycles: List[List[str]]):
+    """单父级: 从每个未访问节点沿父级链向上走，遇到本次路径上的节点即为环"""
+    walk_of: Dict[str, int] = {}  # 节点 -> 首次经过它的路径编号
+    for walk, start in enumerate(parents_of):
+        if start in walk_of:
+            continue
+        path = []
+        node = start
+        while node is not None and node not in walk_of:
+            walk_of[node] = walk
+            path.append(node)
+            parents = parents_of[node]
+            node = parents[0] if parents and parents[0] in parents_of else None
+        if node is not None and walk_of[node] == walk:
+            cycles.append(path[path.index(node):] + [node])
+
+
+def _find_cycles_multi(parents_of: Dict[str, Tuple[str, ...]], cycles: List[List[str]]):
+    """多父级: 沿父级方向迭代深度优先遍历（state 1 = 在当前路径上, 2 = 已完成）"""
+    state: Dict[str, int] = {}
+    for start in parents_of:
+        if start in state:
+            continue
+        state[start] = 1
+        path = [start]
+        position = {start: 0}
+        stack = [iter(parents_of[start])]
+        while stack:
+            for parent_id in stack[-1]:
+                if parent_id not in parents_of:
+                    continue
+                parent_state = state.get(parent_id)
+                if parent_state is None:
+                    state[parent_id] = 1
+                    position[parent_id] = len(path)
+                    path.append(parent_id)
+                    stack.append(iter(parents_of[parent_id]))
+                    break
+                if parent_state == 1:
+                    cycles.append(path[position[parent_id]:] + [parent_id])
+            else:
+                node_id = path.pop()
+                del position[node_id]
+                state[node_id] = 2
+                stack.pop()
+
+
+def check_hierarchy(items: Iterable[Dict], id_key: str = 'tch_id', parent_key: str = 'parents',
+                    label_key: Optional[str] = 'label_zh', separator: Optional[str] = None) -> HierarchyReport:
+    """
+    校验层级关系
+
+    Args:
+        items: 术语记录(如 processed_data)
+        id_key: ID字段名
+        parent_key: 父级字段名，空值表示顶层节点
+        label_key: 中文术语字段名(仅用于输出)，None 表示不记录
+        separator: 多个父级的分隔符，None 表示每个节点只有一个父级
+
+    Returns:
+        HierarchyReport
+    """
+    report = HierarchyReport()
+    parents_of: Dict[str, Tuple[str, ...]] = {}
+
+    # 1. 建立 ID -> 父级 映射，同时检查重复ID和自身为父级
+    for item in items:
+        node_id = item[id_key]
+        raw = item.get(parent_key) or ''
+        if separator is None:
+            parents = (raw,) if raw else ()
+        else:
+            parents = tuple(p.strip() for p in raw.split(separator) if p.strip())
+
+        if node_id in parents_of:
+            report.duplicates.append(node_id)
+            continue
+        if node_id in parents:
+            report.self_parents.append(node_id)
+            parents = tuple(p for p in parents if p != node_id)
+        parents_of[node_id] = parents
+        if label_key:
+            report.labels[node_id] = item.get(label_key) or ''
+
+    # 2. 孤儿节点
+    for node_id, parents in parents_of.items():
+        for parent_id in parents:
+            if parent_id not in parents_of:
+                report.orphans.append((node_id, parent_id))
+
+    # 3. 循环引用，每个节点只访问一次
+    if separator is None:
+        _find_cycles_single(parents_of, report.cycles)
+    else:
+        _find_cycles_multi(parents_of, report.cycles)
+
+    return report
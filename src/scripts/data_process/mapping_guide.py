@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+临时ID映射指南生成工具
+供各数据处理脚本共用(疾病、证候、治法、治则等)
+
+主要功能:
+1. 预先建立 临时ID -> 术语、code -> 父级临时ID、父级 -> 子级 索引，生成时不再逐条扫描 processed_data
+2. Markdown 指南按章节流式写入磁盘(先写临时文件再原子替换)，不在内存中拼接整篇文档
+3. 分页 HTML 版本: 按顶级类别建立目录页，每个类别按固定行数分页，父级链接到所在页
+
+用法:
+    index = MappingGuideIndex(processor.processed_data, processor.code_to_temp_id,
+                              processor.get_parent_code, root_label='疾病(根类别)')
+    write_markdown_guide(MAPPING_GUIDE_FILE, [header, index.markdown_rows(), examples, footer])
+    write_html_guide(MAPPING_GUIDE_HTML_DIR, 'Disease临时ID映射指南', index)
+
+创建时间: 2026.10.18
+"""
+
+import html
+import os
+import shutil
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+# HTML 版本每页行数
+DEFAULT_PAGE_SIZE = 500
+
+
+class GuideRow(NamedTuple):
+    """映射关系表中的一行"""
+    code: str
+    temp_id: str
+    label_zh: str
+    parent_temp_id: str
+
+
+class MappingGuideIndex:
+    """映射指南所需的索引(一次建立，按 code 排序)"""
+
+    def __init__(self, processed_data: List[Dict], code_to_temp_id: Dict[str, str],
+                 get_parent_code: Callable[[str], Optional[str]], root_label: str):
+        """
+        Args:
+            processed_data: 处理后的术语记录
+            code_to_temp_id: code -> 临时ID
+            get_parent_code: code -> 父级code(顶层为 ROOT，ROOT 为 None)
+            root_label: ROOT 节点在指南中显示的名称
+        """
+        label_by_id = {item['tch_id']: item['label_zh'] for item in processed_data}
+
+        self.rows: List[GuideRow] = []
+        self.by_code: Dict[str, GuideRow] = {}
+        self.children: Dict[str, List[str]] = {}  # 父级临时ID -> 子级临时ID列表
+        for code in sorted(code_to_temp_id):
+            temp_id = code_to_temp_id[code]
+            parent_code = get_parent_code(code) if code != 'ROOT' else None
+            parent_temp_id = code_to_temp_id.get(parent_code, '') if parent_code else ''
+            label_zh = root_label if code == 'ROOT' else label_by_id.get(temp_id, '')
+            row = GuideRow(code, temp_id, label_zh, parent_temp_id)
+            self.rows.append(row)
+            self.by_code[code] = row
+            if parent_temp_id:
+                self.children.setdefault(parent_temp_id, []).append(temp_id)
+
+    def markdown_rows(self) -> Iterator[str]:
+        """映射关系表的 Markdown 行(逐行生成)"""
+        for row in self.rows:
+            yield f"| {row.temp_id} | {row.code} | {row.label_zh} | {row.parent_temp_id} |\n"
+
+    def examples(self, example_codes: Iterable[str]) -> str:
+        """层级结构示例(不存在的 code 跳过)"""
+        text = ''
+        for code in example_codes:
+            row = self.by_code.get(code)
+            if row is None:
+                continue
+            text += f"- **{code}** → {row.temp_id} ({row.label_zh})\n"
+            if row.parent_temp_id:
+                text += f"  - 父级: {row.parent_temp_id}\n"
+        return text
+
+    def categories(self) -> Dict[str, List[GuideRow]]:
+        """按顶级 code(第一段)分组，保持 code 顺序"""
+        groups: Dict[str, List[GuideRow]] = {}
+        for row in self.rows:
+            groups.setdefault(row.code.split('.')[0], []).append(row)
+        return groups
+
+
+def write_markdown_guide(path, sections: Iterable[Union[str, Iterable[str]]]):
+    """
+    按章节流式写出 Markdown 指南
+
+    Args:
+        path: 输出文件
+        sections: 各章节，字符串直接写入，可迭代对象(如 markdown_rows())逐条写入
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for section in sections:
+                if isinstance(section, str):
+                    f.write(section)
+                else:
+                    f.writelines(section)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; }}
+th, td {{ border: 1px solid #ccc; padding: 4px 8px; text-align: left; }}
+th {{ background: #f4f4f4; }}
+tr:target {{ background: #fff3c4; }}
+nav {{ margin: 1em 0; }}
+</style>
+</head>
+<body>
+"""
+
+_HTML_TAIL = "</body>\n</html>\n"
+
+
+def _page_name(category: str, page: int) -> str:
+    safe = ''.join(ch if ch.isalnum() else '_' for ch in category)
+    return f"category_{safe}_{page:03d}.html"
+
+
+def write_html_guide(directory, title: str, index: MappingGuideIndex, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+    """
+    写出分页 HTML 指南
+
+    directory/index.html 为按顶级类别的目录；每个类别按 page_size 行分页，
+    父级临时ID链接到父级所在页的对应行。目录重新生成前清空旧页面。
+
+    Returns:
+        写出的页面数(不含目录页)
+    """
+    directory = Path(directory)
+    if directory.exists():
+        shutil.rmtree(directory)
+    directory.mkdir(parents=True)
+
+    # 先确定每个临时ID所在页面，父级链接才能指向正确的页
+    groups = index.categories()
+    pages = []  # (类别, 文件名, 行)
+    page_names: Dict[str, List[str]] = {}  # 类别 -> 各页文件名
+    page_of: Dict[str, str] = {}
+    for category, rows in groups.items():
+        for start in range(0, len(rows), page_size):
+            page_rows = rows[start:start + page_size]
+            name = _page_name(category, start // page_size + 1)
+            pages.append((category, name, page_rows))
+            page_names.setdefault(category, []).append(name)
+            for row in page_rows:
+                page_of[row.temp_id] = name
+
+    escape = html.escape
+    with open(directory / 'index.html', 'w', encoding='utf-8') as f:
+        f.write(_HTML_HEAD.format(title=escape(title)))
+        f.write(f"<h1>{escape(title)}</h1>\n<p>总术语数: {len(index.rows)}</p>\n")
+        f.write("<table>\n<tr><th>顶级Code</th><th>中文术语</th><th>术语数</th><th>页面</th></tr>\n")
+        for category, rows in groups.items():
+            top = index.by_code.get(category)
+            links = ' '.join(f'<a href="{name}">{number}</a>'
+                             for number, name in enumerate(page_names[category], start=1))
+            f.write(f"<tr><td>{escape(category)}</td><td>{escape(top.label_zh if top else '')}</td>"
+                    f"<td>{len(rows)}</td><td>{links}</td></tr>\n")
+        f.write("</table>\n")
+        f.write(_HTML_TAIL)
+
+    for category, name, rows in pages:
+        with open(directory / name, 'w', encoding='utf-8') as f:
+            f.write(_HTML_HEAD.format(title=escape(f"{title} - {category}")))
+            f.write(f'<nav><a href="index.html">目录</a> / 顶级Code {escape(category)}</nav>\n')
+            f.write("<table>\n<tr><th>临时ID</th><th>原始Code</th><th>中文术语</th>"
+                    "<th>父级临时ID</th><th>子级数</th></tr>\n")
+            for row in rows:
+                parent = escape(row.parent_temp_id)
+                if row.parent_temp_id in page_of:
+                    parent = f'<a href="{page_of[row.parent_temp_id]}#{parent}">{parent}</a>'
+                f.write(f'<tr id="{escape(row.temp_id)}"><td>{escape(row.temp_id)}</td><td>{escape(row.code)}</td>'
+                        f"<td>{escape(row.label_zh)}</td><td>{parent}</td>"
+                        f"<td>{len(index.children.get(row.temp_id, ()))}</td></tr>\n")
+            f.write("</table>\n")
+            f.write(_HTML_TAIL)
+
+    return len(pages)
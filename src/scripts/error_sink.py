@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+导入错误流式输出
+Streaming Error Sink for TCH Term Import
+
+功能 / Features:
+- 错误发生时逐条写入 JSONL 或 CSV 文件，内存中只保留计数和少量样例
+- 首条错误写入时才创建文件，没有错误时不产生空文件
+
+用法 / Usage:
+    from error_sink import ErrorSink
+    sink = ErrorSink('term_import_errors_pattern.jsonl')
+    sink.write(term_id='TCH_0001001', message='必填字段缺失', row=3, field='label_zh', rule='required')
+    sink.close()
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Optional
+
+# 错误记录的字段（CSV 表头顺序）；source 为出错的数据文件
+ERROR_FIELDS = ['source', 'row', 'tch_id', 'field', 'rule', 'value', 'message']
+
+
+def _plain(value: Any) -> Any:
+    """将 pandas/numpy 标量及缺失值转换为可 JSON 序列化的值"""
+    if value is None:
+        return None
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+class ErrorSink:
+    """逐条写出导入错误的文件输出"""
+
+    def __init__(self, path, fmt: str = 'jsonl'):
+        """
+        Args:
+            path: 输出文件路径
+            fmt: jsonl 或 csv
+        """
+        if fmt not in ('jsonl', 'csv'):
+            raise ValueError(f"不支持的错误输出格式: {fmt}")
+        self.path = Path(path)
+        self.fmt = fmt
+        self.source = None  # 当前处理的数据文件，写入每条记录
+        self.count = 0
+        self._file = None
+        self._writer = None
+
+    def write(self, tch_id: Any, message: str, row: Optional[int] = None, field: Optional[str] = None,
+              rule: Optional[str] = None, value: Any = None):
+        """写入一条错误"""
+        record = {
+            'source': self.source,
+            'row': _plain(row),
+            'tch_id': _plain(tch_id),
+            'field': field,
+            'rule': rule,
+            'value': _plain(value),
+            'message': message,
+        }
+        if self._file is None:
+            self._open()
+        if self.fmt == 'csv':
+            self._writer.writerow(record)
+        else:
+            self._file.write(json.dumps(record, ensure_ascii=False))
+            self._file.write('\n')
+        self.count += 1
+
+    def _open(self):
+        self._file = open(self.path, 'w', encoding='utf-8', newline='')
+        if self.fmt == 'csv':
+            self._writer = csv.DictWriter(self._file, fieldnames=ERROR_FIELDS)
+            self._writer.writeheader()
+
+    def close(self):
+        """关闭文件（可重复调用）"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
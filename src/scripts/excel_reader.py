@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Excel 术语文件流式读取
+Streaming Excel Reader for TCH Term Import
+
+功能 / Features:
+- 使用 openpyxl 只读模式逐行读取 .xlsx/.xlsm，不把整个工作簿（含格式）载入内存
+- 按指定行数分批返回 DataFrame，与 CSV 分块读取进入同一验证和建类流程
+- 工作表选择：名称或从 0 开始的序号，默认第一个工作表
+- 表头检测：在前几行中取与期望列名匹配最多的一行作为表头，表头上方的标题、说明行自动跳过
+- 只保留需要的列（列裁剪）
+
+用法 / Usage:
+    from excel_reader import iter_excel_batches
+    for batch in iter_excel_batches('pattern_terms.xlsx', sheet='证候', batch_size=5000,
+                                    columns=['tch_id', 'label_zh', 'parents']):
+        ...
+"""
+
+from typing import Any, Iterator, List, Optional, Sequence, Union
+
+import pandas as pd
+
+# 可用 openpyxl 流式读取的文件后缀（.xls 仍由 pandas/xlrd 读取）
+EXCEL_STREAM_SUFFIXES = ('.xlsx', '.xlsm')
+
+# 默认在前多少行中查找表头
+DEFAULT_HEADER_SCAN_ROWS = 20
+
+
+def _cell_name(value: Any) -> Optional[str]:
+    """表头单元格转换为列名，空单元格为 None"""
+    if value is None:
+        return None
+    name = str(value).strip()
+    return name or None
+
+
+def _select_sheet(workbook, sheet: Union[str, int, None]):
+    """按名称或序号选择工作表，None 或空字符串为第一个工作表"""
+    if sheet is None or sheet == '':
+        return workbook.worksheets[0]
+    if isinstance(sheet, int) or (isinstance(sheet, str) and sheet.isdigit() and sheet not in workbook.sheetnames):
+        index = int(sheet)
+        if index >= len(workbook.worksheets):
+            raise ValueError(f"工作表序号超出范围: {index}（共 {len(workbook.worksheets)} 个工作表）")
+        return workbook.worksheets[index]
+    if sheet not in workbook.sheetnames:
+        raise ValueError(f"工作表不存在: {sheet}（可选: {', '.join(workbook.sheetnames)}）")
+    return workbook[sheet]
+
+
+def detect_header(rows: Sequence[tuple], expected: Sequence[str]) -> int:
+    """
+    在候选行中检测表头行
+
+    取与期望列名重合最多的一行（重合数相同时取靠前的一行）；
+    都不重合时取第一个非空行
+
+    Returns:
+        表头行在 rows 中的下标
+    """
+    expected = set(expected)
+    best, best_score = None, 0
+    first_non_empty = None
+    for index, row in enumerate(rows):
+        names = {_cell_name(value) for value in row} - {None}
+        if not names:
+            continue
+        if first_non_empty is None:
+            first_non_empty = index
+        score = len(names & expected)
+        if score > best_score:
+            best, best_score = index, score
+    if best is not None:
+        return best
+    if first_non_empty is None:
+        raise ValueError("工作表中没有表头行")
+    return first_non_empty
+
+
+def iter_excel_batches(path, sheet: Union[str, int, None] = None, batch_size: Optional[int] = None,
+                       columns: Optional[List[str]] = None, expected: Optional[Sequence[str]] = None,
+                       header_scan_rows: int = DEFAULT_HEADER_SCAN_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    流式读取 Excel 工作表，按行分批返回
+
+    Args:
+        path: .xlsx/.xlsm 文件路径
+        sheet: 工作表名称或序号，None 为第一个工作表
+        batch_size: 每批行数，None 或 0 时整张表作为一批
+        columns: 只保留这些列（文件中不存在的列忽略），None 时保留所有有表头的列
+        expected: 用于检测表头的期望列名，默认使用 columns，两者都为空时按 tch_id 检测
+        header_scan_rows: 在前多少行中查找表头
+
+    Yields:
+        各批数据（未清洗，单元格为 openpyxl 读出的原始值）
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = _select_sheet(workbook, sheet)
+        # 部分工具写出的 dimension 记录不准确，忽略后按实际单元格读取
+        worksheet.reset_dimensions()
+        rows = worksheet.iter_rows(values_only=True)
+
+        scanned = []
+        for row in rows:
+            scanned.append(row)
+            if len(scanned) >= header_scan_rows:
+                break
+        if not scanned:
+            return
+        header_index = detect_header(scanned, expected or columns or ['tch_id'])
+        header = [_cell_name(value) for value in scanned[header_index]]
+
+        # 需要读取的列：(列下标, 列名)，同名列只取第一个
+        selected = []
+        seen = set()
+        for index, name in enumerate(header):
+            if name is None or name in seen or (columns is not None and name not in columns):
+                continue
+            seen.add(name)
+            selected.append((index, name))
+        names = [name for _, name in selected]
+
+        def project(row: tuple) -> list:
+            return [row[index] if index < len(row) else None for index, _ in selected]
+
+        batch = [project(row) for row in scanned[header_index + 1:]]
+        for row in rows:
+            batch.append(project(row))
+            if batch_size and len(batch) >= batch_size:
+                yield pd.DataFrame(batch, columns=names, dtype=object)
+                batch = []
+        if batch or not batch_size:
+            yield pd.DataFrame(batch, columns=names, dtype=object)
+    finally:
+        workbook.close()
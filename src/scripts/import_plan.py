@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+术语导入字段计划
+Compiled Field Plan for TCH Term Import
+
+功能 / Features:
+- 将 term-import-config.yaml 按类别编译为不可变的导入计划（CategoryPlan）
+- 预编译 ID 正则、ID 范围、必填字段列表和基类 IRI
+- 每个字段绑定解析函数，逐单元格解析时不再查询配置字典
+- 编译结果按配置内容哈希缓存到磁盘（pickle）
+
+用法 / Usage:
+    from import_plan import load_plans
+    plans = load_plans(config, 'tmp/term-import-plan.pickle')
+    plan = plans['pattern']
+    for spec in plan.fields:
+        value = spec.parse(row[spec.name])
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Pattern, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 缓存格式版本，CategoryPlan / FieldSpec 结构变化时递增
+PLAN_CACHE_VERSION = 1
+
+
+def _parse_string(value: str, prefix: str) -> str:
+    """字符串：按需添加前缀"""
+    if prefix and not value.startswith(prefix):
+        return f"{prefix}{value}"
+    return value
+
+
+def _parse_string_list(value: str, separator: str) -> Optional[list]:
+    """字符串列表：按分隔符拆分并去除空项"""
+    values = [v.strip() for v in value.split(separator) if v.strip()]
+    return values if values else None
+
+
+def _parse_id_list(value: str, separator: str, prefix: str) -> Optional[list]:
+    """ID列表：按分隔符拆分，非 TCH 前缀时为缺少前缀的ID补齐前缀"""
+    ids = [v.strip() for v in value.split(separator) if v.strip()]
+    if prefix and not prefix.startswith('TCH'):
+        ids = [f"{prefix}{id_val}" if not id_val.startswith(prefix) else id_val for id_val in ids]
+    return ids if ids else None
+
+
+def _parse_date(value: str, date_format: str) -> str:
+    """日期：统一为 YYYY-MM-DD，解析失败时保留原值"""
+    try:
+        return datetime.strptime(value, date_format).strftime('%Y-%m-%d')
+    except ValueError:
+        logger.warning(f"日期格式解析失败: {value}")
+        return value
+
+
+def _parse_id(value: str) -> str:
+    """ID：原样返回"""
+    return value
+
+
+def field_parser(field_config: Dict) -> Callable[[str], Any]:
+    """
+    根据字段配置返回解析函数
+
+    解析函数接收去除首尾空格后的非空字符串；返回值均为模块级函数的 partial，可以 pickle
+    """
+    field_type = field_config.get('type', 'string')
+    if field_type == 'string_list':
+        return partial(_parse_string_list, separator=field_config.get('separator', '|'))
+    if field_type == 'id_list':
+        return partial(_parse_id_list, separator=field_config.get('separator', '|'),
+                       prefix=field_config.get('prefix', ''))
+    if field_type == 'date':
+        return partial(_parse_date, date_format=field_config.get('format', '%Y-%m-%d'))
+    if field_type == 'id':
+        return _parse_id
+    return partial(_parse_string, prefix=field_config.get('prefix', ''))
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """单个字段的编译结果"""
+    name: str
+    property: str
+    type: str
+    lang: Optional[str]
+    required: bool
+    common: bool  # 是否为 common_fields 中的通用字段
+    target_class: Optional[str]
+    parser: Callable[[str], Any]
+
+    def parse(self, raw: Any) -> Any:
+        """解析单元格原始值，空值返回 None"""
+        if pd.isna(raw):
+            return None
+        value = str(raw).strip()
+        if not value:
+            return None
+        return self.parser(value)
+
+
+@dataclass(frozen=True)
+class CategoryPlan:
+    """单个类别的导入计划"""
+    category: str
+    base_class_iri: str
+    id_pattern: Pattern
+    id_error_message: str
+    id_range: Optional[Tuple[int, int]]  # 未配置或未开启范围检查时为 None
+    id_range_text: str
+    fields: Tuple[FieldSpec, ...]  # 通用字段在前，类别特定字段在后
+    required: Tuple[FieldSpec, ...]
+
+
+def compile_plan(config: Dict, category: str) -> CategoryPlan:
+    """将配置编译为单个类别的导入计划"""
+    rules = config['validation_rules']
+    category_config = config['category_specific_fields'].get(category, {})
+
+    fields = []
+    for common, field_items in ((True, config['common_fields'].items()), (False, category_config.items())):
+        for field_name, field_config in field_items:
+            # 跳过非字段配置（如 base_class, id_range 等元数据）
+            if not isinstance(field_config, dict) or 'property' not in field_config:
+                continue
+            fields.append(FieldSpec(
+                name=field_name,
+                property=field_config['property'],
+                type=field_config.get('type', 'string'),
+                lang=field_config.get('lang'),
+                required=field_config.get('required', False),
+                common=common,
+                target_class=field_config.get('target_class'),
+                parser=field_parser(field_config),
+            ))
+
+    id_range_text = category_config.get('id_range', '')
+    id_range = None
+    if rules['id_range_check'] and id_range_text:
+        start, end = id_range_text.split('-')
+        id_range = (int(start), int(end))
+
+    base_class_id = category_config.get('base_class', 'TCH:0000000')
+    return CategoryPlan(
+        category=category,
+        base_class_iri=base_class_id.replace('TCH:', config['general']['term_prefix']),
+        id_pattern=re.compile(rules['id_format']['pattern']),
+        id_error_message=rules['id_format']['error_message'],
+        id_range=id_range,
+        id_range_text=id_range_text,
+        fields=tuple(fields),
+        required=tuple(spec for spec in fields if spec.required),
+    )
+
+
+def config_hash(config: Dict) -> str:
+    """配置内容哈希（与键顺序无关）"""
+    payload = json.dumps(config, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(f"{PLAN_CACHE_VERSION}:{payload}".encode('utf-8')).hexdigest()
+
+
+def load_plans(config: Dict, cache_path=None) -> Dict[str, CategoryPlan]:
+    """
+    获取所有类别的导入计划
+
+    cache_path 不为 None 时，先读取缓存文件，配置哈希一致则直接使用；
+    否则重新编译并原子写入缓存。
+
+    Args:
+        config: 已加载的导入配置
+        cache_path: 计划缓存文件路径
+
+    Returns:
+        类别 -> CategoryPlan
+    """
+    digest = config_hash(config)
+
+    if cache_path is not None:
+        cache_path = Path(cache_path)
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('config_hash') == digest:
+                logger.info(f"使用导入计划缓存: {cache_path}")
+                return cached['plans']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"导入计划缓存无法读取，重新编译: {e}")
+
+    plans = {category: compile_plan(config, category) for category in config['category_specific_fields']}
+
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'config_hash': digest, 'plans': plans}, f)
+            os.replace(tmp_path, cache_path)
+            logger.info(f"导入计划已编译并缓存: {cache_path}")
+        except OSError as e:
+            logger.warning(f"导入计划缓存写入失败: {e}")
+
+    return plans
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+术语导入分阶段性能记录
+Per-Phase Profiler for TCH Term Import
+
+功能 / Features:
+- 记录每个阶段（配置加载、数据读取、备份、本体加载、逐行处理、保存、报告）的耗时
+- 使用 tracemalloc 记录每个阶段的 Python 内存峰值（支持阶段嵌套）
+- 记录逐行处理耗时并计算 p50 / p99（只统计创建或更新了术语的行，跳过的行单独计数）
+- 未开启时所有方法均为空操作，调用方无需判断
+
+用法 / Usage:
+    profiler = ImportProfiler(enabled=True)
+    with profiler.phase('load_ontology'):
+        ...
+    profiler.write('term_import_profile.json')
+"""
+
+import json
+import time
+import tracemalloc
+from array import array
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional
+
+
+def _percentile(sorted_values, fraction: float) -> Optional[float]:
+    """已排序序列的分位数（最近秩法）"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class ImportProfiler:
+    """分阶段耗时与内存峰值记录器"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.phases = {}  # 阶段名 -> {'calls', 'seconds', 'peak_bytes'}，按首次进入的顺序
+        self.row_latencies = array('d')
+        self.skipped_rows = 0  # 验证失败、已存在或内容未变化而未写入的行
+        self._stack = []  # 进行中的阶段: [阶段名, 开始时间, 已观测到的内存峰值]
+        self._started = time.perf_counter()
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def phase(self, name: str):
+        """记录一个阶段；同名阶段多次进入时累计耗时，峰值取最大"""
+        if not self.enabled:
+            yield
+            return
+
+        # 进入子阶段前先保存外层阶段到目前为止的峰值，再重置峰值
+        if self._stack:
+            self._stack[-1][2] = max(self._stack[-1][2], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        self._stack.append([name, time.perf_counter(), 0])
+        try:
+            yield
+        finally:
+            _, started, peak = self._stack.pop()
+            seconds = time.perf_counter() - started
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+
+            entry = self.phases.setdefault(name, {'calls': 0, 'seconds': 0.0, 'peak_bytes': 0})
+            entry['calls'] += 1
+            entry['seconds'] += seconds
+            entry['peak_bytes'] = max(entry['peak_bytes'], peak)
+
+            if self._stack:
+                self._stack[-1][2] = max(self._stack[-1][2], peak)
+
+    def record_row(self, seconds: float, skipped: bool = False):
+        """记录一行的处理耗时；跳过的行只计数，不计入分位数"""
+        if not self.enabled:
+            return
+        if skipped:
+            self.skipped_rows += 1
+        else:
+            self.row_latencies.append(seconds)
+
+    def summary(self) -> Dict:
+        """汇总为可 JSON 序列化的字典"""
+        latencies = sorted(self.row_latencies)
+        phases = {
+            name: {
+                'calls': entry['calls'],
+                'seconds': round(entry['seconds'], 6),
+                'peak_mb': round(entry['peak_bytes'] / 1024 / 1024, 3),
+            }
+            for name, entry in self.phases.items()
+        }
+        return {
+            'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'total_seconds': round(time.perf_counter() - self._started, 6),
+            'peak_mb': round(max((e['peak_bytes'] for e in self.phases.values()), default=0) / 1024 / 1024, 3),
+            'phases': phases,
+            'rows': {
+                'count': len(latencies),
+                'skipped': self.skipped_rows,
+                'p50_ms': None if not latencies else round(_percentile(latencies, 0.50) * 1000, 3),
+                'p99_ms': None if not latencies else round(_percentile(latencies, 0.99) * 1000, 3),
+                'max_ms': None if not latencies else round(latencies[-1] * 1000, 3),
+            },
+        }
+
+    def write(self, path) -> Optional[str]:
+        """写出 JSON 文件，未开启时不写"""
+        if not self.enabled:
+            return None
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+        return str(path)
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TCH 本体术语导入常驻服务
+Long-Lived Term Import Service for TCH Ontology
+
+功能 / Features:
+- 在本机 HTTP 端口上常驻，配置、导入计划和 tch-edit.owl 只加载一次
+- 接受 validate / plan / import 任务（JSON），返回统计和导入报告
+- 写本体的任务（plan、import）逐个执行，仅验证的任务可并行
+- 配置文件或本体文件被外部修改后，下一个任务开始前自动重新加载
+- 提供 submit 子命令作为客户端（只依赖标准库，启动开销很小）
+
+用法 / Usage:
+    # 启动服务（只监听 127.0.0.1）
+    python import_service.py serve --config term-import-config.yaml --ontology tch-edit.owl
+
+    # 提交任务
+    python import_service.py submit --category pattern --input data/pattern_terms.csv
+    python import_service.py submit --category pattern --input data/pattern_terms.csv --validate-only
+    python import_service.py submit --category pattern --input data/pattern_terms.csv --plan plan.csv
+
+    # 也可以直接用 curl
+    curl -s -X POST http://127.0.0.1:8765/jobs \\
+         -d '{"action": "import", "category": "pattern", "input": "/abs/path/pattern_terms.csv"}'
+
+接口 / API:
+    GET  /status  服务状态（本体路径、类数量、已处理任务数）
+    POST /jobs    {"action": "validate|plan|import", "category": ..., "input": ...,
+                   "output": 计划输出路径（可选，plan）, "upsert": false}
+
+报告、错误文件和计划文件写在服务的工作目录中（与命令行导入相同），文件名包含任务ID（结果中的 job_id）。
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger('import_service')
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+JOB_ACTIONS = ('validate', 'plan', 'import')
+
+
+class JobError(ValueError):
+    """任务参数错误（返回 400）"""
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """文件的 (修改时间, 大小)，用于判断是否被外部修改；文件不存在时为 None"""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ImportService:
+    """持有常驻导入器并执行任务"""
+
+    def __init__(self, config_path: str, ontology_path: str, use_cache: bool = False,
+                 incremental: bool = False):
+        # 导入 import_terms 会加载 pandas / owlready2，只在服务端进行
+        import import_terms
+
+        self._import_terms = import_terms
+        self.config_path = Path(config_path)
+        self.ontology_path = Path(ontology_path)
+        self.use_cache = use_cache
+        self.incremental = incremental
+        self.write_lock = threading.Lock()  # plan / import 任务及重新加载逐个执行
+        self.jobs = 0
+        self._job_seq = 0  # 已接收的任务数，用于生成任务ID
+        self._jobs_lock = threading.Lock()  # 验证任务并发执行，计数和任务ID需加锁
+        self.importer = None
+        self._config_signature = None
+        self._ontology_signature = None
+        self._load(reload_config=True)
+
+    def _load(self, reload_config: bool):
+        """创建常驻导入器并加载本体（reload_config 为 False 时沿用已加载的配置和导入计划）"""
+        previous = self.importer
+        if previous is not None and previous.ontology is not None:
+            self._release_ontology(previous.ontology)
+
+        self._config_signature = _file_signature(self.config_path)
+        importer = self._import_terms.TCHTermImporter(
+            config_path=str(self.config_path),
+            ontology_path=str(self.ontology_path),
+            use_cache=self.use_cache,
+            incremental=self.incremental,
+            config=None if reload_config or previous is None else previous.config
+        )
+        if not self.use_cache:
+            # 每次加载使用独立的内存 World，重新加载时整体丢弃旧的三元组
+            from owlready2 import World
+            importer.world = World()
+        if reload_config or previous is None:
+            # 预先编译全部类别的导入计划，之后并行的验证任务只读使用
+            for category in importer.config['category_specific_fields']:
+                importer._plan(category)
+        else:
+            importer.plans = previous.plans
+
+        importer.load_ontology(backup=False)
+        self._ontology_signature = _file_signature(self.ontology_path)
+        self.importer = importer
+        logger.info(f"导入服务已加载本体: {self.ontology_path} ({len(importer.iri_index)} 个类)")
+
+    @staticmethod
+    def _release_ontology(ontology):
+        """关闭旧本体所在的 World，使重新加载时重新解析文件"""
+        ontology.world.close()
+
+    def _ensure_current(self):
+        """配置或本体文件被外部修改时重新加载（调用方持有 write_lock）"""
+        if _file_signature(self.config_path) != self._config_signature:
+            logger.info(f"配置文件已变化，重新加载: {self.config_path}")
+            self._load(reload_config=True)
+        elif self.importer.ontology is None or _file_signature(self.ontology_path) != self._ontology_signature:
+            logger.info(f"本体文件已变化，重新加载: {self.ontology_path}")
+            self._load(reload_config=False)
+
+    def status(self) -> Dict:
+        """服务状态"""
+        return {
+            'ok': True,
+            'config': str(self.config_path),
+            'ontology': str(self.ontology_path),
+            'classes': len(self.importer.iri_index),
+            'jobs': self.jobs,
+        }
+
+    def run_job(self, job: Dict) -> Dict:
+        """
+        执行一个任务
+
+        Args:
+            job: {"action", "category", "input", "output"(可选), "upsert"(可选)}
+
+        Returns:
+            任务结果：任务ID、统计、报告文本、错误文件、耗时
+        """
+        action = job.get('action', 'import')
+        category = job.get('category')
+        file_path = job.get('input')
+        if action not in JOB_ACTIONS:
+            raise JobError(f"未知的任务类型: {action}（可选: {', '.join(JOB_ACTIONS)}）")
+        if category not in self._import_terms.CATEGORIES:
+            raise JobError(f"未知的术语类别: {category}")
+        if not file_path or not Path(file_path).is_file():
+            raise JobError(f"输入文件不存在: {file_path}")
+
+        # 任务ID写入错误文件、报告等输出文件名，同一秒内的任务互不覆盖
+        with self._jobs_lock:
+            self._job_seq += 1
+            job_id = f"{os.getpid()}-job{self._job_seq}"
+
+        started = time.perf_counter()
+        if action == 'validate':
+            importer = self._validation_importer(job_id)
+            self._call(importer.import_terms, file_path, category, validate_only=True)
+            result = self._result(importer)
+        else:
+            with self.write_lock:
+                self._ensure_current()
+                importer = self.importer
+                importer.reset_run_state(job_id)
+                importer.upsert = bool(job.get('upsert', False))
+                try:
+                    if action == 'plan':
+                        plan = self._call(importer.plan_import, file_path, category, job.get('output'))
+                        result = self._result(importer)
+                        result['plan'] = json.loads(plan.to_json(orient='records', force_ascii=False))
+                    else:
+                        self._call(importer.import_terms, file_path, category)
+                        result = self._result(importer)
+                except Exception:
+                    # 任务中途失败时内存中的本体可能已部分修改，下个任务前重新加载
+                    self._ontology_signature = None
+                    raise
+                self._after_write(importer)
+
+        with self._jobs_lock:
+            self.jobs += 1
+        result.update(job_id=job_id, action=action, category=category, input=file_path,
+                      seconds=round(time.perf_counter() - started, 3))
+        return result
+
+    def _validation_importer(self, job_id: str):
+        """仅验证任务使用的独立导入器（共享配置和导入计划，不加载本体）"""
+        base = self.importer
+        importer = self._import_terms.TCHTermImporter(
+            config_path=str(self.config_path), ontology_path=str(self.ontology_path), config=base.config
+        )
+        importer.plans = base.plans
+        importer.reset_run_state(job_id)
+        return importer
+
+    @staticmethod
+    def _call(method, *args, **kwargs):
+        """调用导入器方法；导入器遇到致命错误时 sys.exit，这里转换为异常"""
+        try:
+            return method(*args, **kwargs)
+        except SystemExit:
+            raise RuntimeError("任务执行失败，详见服务日志 term_import.log")
+
+    def _after_write(self, importer):
+        """
+        写任务完成后同步本体文件状态
+
+        本体文件由本服务写入时记录新的文件签名；应保存却未写入（保存失败）时
+        丢弃内存中的本体，下个任务前重新加载
+        """
+        signature = _file_signature(self.ontology_path)
+        stats = importer.stats
+        should_save = stats['success'] + stats['changed'] > 0
+        if should_save and signature == self._ontology_signature:
+            logger.warning("本体未能保存，内存中的修改将在下个任务前丢弃并重新加载")
+            self._ontology_signature = None
+        else:
+            self._ontology_signature = signature
+
+    @staticmethod
+    def _result(importer) -> Dict:
+        """任务结果"""
+        sink = importer.error_sink
+        return {
+            'ok': True,
+            'stats': importer.stats,
+            'report': importer.last_report,
+            'error_file': str(sink.path) if sink is not None and sink.count else None,
+        }
+
+
+class _ServiceHandler(BaseHTTPRequestHandler):
+    """HTTP 请求处理：GET /status，POST /jobs"""
+
+    server_version = 'TCHImportService/1.0'
+
+    def do_GET(self):
+        if self.path.rstrip('/') != '/status':
+            self._send(404, {'ok': False, 'error': f"未知路径: {self.path}"})
+            return
+        self._send(200, self.server.service.status())
+
+    def do_POST(self):
+        if self.path.rstrip('/') != '/jobs':
+            self._send(404, {'ok': False, 'error': f"未知路径: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            job = json.loads(self.rfile.read(length).decode('utf-8') or '{}')
+            if not isinstance(job, dict):
+                raise JobError("任务必须是 JSON 对象")
+            self._send(200, self.server.service.run_job(job))
+        except (JobError, json.JSONDecodeError) as e:
+            self._send(400, {'ok': False, 'error': str(e)})
+        except Exception as e:
+            logger.error(f"任务执行失败: {e}")
+            self._send(500, {'ok': False, 'error': str(e)})
+
+    def _send(self, status: int, payload: Dict):
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.info(f"{self.address_string()} {format % args}")
+
+
+def serve(args):
+    """启动服务，直到 Ctrl+C"""
+    service = ImportService(args.config, args.ontology, use_cache=args.cache, incremental=args.incremental)
+    server = ThreadingHTTPServer((args.host, args.port), _ServiceHandler)
+    server.daemon_threads = True
+    server.service = service
+    logger.info(f"导入服务已启动: http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("导入服务已停止")
+    finally:
+        server.server_close()
+
+
+def submit(args) -> int:
+    """提交一个任务并打印报告，返回进程退出码"""
+    if args.validate_only:
+        job = {'action': 'validate'}
+    elif args.plan is not None:
+        job = {'action': 'plan', 'output': os.path.abspath(args.plan) if args.plan else None}
+    else:
+        job = {'action': 'import', 'upsert': args.upsert}
+    # 服务的工作目录与客户端不同，输入文件使用绝对路径
+    job.update(category=args.category, input=os.path.abspath(args.input))
+
+    request = urllib.request.Request(
+        f"{args.server.rstrip('/')}/jobs",
+        data=json.dumps(job, ensure_ascii=False).encode('utf-8'),
+        headers={'Content-Type': 'application/json'},
+        method='POST'
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            result = json.loads(response.read().decode('utf-8'))
+    except urllib.error.HTTPError as e:
+        result = json.loads(e.read().decode('utf-8'))
+    except urllib.error.URLError as e:
+        print(f"无法连接导入服务 {args.server}: {e.reason}", file=sys.stderr)
+        return 2
+
+    if not result.get('ok'):
+        print(f"任务失败: {result.get('error')}", file=sys.stderr)
+        return 1
+    if result.get('report'):
+        print(result['report'])
+    stats = result['stats']
+    print(f"{result['action']} 完成 ({result['seconds']}s): 总计 {stats['total']}, "
+          f"成功 {stats['success']}, 失败 {stats['failed']}, 跳过 {stats['skipped']}")
+    return 1 if stats['failed'] else 0
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(
+        description='TCH 本体术语导入常驻服务',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+示例:
+  # 启动服务，本体只加载一次
+  python import_service.py serve --ontology tch-edit.owl --config term-import-config.yaml --incremental
+
+  # 导入小批量术语
+  python import_service.py submit --category pattern --input data/pattern_terms.csv
+
+  # 仅验证 / 演练
+  python import_service.py submit --category herb --input data/herb_terms.xlsx --validate-only
+  python import_service.py submit --category pattern --input data/pattern_terms.csv --plan plan.csv
+        """
+    )
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = subparsers.add_parser('serve', help='启动服务')
+    serve_parser.add_argument('--config', default='term-import-config.yaml',
+                              help='配置文件路径 (默认: term-import-config.yaml)')
+    serve_parser.add_argument('--ontology', default='tch-edit.owl',
+                              help='本体文件路径 (默认: tch-edit.owl)')
+    serve_parser.add_argument('--host', default=DEFAULT_HOST, help=f'监听地址 (默认: {DEFAULT_HOST})')
+    serve_parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'监听端口 (默认: {DEFAULT_PORT})')
+    serve_parser.add_argument('--cache', action='store_true', help='使用 SQLite 本体缓存')
+    serve_parser.add_argument('--incremental', action='store_true',
+                              help='仅将新术语的公理追加到本体文件，不重新序列化整个本体')
+
+    submit_parser = subparsers.add_parser('submit', help='提交任务')
+    submit_parser.add_argument('--server', default=f'http://{DEFAULT_HOST}:{DEFAULT_PORT}',
+                               help=f'服务地址 (默认: http://{DEFAULT_HOST}:{DEFAULT_PORT})')
+    submit_parser.add_argument('--category', required=True, help='术语类别')
+    submit_parser.add_argument('--input', required=True, help='输入文件路径')
+    mode = submit_parser.add_mutually_exclusive_group()
+    mode.add_argument('--validate-only', action='store_true', help='仅验证数据，不导入到本体')
+    mode.add_argument('--plan', nargs='?', const='', metavar='OUTPUT',
+                      help='演练：输出导入计划，不修改本体')
+    submit_parser.add_argument('--upsert', action='store_true', help='已存在的术语内容变化时更新')
+
+    args = parser.parse_args()
+    if args.command == 'serve':
+        serve(args)
+    else:
+        sys.exit(submit(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -5,7 +5,9 @@ TCH 本体术语导入脚本
 TCH Ontology Term Import Script
 
 功能 / Features:
-- 从 CSV/Excel 文件导入术语到 tch-edit.owl
+- 从 CSV/Excel/Parquet/Arrow 文件导入术语到 tch-edit.owl
+- Parquet/Arrow 输入只读取类别配置中引用的列（需要 pyarrow）
+- 大批量术语可直接写出为 OFN 组件文件（components/），不经 owlready2 建类
 - 支持所有 11 个术语类别
 - 自动验证字段和关系
 - 生成导入报告
@@ -16,54 +18,193 @@ TCH Ontology Term Import Script
     
 依赖 / Dependencies:
     pip install pandas openpyxl pyyaml rdflib owlready2
+    pip install pyarrow  # 可选：Parquet/Arrow 输入
 """
 
 import argparse
+import atexit
 import sys
 import os
 import logging
+import queue
+import hashlib
+import json
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from itertools import chain, count
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 import pandas as pd
 import yaml
-from owlready2 import get_ontology, locstr
-
-# 设置日志
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('term_import.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+from owlready2 import SOME, AnnotationProperty, ObjectPropertyClass, Restriction, World, get_ontology, locstr
+
+from backup_store import store_from_config
+from error_sink import ErrorSink
+from excel_reader import EXCEL_STREAM_SUFFIXES, iter_excel_batches
+from import_profile import ImportProfiler
+from import_plan import CategoryPlan, FieldSpec, compile_plan, field_parser, load_plans
+from ofn_writer import (
+    RDFS_COMMENT, RDFS_LABEL, STANDARD_PREFIXES, annotation_assertion, declaration,
+    splice_axioms, sub_class_of, sub_class_of_some, write_ontology
 )
+
+# 设置日志：记录先进入队列，由后台线程写入文件和终端，导入循环不因日志 I/O 阻塞
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('term_import.log', encoding='utf-8'),
+    logging.StreamHandler()
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # 完整格式由监听端的处理器添加
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# 报告中显示的错误样例条数（完整错误列表写入错误文件）
+ERROR_SAMPLE_SIZE = 10
+
+# validate_dataframe 返回的错误表列
+VALIDATION_ERROR_COLUMNS = ['row', 'tch_id', 'field', 'rule', 'value', 'message']
+
+# 术语类别（命令行 --category 及清单文件中的 category）
+CATEGORIES = [
+    'pattern', 'disease', 'symptom', 'sign', 'herb', 'formula',
+    'principle', 'method', 'differentiation', 'pathomechanism'
+]
+
+# 清单导入的默认类别顺序：证候、疾病根类别优先，依赖关系无法决定先后时按此顺序
+DEFAULT_IMPORT_ORDER = [
+    'pattern', 'disease', 'symptom', 'sign', 'pathomechanism',
+    'differentiation', 'herb', 'formula', 'method', 'principle'
+]
+
+# 列式输入文件后缀（需要 pyarrow）
+COLUMNAR_SUFFIXES = ('.parquet', '.arrow', '.feather', '.ipc')
+
+
+def _require_pyarrow():
+    """按需导入 pyarrow（可选依赖，仅读取 Parquet/Arrow 文件时需要）"""
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("读取 Parquet/Arrow 文件需要安装 pyarrow: pip install pyarrow")
+    return pa, ipc, pq
+
+
+def _present_columns(names: List[str], columns: Optional[List[str]]) -> List[str]:
+    """列裁剪：保留文件中存在的列，None 表示全部列"""
+    if columns is None:
+        return list(names)
+    return [name for name in names if name in columns]
+
+
+# 未指定运行标识时的运行序号（与进程号一起组成输出文件名中的运行标识）
+_RUN_COUNTER = count(1)
+
 
 class TCHTermImporter:
     """TCH 本体术语导入器"""
     
-    def __init__(self, config_path: str, ontology_path: str):
+    def __init__(self, config_path: str, ontology_path: str, use_cache: bool = False,
+                 incremental: bool = False, chunk_size: Optional[int] = None, upsert: bool = False,
+                 workers: int = 1, config: Optional[Dict] = None, checkpoint_rows: Optional[int] = None,
+                 checkpoint_seconds: Optional[float] = None, resume: bool = False, profile: bool = False,
+                 sheet: Optional[str] = None):
         """
         初始化导入器
         
         Args:
             config_path: 配置文件路径
             ontology_path: 本体文件路径 (tch-edit.owl)
+            use_cache: 使用 SQLite 本体缓存（也可在配置 import_options.world_cache 中开启）
+            incremental: 仅将新术语的公理追加到本体文件，不重新序列化整个本体
+            chunk_size: CSV 分块读取的行数，None 时使用配置 import_options.chunk_size，0 为整体读取
+            upsert: 已存在的术语按内容指纹判断，变化时更新，未变化时跳过
+            workers: 解析和验证阶段使用的进程数，1 为在主进程中逐行处理
+            config: 已加载的配置（子进程中使用，避免重复读取配置文件）
+            checkpoint_rows: 每处理多少行保存一次检查点，None 时使用配置 import_options.checkpoint_rows，0 为不按行数
+            checkpoint_seconds: 每隔多少秒保存一次检查点，None 时使用配置 import_options.checkpoint_seconds，0 为不按时间
+            resume: 从上次中断时的检查点继续导入（检查点只在 incremental 模式下启用）
+            profile: 记录各阶段耗时和内存峰值，随报告写出 JSON
+            sheet: Excel 输入读取的工作表（名称或序号），None 时使用配置 import_options.excel_sheet
         """
         self.config_path = Path(config_path)
         self.ontology_path = Path(ontology_path)
-        self.config = self._load_config()
+        self.profiler = ImportProfiler(enabled=profile)
+        with self.profiler.phase('config_load'):
+            self.config = config if config is not None else self._load_config()
+        self.use_cache = use_cache or self.config['import_options'].get('world_cache', False)
+        self.incremental = incremental
+        self.chunk_size = chunk_size if chunk_size is not None else self.config['import_options'].get('chunk_size', 0)
+        self.upsert = upsert
+        self.workers = max(1, workers)
+        options = self.config['import_options']
+        self.checkpoint_rows = checkpoint_rows if checkpoint_rows is not None else options.get('checkpoint_rows', 0)
+        self.checkpoint_seconds = (checkpoint_seconds if checkpoint_seconds is not None
+                                   else options.get('checkpoint_seconds', 0))
+        self.resume = resume
+        self.sheet = sheet if sheet is not None else options.get('excel_sheet') or None
+        self.plans = None  # 类别 -> CategoryPlan，首次使用时编译或从缓存读取
+        self.world = None  # 不使用缓存时加载本体的 World，None 为 owlready2 默认 World
         self.ontology = None
-        self.stats = {
+        self.iri_index = {}  # IRI -> 类 的内存索引，由 load_ontology 建立
+        self.object_properties = {}  # 属性 CURIE -> 本体中的对象属性（未找到时为 None），首次使用时解析
+        self.fingerprint_property = None  # 内容指纹注释属性，首次使用时解析或创建
+        self.fingerprints = {}  # 术语IRI -> 导入时的行内容指纹
+        self.flushed_iris = set()  # 已增量写入文件的新建类 IRI
+        self.last_report = None  # 最近一次生成的报告文本
+        self.reset_run_state()
+    
+    def reset_run_state(self, run_id: Optional[str] = None):
+        """
+        重置单次运行的状态（统计、输入索引、待挂接关系、待写入公理）
+        
+        本体、IRI 索引和导入计划等跨运行的状态保持不变，常驻服务在每个任务开始前调用
+        
+        Args:
+            run_id: 运行标识（常驻服务传入任务ID），写入错误文件、报告等输出文件名；
+                    None 时使用 进程号-序号
+        """
+        self.run_id = run_id or f"{os.getpid()}-{next(_RUN_COUNTER)}"
+        self.run_started = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.checkpoint = None  # 当前导入的检查点状态（import_terms 中开启检查点时设置）
+        self.new_classes = []  # 本次运行新建、尚未写入文件的类（增量写入模式使用）
+        self.input_parents = {}  # 当前输入文件: tch_id -> 父类ID列表（预扫描建立）
+        self.input_rank = {}  # 当前输入文件: tch_id -> 按父类关系的拓扑序号
+        self.input_cyclic = set()  # 当前输入文件中父类关系成环的 tch_id
+        self.pending_parents = {}  # 父类IRI -> 等待该父类创建后挂接的子类列表
+        self.pending_restrictions = {}  # 关系目标IRI -> 等待该目标创建后添加限定的 (类, 属性, 字段名) 列表
+        self.new_properties = []  # 本次运行新建、尚未写入文件的注释属性（增量写入模式使用）
+        self.pending_axioms = []  # 已写入文件的类上新增的公理（增量写入模式下子类晚于父类挂接时产生）
+        self.error_sink = None  # 当前运行的错误文件（逐条写出全部错误）
+        self._progress = None  # 进度日志状态: (开始时间, 上次输出时间)
+        self.stats = self._new_stats()
+    
+    @staticmethod
+    def _new_stats() -> Dict:
+        """新的统计信息字典"""
+        return {
             'total': 0,
             'success': 0,
             'failed': 0,
             'skipped': 0,
-            'errors': []
+            'changed': 0,
+            'unchanged': 0,
+            'error_count': 0,
+            'errors': []  # 仅保留前 ERROR_SAMPLE_SIZE 条样例
         }
-        
+    
     def _load_config(self) -> Dict:
         """加载配置文件"""
         try:
@@ -75,56 +216,211 @@ class TCHTermImporter:
             logger.error(f"配置文件加载失败: {e}")
             sys.exit(1)
     
-    def load_ontology(self):
-        """加载本体文件"""
+    def _plan(self, category: str) -> CategoryPlan:
+        """获取类别的编译后导入计划（字段解析函数、必填字段、ID 规则、基类 IRI）"""
+        if self.plans is None:
+            cache_file = self.config['import_options'].get('plan_cache_file')
+            cache_path = self.ontology_path.parent / cache_file if cache_file else None
+            self.plans = load_plans(self.config, cache_path)
+        if category not in self.plans:
+            self.plans = {**self.plans, category: compile_plan(self.config, category)}
+        return self.plans[category]
+    
+    def _field_spec(self, category: str, field_name: str) -> FieldSpec:
+        """获取类别导入计划中的单个字段"""
+        return next(spec for spec in self._plan(category).fields if spec.name == field_name)
+    
+    def load_ontology(self, backup: bool = True):
+        """
+        加载本体文件
+        
+        本体已加载时（常驻服务中）只按配置备份，不重新解析
+        
+        Args:
+            backup: 是否按配置先备份本体文件（只读使用时传 False）
+        """
         try:
-            if self.config['import_options']['backup_before_import']:
-                backup_path = f"{self.ontology_path}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                import shutil
-                shutil.copy(self.ontology_path, backup_path)
-                logger.info(f"本体文件已备份: {backup_path}")
-            
-            # 使用 file:// 协议加载本地文件，明确指定格式
-            onto_iri = f"file://{os.path.abspath(self.ontology_path)}"
-            self.ontology = get_ontology(onto_iri).load(format="ofn")  # OWL Functional Syntax
-            logger.info(f"本体文件加载成功: {self.ontology_path}")
+            if backup and self.config['import_options']['backup_before_import']:
+                with self.profiler.phase('backup'):
+                    self._backup_ontology()
+            
+            if self.ontology is not None:
+                return
+            
+            with self.profiler.phase('load_ontology'):
+                # 使用 file:// 协议加载本地文件，明确指定格式
+                onto_iri = f"file://{os.path.abspath(self.ontology_path)}"
+                if self.use_cache:
+                    self.ontology = self._load_cached_ontology(onto_iri)
+                else:
+                    world_get_ontology = self.world.get_ontology if self.world is not None else get_ontology
+                    self.ontology = world_get_ontology(onto_iri).load(format="ofn")  # OWL Functional Syntax
+                logger.info(f"本体文件加载成功: {self.ontology_path}")
+                self._build_iri_index()
         except Exception as e:
             logger.error(f"本体文件加载失败: {e}")
             logger.info("提示: 如果导入失败，请确保 tch-edit.owl 是有效的 OWL 格式")
             sys.exit(1)
     
-    def load_terms_data(self, file_path: str) -> pd.DataFrame:
+    def _backup_ontology(self):
+        """将本体文件存入备份仓库（相同内容只保存一份），并按保留策略清理旧备份"""
+        store = store_from_config(self.config, self.ontology_path)
+        entry, created = store.backup(self.ontology_path)
+        removed_entries, removed_blobs = store.prune()
+        logger.info(f"本体文件已备份: {entry['timestamp']} ({entry['sha256'][:12]}, "
+                    f"{'新版本' if created else '内容未变化，仅记录引用'}) -> {store.root}")
+        if removed_entries:
+            logger.info(f"按保留策略删除 {removed_entries} 条旧备份，{removed_blobs} 个压缩文件")
+    
+    def _world_cache_path(self) -> Path:
+        """SQLite 本体缓存文件路径（相对路径以本体文件所在目录为准）"""
+        cache_file = Path(self.config['import_options'].get('world_cache_file', 'tmp/tch-edit.owl.sqlite3'))
+        if not cache_file.is_absolute():
+            cache_file = self.ontology_path.parent / cache_file
+        return cache_file
+    
+    def _ontology_source_hash(self) -> str:
+        """计算 tch-edit.owl 及 imports/ 目录下所有文件的内容哈希"""
+        digest = hashlib.sha256()
+        sources = [self.ontology_path]
+        imports_dir = self.ontology_path.parent / 'imports'
+        if imports_dir.is_dir():
+            sources += sorted(p for p in imports_dir.iterdir() if p.is_file())
+        
+        for source in sources:
+            digest.update(source.name.encode('utf-8'))
+            with open(source, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+        return digest.hexdigest()
+    
+    def _load_cached_ontology(self, onto_iri: str):
+        """
+        从 SQLite quadstore 缓存加载本体
+        
+        缓存旁的 .sha256 文件记录建立缓存时的源文件哈希；哈希一致时
+        owlready2 直接使用 quadstore 中的三元组，不再解析 OFN 文本；
+        不一致或缓存不存在时重建缓存。
+        """
+        cache_file = self._world_cache_path()
+        hash_file = cache_file.with_name(cache_file.name + '.sha256')
+        source_hash = self._ontology_source_hash()
+        
+        cache_valid = (
+            cache_file.exists() and hash_file.exists()
+            and hash_file.read_text(encoding='utf-8').strip() == source_hash
+        )
+        if not cache_valid:
+            logger.info(f"本体缓存失效或不存在，重新解析: {cache_file}")
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.unlink(missing_ok=True)
+            hash_file.unlink(missing_ok=True)
+        
+        world = World(filename=str(cache_file))
+        ontology = world.get_ontology(onto_iri).load(format="ofn")
+        
+        if cache_valid:
+            logger.info(f"本体从缓存加载: {cache_file}")
+        else:
+            world.save()
+            hash_file.write_text(source_hash, encoding='utf-8')
+            logger.info(f"本体缓存已建立: {cache_file}")
+        return ontology
+    
+    def _refresh_world_cache(self):
+        """本体文件保存后提交缓存，并更新源文件哈希，使下次运行仍能命中缓存"""
+        if not self.use_cache:
+            return
+        cache_file = self._world_cache_path()
+        self.ontology.world.save()
+        cache_file.with_name(cache_file.name + '.sha256').write_text(
+            self._ontology_source_hash(), encoding='utf-8'
+        )
+        logger.info(f"本体缓存已更新: {cache_file}")
+    
+    def _build_iri_index(self):
+        """
+        建立 IRI -> 类 的内存索引
+
+        一次性遍历本体（含导入本体）中的所有类，之后的存在性检查、
+        基类和父类查找都走字典，避免每行多次调用 search_one
+        """
+        self.iri_index = {cls.iri: cls for cls in self.ontology.world.classes()}
+        logger.info(f"IRI 索引建立完成: {len(self.iri_index)} 个类")
+    
+    def _term_iri(self, term_id: str) -> str:
+        """术语ID (TCH_XXXXXXX) 转换为完整 IRI"""
+        return f"{self.config['general']['term_prefix']}{term_id.replace('TCH_', '')}"
+    
+    def _get_fingerprint_property(self):
+        """
+        获取内容指纹注释属性，本体中不存在时创建（仅在 --upsert 模式下调用）
+        
+        首次调用时一次性读取本体中所有术语的指纹，之后按 IRI 查字典
+        """
+        if self.fingerprint_property is not None:
+            return self.fingerprint_property
+        
+        property_iri = self.config['general']['fingerprint_property']
+        prop = self.ontology.world[property_iri]
+        if prop is None:
+            with self.ontology:
+                prop = type(property_iri.rsplit('#', 1)[-1], (AnnotationProperty,), {"namespace": self.ontology})
+                prop.iri = property_iri
+            if self.incremental:
+                self.new_properties.append(prop)
+        
+        self.fingerprints = {subject.iri: value for subject, value in prop.get_relations()}
+        self.fingerprint_property = prop
+        return prop
+    
+    def _row_fingerprint(self, row: pd.Series, category: str) -> str:
+        """行内容指纹：按配置字段顺序拼接去空格后的取值并计算 SHA-1"""
+        parts = []
+        for spec in self._plan(category).fields:
+            value = row.get(spec.name)
+            parts.append(f"{spec.name}={'' if pd.isna(value) else str(value).strip()}")
+        return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+    
+    def _set_fingerprint(self, owl_class, fingerprint: str):
+        """记录术语的内容指纹"""
+        self._get_fingerprint_property()[owl_class] = [fingerprint]
+        self.fingerprints[owl_class.iri] = fingerprint
+    
+    def load_terms_data(self, file_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         加载术语数据文件
         
         Args:
-            file_path: CSV 或 Excel 文件路径
+            file_path: CSV、Excel、Parquet 或 Arrow IPC 文件路径
+            columns: 只读取这些列（文件中不存在的列忽略），None 时读取全部列
             
         Returns:
             pandas DataFrame
         """
         try:
             file_ext = Path(file_path).suffix.lower()
+            usecols = None if columns is None else (lambda column: column in columns)
             
             if file_ext == '.csv':
                 df = pd.read_csv(
                     file_path,
                     encoding=self.config['import_options']['input_encoding'],
-                    delimiter=self.config['import_options']['csv_delimiter']
+                    delimiter=self.config['import_options']['csv_delimiter'],
+                    usecols=usecols
                 )
-            elif file_ext in ['.xlsx', '.xls']:
-                df = pd.read_excel(file_path)
+            elif file_ext in EXCEL_STREAM_SUFFIXES:
+                # 整表只有一批；取出后立即关闭生成器，释放只读工作簿的文件句柄
+                with closing(self._iter_excel(file_path, columns, batch_size=None)) as batches:
+                    df = next(batches, pd.DataFrame())
+            elif file_ext == '.xls':
+                df = pd.read_excel(file_path, sheet_name=self._xls_sheet(), usecols=usecols)
+            elif file_ext in COLUMNAR_SUFFIXES:
+                df = self._read_columnar(file_path, columns).to_pandas()
             else:
                 raise ValueError(f"不支持的文件格式: {file_ext}")
             
-            # 去除空行
-            if self.config['import_options']['skip_empty_rows']:
-                df = df.dropna(how='all')
-            
-            # 去除字段前后空格
-            if self.config['import_options']['strip_whitespace']:
-                df = df.applymap(lambda x: x.strip() if isinstance(x, str) else x)
-            
+            df = self._clean_terms_frame(df)
             logger.info(f"术语数据加载成功: {file_path}, 共 {len(df)} 条记录")
             return df
             
@@ -132,6 +428,127 @@ class TCHTermImporter:
             logger.error(f"术语数据加载失败: {e}")
             sys.exit(1)
     
+    def iter_terms_data(self, file_path: str, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        分块读取术语数据文件
+        
+        CSV 按 chunk_size 行分块解析，Excel (.xlsx) 以只读模式逐行读取并按 chunk_size 行分批，
+        Parquet 按 chunk_size 行读取记录批次，Arrow IPC 通过内存映射按批次转换；
+        每块在解析后立即去空行、去空格，内存占用与文件大小无关。
+        未设置 chunk_size 或 .xls 文件时整体读取为一块。
+        
+        Args:
+            file_path: CSV、Excel、Parquet 或 Arrow IPC 文件路径
+            columns: 只读取这些列（文件中不存在的列忽略），None 时读取全部列
+            
+        Yields:
+            清洗后的数据块
+        """
+        file_ext = Path(file_path).suffix.lower()
+        if not self.chunk_size or file_ext not in ('.csv',) + EXCEL_STREAM_SUFFIXES + COLUMNAR_SUFFIXES:
+            yield self.load_terms_data(file_path, columns)
+            return
+        
+        try:
+            if file_ext == '.csv':
+                reader = pd.read_csv(
+                    file_path,
+                    encoding=self.config['import_options']['input_encoding'],
+                    delimiter=self.config['import_options']['csv_delimiter'],
+                    usecols=None if columns is None else (lambda column: column in columns),
+                    chunksize=self.chunk_size
+                )
+                batches = iter(reader)
+            elif file_ext in EXCEL_STREAM_SUFFIXES:
+                reader = None
+                batches = self._iter_excel(file_path, columns, batch_size=self.chunk_size)
+            else:
+                reader = None
+                batches = (batch.to_pandas() for batch in self._iter_columnar_batches(file_path, columns))
+            
+            row_count = 0
+            try:
+                for chunk in batches:
+                    chunk = self._clean_terms_frame(chunk)
+                    row_count += len(chunk)
+                    yield chunk
+            finally:
+                # 提前停止迭代时也要关闭：Excel 生成器关闭时才会关闭工作簿
+                if reader is not None:
+                    reader.close()
+                else:
+                    batches.close()
+            logger.info(f"术语数据分块读取完成: {file_path}, 共 {row_count} 条记录")
+            
+        except Exception as e:
+            logger.error(f"术语数据加载失败: {e}")
+            sys.exit(1)
+    
+    def _iter_excel(self, file_path: str, columns: Optional[List[str]], batch_size: Optional[int]):
+        """以 openpyxl 只读模式流式读取 Excel 工作表（工作表和表头检测范围来自配置）"""
+        return iter_excel_batches(
+            file_path,
+            sheet=self.sheet,
+            batch_size=batch_size,
+            columns=columns,
+            header_scan_rows=self.config['import_options'].get('excel_header_scan_rows', 20)
+        )
+    
+    def _xls_sheet(self):
+        """.xls 文件的 sheet_name 参数：序号按整数传给 pandas"""
+        if self.sheet is None:
+            return 0
+        return int(self.sheet) if str(self.sheet).isdigit() else self.sheet
+    
+    def _read_columnar(self, file_path: str, columns: Optional[List[str]] = None):
+        """整体读取 Parquet/Arrow IPC 文件为 pyarrow.Table，只解码需要的列"""
+        pa, ipc, pq = _require_pyarrow()
+        if Path(file_path).suffix.lower() == '.parquet':
+            parquet_file = pq.ParquetFile(file_path)
+            return parquet_file.read(columns=_present_columns(parquet_file.schema_arrow.names, columns))
+        
+        # Arrow IPC 文件内存映射，select 只是零拷贝地挑出列
+        with pa.memory_map(str(file_path), 'r') as source:
+            table = ipc.open_file(source).read_all()
+        return table.select(_present_columns(table.schema.names, columns))
+    
+    def _iter_columnar_batches(self, file_path: str, columns: Optional[List[str]] = None):
+        """按 chunk_size 行逐批读取 Parquet/Arrow IPC 文件（pyarrow.RecordBatch）"""
+        pa, ipc, pq = _require_pyarrow()
+        if Path(file_path).suffix.lower() == '.parquet':
+            parquet_file = pq.ParquetFile(file_path)
+            yield from parquet_file.iter_batches(
+                batch_size=self.chunk_size,
+                columns=_present_columns(parquet_file.schema_arrow.names, columns)
+            )
+            return
+        
+        with pa.memory_map(str(file_path), 'r') as source:
+            reader = ipc.open_file(source)
+            present = _present_columns(reader.schema.names, columns)
+            for index in range(reader.num_record_batches):
+                batch = reader.get_batch(index).select(present)
+                # 文件内的记录批次可能大于 chunk_size，再按行切片（零拷贝）
+                for offset in range(0, batch.num_rows, self.chunk_size):
+                    yield batch.slice(offset, self.chunk_size)
+    
+    def _input_columns(self, category: str) -> List[str]:
+        """该类别配置中引用的输入列（tch_id 在前），用于列裁剪"""
+        return list(dict.fromkeys(['tch_id'] + [spec.name for spec in self._plan(category).fields]))
+    
+    def _clean_terms_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """去除空行，并去除文本列的前后空格（只处理文本列，不复制整张表）"""
+        # 去除空行
+        if self.config['import_options']['skip_empty_rows']:
+            df = df.dropna(how='all')
+        
+        # 去除字段前后空格
+        if self.config['import_options']['strip_whitespace']:
+            for column in df.select_dtypes(include=['object', 'string']).columns:
+                df[column] = df[column].map(lambda x: x.strip() if isinstance(x, str) else x)
+        
+        return df
+    
     def validate_term_id(self, term_id: str, category: str) -> bool:
         """
         验证术语ID格式和范围
@@ -143,25 +560,19 @@ class TCHTermImporter:
         Returns:
             验证是否通过
         """
+        plan = self._plan(category)
+        
         # 格式验证
-        pattern = self.config['validation_rules']['id_format']['pattern']
-        import re
-        if not re.match(pattern, term_id):
-            error_msg = self.config['validation_rules']['id_format']['error_message']
-            logger.error(f"ID格式错误: {term_id} - {error_msg}")
+        if not plan.id_pattern.match(term_id):
+            logger.error(f"ID格式错误: {term_id} - {plan.id_error_message}")
             return False
         
         # 范围验证
-        if self.config['validation_rules']['id_range_check']:
-            category_config = self.config['category_specific_fields'].get(category)
-            if category_config and 'id_range' in category_config:
-                id_range = category_config['id_range']
-                start, end = id_range.split('-')
-                term_num = int(term_id.replace('TCH_', ''))
-                
-                if not (int(start) <= term_num <= int(end)):
-                    logger.error(f"ID范围错误: {term_id} 不在 {category} 类别范围 {id_range} 内")
-                    return False
+        if plan.id_range:
+            start, end = plan.id_range
+            if not (start <= int(term_id.replace('TCH_', '')) <= end):
+                logger.error(f"ID范围错误: {term_id} 不在 {category} 类别范围 {plan.id_range_text} 内")
+                return False
         
         return True
     
@@ -176,26 +587,83 @@ class TCHTermImporter:
         Returns:
             验证是否通过
         """
-        # 检查通用必填字段
-        for field_name, field_config in self.config['common_fields'].items():
-            if field_config.get('required', False):
-                if field_name not in row or pd.isna(row[field_name]) or str(row[field_name]).strip() == '':
-                    logger.error(f"必填字段缺失: {field_name}")
-                    return False
-        
-        # 检查类别特定必填字段
-        category_config = self.config['category_specific_fields'].get(category, {})
-        for field_name, field_config in category_config.items():
-            # 跳过非字段配置（如 base_class, id_range 等元数据）
-            if not isinstance(field_config, dict) or 'property' not in field_config:
-                continue
-            if field_config.get('required', False):
-                if field_name not in row or pd.isna(row[field_name]) or str(row[field_name]).strip() == '':
-                    logger.error(f"必填字段缺失: {field_name} (类别: {category})")
-                    return False
+        # 通用必填字段在前，类别特定必填字段在后
+        for spec in self._plan(category).required:
+            if spec.name not in row or pd.isna(row[spec.name]) or str(row[spec.name]).strip() == '':
+                if spec.common:
+                    logger.error(f"必填字段缺失: {spec.name}")
+                else:
+                    logger.error(f"必填字段缺失: {spec.name} (类别: {category})")
+                return False
         
         return True
     
+    def _required_fields(self, category: str) -> List[str]:
+        """返回通用及类别特定的必填字段名"""
+        return [spec.name for spec in self._plan(category).required]
+    
+    def validate_dataframe(self, df: pd.DataFrame, category: str, row_offset: int = 0) -> pd.DataFrame:
+        """
+        列式验证整个 DataFrame
+        
+        与 validate_term_id / validate_required_fields 规则相同，但以整列为单位
+        计算掩码，不逐行调用，也不逐行写日志。
+        
+        Args:
+            df: 术语数据
+            category: 术语类别
+            row_offset: 本块第一行之前已处理的行数（分块读取时使用）
+            
+        Returns:
+            逐行错误表，列为 VALIDATION_ERROR_COLUMNS；row 为从 1 开始的行号
+        """
+        plan = self._plan(category)
+        row_nums = pd.Series(range(row_offset + 1, row_offset + len(df) + 1), index=df.index)
+        if 'tch_id' in df.columns:
+            ids = df['tch_id']
+        else:
+            ids = pd.Series(pd.NA, index=df.index, dtype=object)
+        id_str = ids.astype('string').str.strip()
+        
+        frames = []
+        
+        def collect(mask: pd.Series, field: str, rule: str, values: pd.Series, message: str):
+            if mask.any():
+                frames.append(pd.DataFrame({
+                    'row': row_nums[mask],
+                    'tch_id': ids[mask],
+                    'field': field,
+                    'rule': rule,
+                    'value': values[mask],
+                    'message': message,
+                }))
+        
+        # 格式验证
+        format_ok = id_str.str.match(plan.id_pattern).fillna(False).astype(bool)
+        collect(~format_ok, 'tch_id', 'id_format', ids, plan.id_error_message)
+        
+        # 范围验证（仅对格式正确的ID）
+        if plan.id_range:
+            start, end = plan.id_range
+            term_nums = pd.to_numeric(id_str.str.replace('TCH_', '', regex=False), errors='coerce')
+            out_of_range = format_ok & ~term_nums.between(start, end)
+            collect(out_of_range, 'tch_id', 'id_range', ids,
+                    f"不在 {category} 类别范围 {plan.id_range_text} 内")
+        
+        # 必填字段验证
+        for field_name in self._required_fields(category):
+            if field_name in df.columns:
+                column = df[field_name]
+                blank = column.isna() | column.astype('string').str.strip().eq('').fillna(True)
+            else:
+                column = pd.Series(pd.NA, index=df.index, dtype=object)
+                blank = pd.Series(True, index=df.index)
+            collect(blank, field_name, 'required', column, "必填字段缺失")
+        
+        if not frames:
+            return pd.DataFrame(columns=VALIDATION_ERROR_COLUMNS)
+        return pd.concat(frames, ignore_index=True).sort_values('row', kind='stable', ignore_index=True)
+    
     def parse_field_value(self, value: Any, field_config: Dict) -> Any:
         """
         解析字段值
@@ -210,86 +678,90 @@ class TCHTermImporter:
         if pd.isna(value) or str(value).strip() == '':
             return None
         
-        value = str(value).strip()
-        field_type = field_config.get('type', 'string')
-        
-        # 字符串列表
-        if field_type == 'string_list':
-            separator = field_config.get('separator', '|')
-            values = [v.strip() for v in value.split(separator) if v.strip()]
-            return values if values else None
-        
-        # ID列表
-        elif field_type == 'id_list':
-            separator = field_config.get('separator', '|')
-            ids = [v.strip() for v in value.split(separator) if v.strip()]
-            # 添加前缀（如果需要）
-            prefix = field_config.get('prefix', '')
-            if prefix and not prefix.startswith('TCH'):
-                ids = [f"{prefix}{id_val}" if not id_val.startswith(prefix) else id_val for id_val in ids]
-            return ids if ids else None
-        
-        # 日期
-        elif field_type == 'date':
-            try:
-                date_format = field_config.get('format', '%Y-%m-%d')
-                return datetime.strptime(value, date_format).strftime('%Y-%m-%d')
-            except:
-                logger.warning(f"日期格式解析失败: {value}")
-                return value
+        # 按字段类型（字符串、字符串列表、ID列表、日期、ID）解析，
+        # 与导入计划中 FieldSpec.parse 使用同一组解析函数
+        return field_parser(field_config)(str(value).strip())
+    
+    def prepare_row(self, row: pd.Series, category: str, validated: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        验证一行并解析其全部字段
         
-        # ID
-        elif field_type == 'id':
-            return value
+        只依赖配置，不访问本体，可以在子进程中并行执行。
         
-        # 字符串
-        else:
-            prefix = field_config.get('prefix', '')
-            if prefix and not value.startswith(prefix):
-                return f"{prefix}{value}"
-            return value
+        Args:
+            row: 数据行（Series 或字段名 -> 值的字典）
+            category: 术语类别
+            validated: 所在数据块已通过 validate_dataframe 列式验证，跳过逐行验证
+        
+        Returns:
+            字段名 -> 解析后的值（空值字段不包含在内）；验证失败时返回 None
+        """
+        if not validated:
+            # 验证ID
+            if not self.validate_term_id(row['tch_id'], category):
+                return None
+            
+            # 验证必填字段
+            if not self.validate_required_fields(row, category):
+                return None
+        
+        values = {}
+        for spec in self._plan(category).fields:
+            if spec.name in row:
+                value = spec.parse(row[spec.name])
+                if value is not None:
+                    values[spec.name] = value
+        return values
     
-    def create_term(self, row: pd.Series, category: str) -> bool:
+    def create_term(self, row: pd.Series, category: str, prepared: Optional[Dict[str, Any]] = None,
+                    validated: bool = False) -> bool:
         """
         创建术语
         
         Args:
             row: 术语数据行
             category: 术语类别
+            prepared: prepare_row 的结果（已在子进程中验证和解析时传入）
+            validated: 该行已通过 validate_dataframe 列式验证，解析字段时不再逐行验证
             
         Returns:
             是否创建成功
         """
         try:
             term_id = row['tch_id']
+            term_iri = self._term_iri(term_id) if isinstance(term_id, str) else None
             
-            # 验证ID
-            if not self.validate_term_id(term_id, category):
+            # upsert: 内容指纹未变化的已有术语直接跳过
+            if self.upsert and term_iri in self.iri_index:
+                self._get_fingerprint_property()
+                fingerprint = self._row_fingerprint(row, category)
+                if self.fingerprints.get(term_iri) == fingerprint:
+                    self.stats['unchanged'] += 1
+                    return True
+            
+            # 验证并解析字段
+            values = prepared if prepared is not None else self.prepare_row(row, category, validated)
+            if values is None:
                 return False
             
-            # 验证必填字段
-            if not self.validate_required_fields(row, category):
+            # 获取基类
+            base_class = self._base_class(category)
+            if not base_class:
                 return False
             
             # 检查术语是否已存在
-            term_iri = f"{self.config['general']['term_prefix']}{term_id.replace('TCH_', '')}"
-            existing_term = self.ontology.search_one(iri=term_iri)
+            existing_term = self.iri_index.get(term_iri)
             
             if existing_term:
+                if self.upsert:
+                    self._update_term(existing_term, base_class, values, category, fingerprint)
+                    logger.debug(f"术语内容已变化，已更新: {term_id}")
+                    self.stats['changed'] += 1
+                    return True
                 logger.warning(f"术语已存在，跳过: {term_id}")
                 self.stats['skipped'] += 1
                 return True
             
-            # 获取基类
-            category_config = self.config['category_specific_fields'].get(category, {})
-            base_class_id = category_config.get('base_class', 'TCH:0000000')
-            base_class_iri = base_class_id.replace('TCH:', self.config['general']['term_prefix'])
-            base_class = self.ontology.search_one(iri=base_class_iri)
-            
-            if not base_class:
-                logger.error(f"基类不存在: {base_class_id}")
-                return False
-            
             # 创建新类（使用 owlready2 的正确方式）
             with self.ontology:
                 # 创建类名（移除 TCH_ 前缀）
@@ -300,37 +772,98 @@ class TCHTermImporter:
                 
                 # 设置 IRI
                 NewClass.iri = term_iri
+                self.iri_index[term_iri] = NewClass
                 
                 # 添加标签和定义
-                self._add_annotations(NewClass, row, category)
+                self._add_annotations(NewClass, values, category)
                 
                 # 添加关系
-                self._add_relationships(NewClass, row, category)
+                self._add_relationships(NewClass, values, category)
+                
+                # 挂接此前因本术语尚未创建而等待的子类
+                for child in self.pending_parents.pop(term_iri, []):
+                    child.is_a.append(NewClass)
+                    if child.iri in self.flushed_iris:
+                        # 子类已在检查点写入文件，父类关系需单独追加
+                        self.pending_axioms.append(sub_class_of(child.iri, term_iri))
+                
+                # 添加此前因本术语尚未创建而等待的关系限定
+                for subject, prop, _ in self.pending_restrictions.pop(term_iri, []):
+                    subject.is_a.append(prop.some(NewClass))
+                    if subject.iri in self.flushed_iris:
+                        self.pending_axioms.append(sub_class_of_some(subject.iri, prop.iri, term_iri))
+                
+                # --upsert 模式下记录行内容指纹，供之后判断是否变化（默认导入不写指纹）
+                if self.upsert:
+                    self._set_fingerprint(NewClass, self._row_fingerprint(row, category))
             
-            logger.info(f"术语创建成功: {term_id}")
+            if self.incremental:
+                self.new_classes.append(NewClass)
+            logger.debug(f"术语创建成功: {term_id}")
             self.stats['success'] += 1
             return True
             
         except Exception as e:
             logger.error(f"术语创建失败: {row.get('tch_id', 'UNKNOWN')} - {e}")
-            self.stats['errors'].append({
-                'term_id': row.get('tch_id', 'UNKNOWN'),
-                'error': str(e)
-            })
+            self._record_error(row.get('tch_id'), str(e), rule='exception')
             self.stats['failed'] += 1
             return False
     
-    def _add_annotations(self, owl_class, row: pd.Series, category: str):
-        """添加注释属性"""
+    def _base_class(self, category: str):
+        """获取类别基类，不存在时记录错误并返回 None"""
+        base_class = self.iri_index.get(self._plan(category).base_class_iri)
+        
+        if not base_class:
+            logger.error(f"基类不存在: {self._plan(category).base_class_iri}")
+        return base_class
+    
+    def _update_term(self, owl_class, base_class, values: Dict[str, Any], category: str, fingerprint: str):
+        """
+        按新行内容重写已有术语中由导入器写入的标签、定义和关系
+        
+        只移除导入器自身生成的内容：配置语言的 rdfs:label、"Definition: " 开头的注释、
+        TCH 命名空间中的父类（基类除外）以及关系字段对应属性上的存在量词限定。
+        人工添加的注释、其他父类和限定保持不变；普通 rdfs:comment（如 notes）
+        无法与人工注释区分，只追加新值，不删除旧值。
+        """
+        plan = self._plan(category)
+        label_langs = {spec.lang for spec in plan.fields if spec.property == 'rdfs:label'}
+        relation_properties = {
+            prop for prop in (self._object_property(spec.property) for spec in plan.fields if spec.type == 'id_list')
+            if prop is not None
+        }
+        term_prefix = self.config['general']['term_prefix']
+        
+        def emitted_by_importer(parent) -> bool:
+            if isinstance(parent, Restriction):
+                return parent.type == SOME and parent.property in relation_properties
+            iri = getattr(parent, 'iri', None)
+            return parent is not base_class and isinstance(iri, str) and iri.startswith(term_prefix)
+        
+        with self.ontology:
+            owl_class.label = [
+                label for label in owl_class.label if getattr(label, 'lang', None) not in label_langs
+            ]
+            owl_class.comment = [
+                comment for comment in owl_class.comment
+                if not (isinstance(comment, str) and comment.startswith('Definition: '))
+            ]
+            owl_class.is_a[:] = [parent for parent in owl_class.is_a if not emitted_by_importer(parent)]
+            if base_class not in owl_class.is_a:
+                owl_class.is_a.insert(0, base_class)
+            self._add_annotations(owl_class, values, category)
+            self._add_relationships(owl_class, values, category)
+            self._set_fingerprint(owl_class, fingerprint)
+    
+    def _add_annotations(self, owl_class, values: Dict[str, Any], category: str):
+        """添加注释属性（values 为 prepare_row 解析后的字段值）"""
         # 处理通用字段
-        for field_name, field_config in self.config['common_fields'].items():
-            if field_name in row and not pd.isna(row[field_name]):
-                value = self.parse_field_value(row[field_name], field_config)
-                if value is None:
-                    continue
+        for spec in self._plan(category).fields:
+            if spec.common and spec.name in values:
+                value = values[spec.name]
                 
-                property_name = field_config['property']
-                lang = field_config.get('lang')
+                property_name = spec.property
+                lang = spec.lang
                 
                 # 根据属性类型添加
                 if property_name == 'rdfs:label':
@@ -348,37 +881,86 @@ class TCHTermImporter:
                         owl_class.comment.append(f"Definition: {value}")
                 
                 elif property_name == 'rdfs:comment':
+                    # 更新已有术语时旧注释保留，相同内容不重复添加
+                    if value in owl_class.comment:
+                        continue
                     if lang:
                         owl_class.comment.append(locstr(value, lang=lang))
                     else:
                         owl_class.comment.append(value)
     
-    def _add_relationships(self, owl_class, row: pd.Series, category: str):
-        """添加关系属性"""
-        category_config = self.config['category_specific_fields'].get(category, {})
-        
-        for field_name, field_config in category_config.items():
-            # 跳过非字段配置（如 base_class, id_range 等元数据）
-            if not isinstance(field_config, dict) or 'property' not in field_config:
-                continue
-                
-            if field_name in row and not pd.isna(row[field_name]):
-                value = self.parse_field_value(row[field_name], field_config)
-                if value is None:
-                    continue
+    def _add_relationships(self, owl_class, values: Dict[str, Any], category: str):
+        """添加关系属性（values 为 prepare_row 解析后的字段值）"""
+        # parents 等通用关系字段定义在 common_fields 中
+        for spec in self._plan(category).fields:
+            if spec.name in values:
+                value = values[spec.name]
                 
-                property_name = field_config['property']
+                property_name = spec.property
                 
                 # 处理父类关系
                 if property_name == 'rdfs:subClassOf' and isinstance(value, list):
                     for parent_id in value:
-                        parent_iri = f"{self.config['general']['term_prefix']}{parent_id.replace('TCH_', '')}"
-                        parent_class = self.ontology.search_one(iri=parent_iri)
+                        parent_iri = self._term_iri(parent_id)
+                        parent_class = self.iri_index.get(parent_iri)
                         if parent_class:
-                            owl_class.is_a.append(parent_class)
+                            if parent_class not in owl_class.is_a:
+                                owl_class.is_a.append(parent_class)
+                        elif parent_id in self.input_parents and parent_id not in self.input_cyclic:
+                            # 父类在同一输入文件中但尚未创建，待其创建后再挂接
+                            # （成环的父类关系已作为错误报告，不再挂接以免形成继承环）
+                            self.pending_parents.setdefault(parent_iri, []).append(owl_class)
                 
-                # 其他对象属性关系（简化处理）
-                # 实际实现需要根据具体的OWL属性类型处理
+                # 其他指向术语ID的关系：SubClassOf(X ObjectSomeValuesFrom(p Y))
+                elif spec.type == 'id_list':
+                    prop = self._object_property(spec.property)
+                    if prop is None:
+                        continue
+                    for target_id in value:
+                        self._add_restriction(owl_class, prop, spec.name, target_id)
+    
+    def _object_property(self, curie: str):
+        """按 CURIE（如 BFO:0000051）查找本体中的对象属性，结果缓存"""
+        if curie not in self.object_properties:
+            property_iri = self._expand_curie(curie)
+            prop = self.ontology.world[property_iri] if property_iri else None
+            if not isinstance(prop, ObjectPropertyClass):
+                logger.error(f"对象属性不存在，相关关系字段将被忽略: {curie} ({property_iri})")
+                prop = None
+            self.object_properties[curie] = prop
+        return self.object_properties[curie]
+    
+    @staticmethod
+    def _target_term_id(target_id: str) -> str:
+        """关系目标ID统一为 TCH_XXXXXXX（与配置中 base_class 一样，允许写成 TCH:XXXXXXX）"""
+        if target_id.startswith('TCH:'):
+            return f"TCH_{target_id[len('TCH:'):]}"
+        return target_id
+    
+    def _target_iri(self, target_id: str) -> Optional[str]:
+        """关系目标ID转换为 IRI：TCH_XXXXXXX / TCH:XXXXXXX 为本体术语，其余按 CURIE（如 UBERON:0000948）展开"""
+        target_id = self._target_term_id(target_id)
+        if target_id.startswith('TCH_'):
+            return self._term_iri(target_id)
+        if ':' in target_id:
+            return self._expand_curie(target_id)
+        return None
+    
+    def _add_restriction(self, owl_class, prop, field_name: str, target_id: str):
+        """添加存在量词限定；目标在输入文件中但尚未创建时登记待添加，找不到时记录错误"""
+        target_iri = self._target_iri(target_id)
+        target = self.iri_index.get(target_iri)
+        if target is not None:
+            restriction = prop.some(target)
+            if restriction not in owl_class.is_a:
+                owl_class.is_a.append(restriction)
+        elif self._target_term_id(target_id) in self.input_parents:
+            self.pending_restrictions.setdefault(target_iri, []).append((owl_class, prop, field_name))
+        else:
+            self._record_error(
+                owl_class.iri.rsplit('/', 1)[-1], f"关系目标不存在: {target_id}（本体和输入文件中均未找到）",
+                field=field_name, rule='unresolved_target', value=target_id
+            )
     
     def import_terms(self, file_path: str, category: str, validate_only: bool = False):
         """
@@ -390,53 +972,876 @@ class TCHTermImporter:
             validate_only: 仅验证不导入
         """
         logger.info(f"开始导入术语 - 类别: {category}, 文件: {file_path}")
+        self._open_error_sink(category)
         
-        # 加载数据
-        df = self.load_terms_data(file_path)
-        self.stats['total'] = len(df)
+        # 检查点：定期保存本体并记录已提交的行数，中断后可用 --resume 继续
+        # 非增量模式下每个检查点都要完整序列化本体，因此只在 --incremental 下启用
+        if not validate_only and (self.resume or self.checkpoint_rows or self.checkpoint_seconds):
+            if self.incremental:
+                self._start_checkpoint(file_path, category)
+            elif self.resume:
+                logger.error("续传需要使用 --incremental（检查点只在增量保存模式下写入）")
+                sys.exit(1)
+            else:
+                logger.warning("检查点需要 --incremental，否则每个检查点都要完整保存本体；本次导入不保存检查点")
         
         # 加载本体
         if not validate_only:
             self.load_ontology()
         
-        # 逐行处理
-        for row_num, (idx, row) in enumerate(df.iterrows(), 1):
-            logger.info(f"处理第 {row_num}/{len(df)} 条术语: {row.get('tch_id', 'UNKNOWN')}")
-            
-            if validate_only:
-                # 仅验证
-                valid_id = self.validate_term_id(row['tch_id'], category)
-                valid_fields = self.validate_required_fields(row, category)
-                if valid_id and valid_fields:
-                    self.stats['success'] += 1
-                else:
-                    self.stats['failed'] += 1
-            else:
-                # 创建术语
-                self.create_term(row, category)
+        # 加载并处理数据
+        self._import_file(file_path, category, validate_only)
         
         # 保存本体（仅在成功导入术语时保存）
         if not validate_only:
-            if self.stats['success'] > 0:
-                try:
-                    # 保存前验证本体内容
-                    class_count = len(list(self.ontology.classes()))
-                    if class_count == 0:
-                        logger.error("本体中没有任何类，拒绝保存以避免数据丢失")
-                        logger.warning(f"可以从备份恢复: {self.ontology_path}.backup.*")
+            with self.profiler.phase('save'):
+                saved = self._save_ontology(category)
+            if saved:
+                self._clear_checkpoint()
+        
+        # 生成报告
+        with self.profiler.phase('report'):
+            self._generate_report(category, file_path, validate_only)
+        self._write_profile(category)
+    
+    def _import_file(self, file_path: str, category: str, validate_only: bool):
+        """逐块读取一个数据文件并验证或导入，结果累计到 self.stats"""
+        if self.error_sink is not None:
+            self.error_sink.source = str(file_path)
+        
+        if not validate_only:
+            # 第一遍：索引文件中全部 tch_id 及父类关系
+            with self.profiler.phase('index_input'):
+                self._index_input(file_path, category)
+        
+        # 多进程时，验证和字段解析在进程池中完成，只有本体修改留在主进程
+        pool = None
+        if self.workers > 1 and not validate_only:
+            self._plan(category)  # 在主进程中编译一次，子进程直接使用
+            pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_prepare_worker,
+                initargs=(self.config, str(self.ontology_path), self.plans)
+            )
+        
+        self._progress = None
+        try:
+            row_offset = 0
+            for chunk in self._profiled('load_terms_data', self.iter_terms_data(file_path, self._input_columns(category))):
+                self.stats['total'] += len(chunk)
+                with self.profiler.phase('row_loop'):
+                    self._process_terms(chunk, category, validate_only, row_offset, pool)
+                row_offset += len(chunk)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        
+        if not validate_only:
+            self._log_progress(row_offset, final=True)
+            self._report_pending_parents()
+    
+    def _index_input(self, file_path: str, category: str):
+        """
+        预扫描输入文件的 tch_id 和 parents 两列
+        
+        建立 tch_id -> 父类ID 的索引，按父类关系计算拓扑序（父类在前），
+        并一次性报告既不在本体中、也不在输入文件中的父类（悬空父类）。
+        """
+        parents_spec = self._field_spec(category, 'parents')
+        self.input_parents = {}
+        self.pending_parents = {}
+        
+        for chunk in self._iter_id_columns(file_path):
+            parents_column = chunk['parents'] if 'parents' in chunk.columns else [None] * len(chunk)
+            for term_id, parents in zip(chunk['tch_id'], parents_column):
+                if not isinstance(term_id, str):
+                    continue
+                self.input_parents[term_id] = parents_spec.parse(parents) or []
+        
+        # 续传时悬空父类和父类环已在中断前记录（计数随检查点恢复），不再重复记录
+        record_errors = not (self.checkpoint and self.checkpoint['committed_rows'])
+        
+        # 悬空父类
+        dangling = 0
+        for term_id, parent_ids in self.input_parents.items():
+            for parent_id in parent_ids:
+                if parent_id not in self.input_parents and self._term_iri(parent_id) not in self.iri_index:
+                    dangling += 1
+                    if record_errors:
+                        self._record_error(term_id, f"父类不存在: {parent_id}（本体和输入文件中均未找到）",
+                                           field='parents', rule='dangling_parent', value=parent_id)
+        if dangling:
+            logger.error(f"发现 {dangling} 个悬空父类引用，对应的 rdfs:subClassOf 将不会建立")
+        
+        self.input_rank = self._topological_rank(self.input_parents, record_errors)
+        logger.info(f"输入文件索引完成: {len(self.input_parents)} 个术语ID")
+    
+    def _iter_id_columns(self, file_path: str) -> Iterator[pd.DataFrame]:
+        """只读取 tch_id 和 parents 两列（CSV、Excel、Parquet/Arrow 按 chunk_size 分块）"""
+        usecols = lambda column: column in ('tch_id', 'parents')
+        try:
+            if Path(file_path).suffix.lower() == '.csv':
+                reader = pd.read_csv(
+                    file_path,
+                    encoding=self.config['import_options']['input_encoding'],
+                    delimiter=self.config['import_options']['csv_delimiter'],
+                    usecols=usecols,
+                    dtype=str,
+                    chunksize=self.chunk_size or None
+                )
+                if not self.chunk_size:
+                    yield reader.apply(lambda column: column.str.strip())
+                    return
+                with reader:
+                    for chunk in reader:
+                        yield chunk.apply(lambda column: column.str.strip())
+            elif Path(file_path).suffix.lower() in EXCEL_STREAM_SUFFIXES + COLUMNAR_SUFFIXES:
+                yield from self.iter_terms_data(file_path, ['tch_id', 'parents'])
+            else:
+                yield self.load_terms_data(file_path, ['tch_id', 'parents'])
+        except Exception as e:
+            logger.error(f"术语数据加载失败: {e}")
+            sys.exit(1)
+    
+    def _topological_rank(self, parents_map: Dict[str, List[str]], record_errors: bool = True) -> Dict[str, int]:
+        """
+        按文件内父类关系计算拓扑序（Kahn 算法），父类序号小于子类
+        
+        存在环的术语排在最后，record_errors 为 True 时作为错误记录。
+        """
+        children = {}
+        indegree = dict.fromkeys(parents_map, 0)
+        for term_id, parent_ids in parents_map.items():
+            for parent_id in parent_ids:
+                if parent_id in parents_map and parent_id != term_id:
+                    children.setdefault(parent_id, []).append(term_id)
+                    indegree[term_id] += 1
+        
+        queue = deque(term_id for term_id, degree in indegree.items() if degree == 0)
+        rank = {}
+        while queue:
+            term_id = queue.popleft()
+            rank[term_id] = len(rank)
+            for child in children.get(term_id, []):
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    queue.append(child)
+        
+        cyclic = [term_id for term_id in parents_map if term_id not in rank]
+        self.input_cyclic = set(cyclic)
+        if cyclic:
+            logger.error(f"父类关系存在环，涉及 {len(cyclic)} 个术语: {', '.join(cyclic[:10])}")
+            for term_id in cyclic:
+                rank[term_id] = len(rank)
+                if record_errors:
+                    self._record_error(term_id, "父类关系存在环", field='parents', rule='parent_cycle')
+        return rank
+    
+    def _report_pending_parents(self):
+        """报告文件处理完后仍未能挂接的父类和关系目标（目标行本身创建失败）"""
+        for parent_iri, children in self.pending_parents.items():
+            for child in children:
+                self._record_error(child.name, f"父类未能创建，rdfs:subClassOf 未建立: {parent_iri}",
+                                   field='parents', rule='parent_not_created', value=parent_iri)
+        if self.pending_parents:
+            logger.error(f"{len(self.pending_parents)} 个文件内父类未能创建，相关子类缺少父类关系")
+        self.pending_parents = {}
+        
+        for target_iri, subjects in self.pending_restrictions.items():
+            for subject, prop, field_name in subjects:
+                self._record_error(subject.iri.rsplit('/', 1)[-1], f"关系目标未能创建，限定未建立: {target_iri}",
+                                   field=field_name, rule='target_not_created', value=target_iri)
+        if self.pending_restrictions:
+            logger.error(f"{len(self.pending_restrictions)} 个文件内关系目标未能创建，相关限定未建立")
+        self.pending_restrictions = {}
+    
+    def _process_terms(self, df: pd.DataFrame, category: str, validate_only: bool, row_offset: int = 0,
+                       pool: Optional[ProcessPoolExecutor] = None):
+        """
+        验证或逐行创建一块数据中的术语，结果累计到 self.stats
+        
+        Args:
+            df: 术语数据（整个文件或其中一块）
+            category: 术语类别
+            validate_only: 仅验证不导入
+            row_offset: 本块第一行之前已处理的行数，用于行号
+            pool: 验证和解析字段使用的进程池，None 时在主进程中逐行处理
+        """
+        if validate_only:
+            # 仅验证：整块列式验证
+            errors = self.validate_dataframe(df, category, row_offset)
+            self._record_validation_errors(errors)
+            failed_rows = errors['row'].nunique()
+            self.stats['failed'] += failed_rows
+            self.stats['success'] += len(df) - failed_rows
+        else:
+            # 按父类关系的拓扑序逐行创建术语，行号仍对应原文件顺序
+            positions = list(range(len(df)))
+            if self.input_rank and 'tch_id' in df.columns:
+                ranks = [self.input_rank.get(term_id, -1) for term_id in df['tch_id']]
+                positions.sort(key=ranks.__getitem__)
+            
+            # 续传：按同样的处理顺序跳过检查点之前已提交的行
+            done = self.checkpoint['committed_rows'] - row_offset if self.checkpoint else 0
+            if done > 0:
+                self._restore_committed(df.iloc[positions[:done]], category)
+                positions = positions[done:]
+                if not positions:
+                    return
+            
+            # 整块列式验证，错误逐条写入错误文件，验证失败的行不再逐行创建
+            errors = self.validate_dataframe(df, category, row_offset)
+            if done > 0:
+                errors = errors[errors['row'].isin([row_offset + position + 1 for position in positions])]
+            self._record_validation_errors(errors)
+            invalid = set(errors['row'] - row_offset - 1)
+            self.stats['failed'] += len(invalid)
+            
+            # 只把通过列式验证、尚未提交的行发送到进程池
+            prepared = None
+            if pool is not None:
+                prepared = self._prepare_rows_parallel(
+                    df, [position for position in positions if position not in invalid], category, pool
+                )
+            
+            total = '' if self.chunk_size else f"/{len(df)}"
+            processed = row_offset + max(done, 0)
+            for position, (idx, row) in zip(positions, df.iloc[positions].iterrows()):
+                started = time.perf_counter()
+                written = self.stats['success'] + self.stats['changed']
+                if position not in invalid:
+                    logger.debug(f"处理第 {row_offset + position + 1}{total} 条术语: {row.get('tch_id', 'UNKNOWN')}")
+                    if prepared is None:
+                        self.create_term(row, category, validated=True)
                     else:
-                        # 明确指定格式为 OFN (OWL Functional Syntax)
-                        self.ontology.save(file=str(self.ontology_path), format="ofn")
-                        logger.info(f"本体文件保存成功: {self.ontology_path} (包含 {class_count} 个类)")
-                except Exception as e:
-                    logger.error(f"本体文件保存失败: {e}")
-                    logger.warning(f"可以从备份恢复: {self.ontology_path}.backup.*")
+                        self.create_term(row, category, prepared[position])
+                # 只有创建或更新了术语的行计入耗时分位数，跳过的行单独计数
+                self.profiler.record_row(
+                    time.perf_counter() - started,
+                    skipped=self.stats['success'] + self.stats['changed'] == written
+                )
+                
+                processed += 1
+                self._log_progress(processed)
+                if self.checkpoint:
+                    self._maybe_checkpoint(category, processed)
+    
+    def _profiled(self, phase: str, iterator: Iterator) -> Iterator:
+        """逐项迭代，每次取下一项的耗时计入指定阶段（用于分块读取数据）"""
+        iterator = iter(iterator)
+        while True:
+            with self.profiler.phase(phase):
+                item = next(iterator, None)
+            if item is None:
+                return
+            yield item
+    
+    def _log_progress(self, processed: int, final: bool = False):
+        """按 import_options.progress_interval 秒限频输出一行进度（已处理行数、行/秒）"""
+        now = time.monotonic()
+        if self._progress is None:
+            if not final:
+                self._progress = (now, now, processed)
+            return
+        start, last, start_rows = self._progress
+        if not final and now - last < self.config['import_options'].get('progress_interval', 5):
+            return
+        
+        self._progress = (start, now, start_rows)
+        rate = (processed - start_rows) / max(now - start, 1e-9)
+        total = '' if self.chunk_size else f"/{self.stats['total']}"
+        logger.info(f"进度: 已处理 {processed}{total} 行, {rate:.0f} 行/秒, "
+                    f"成功 {self.stats['success']}, 失败 {self.stats['failed']}")
+    
+    def _checkpoint_path(self) -> Path:
+        """检查点文件路径（相对于本体文件所在目录）"""
+        checkpoint_file = self.config['import_options'].get('checkpoint_file', 'tmp/term-import-checkpoint.json')
+        return self.ontology_path.parent / checkpoint_file
+    
+    def _start_checkpoint(self, file_path: str, category: str):
+        """
+        开启检查点；续传时读取上次的检查点并恢复分块大小和统计
+        
+        检查点记录输入文件（路径、大小、修改时间）、类别和按处理顺序已提交的行数。
+        处理顺序（分块内按父类拓扑序）对同一文件是确定的，因此续传时可按同样顺序跳过。
+        """
+        input_stat = os.stat(file_path)
+        state = {
+            'input': os.path.abspath(file_path),
+            'input_size': input_stat.st_size,
+            'input_mtime': input_stat.st_mtime,
+            'category': category,
+            'chunk_size': self.chunk_size,
+            'committed_rows': 0,
+        }
+        
+        if self.resume:
+            checkpoint_path = self._checkpoint_path()
+            try:
+                with open(checkpoint_path, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+            except FileNotFoundError:
+                logger.error(f"未找到检查点文件，无法续传: {checkpoint_path}")
+                sys.exit(1)
+            
+            for key in ('input', 'input_size', 'input_mtime', 'category'):
+                if saved.get(key) != state[key]:
+                    logger.error(f"检查点与本次导入不一致（{key}: {saved.get(key)} != {state[key]}），无法续传")
+                    sys.exit(1)
+            
+            # 分块大小决定处理顺序，续传时必须与中断前一致
+            self.chunk_size = saved['chunk_size']
+            state.update(chunk_size=saved['chunk_size'], committed_rows=saved['committed_rows'])
+            for key, value in saved.get('stats', {}).items():
+                self.stats[key] = value
+            logger.info(f"从检查点继续导入: 已提交 {saved['committed_rows']} 行 (保存于 {saved.get('updated')})")
+        
+        self.checkpoint = state
+        self._last_checkpoint = (state['committed_rows'], time.monotonic())
+    
+    def _maybe_checkpoint(self, category: str, processed: int):
+        """达到行数或时间间隔时保存本体并写入检查点"""
+        last_rows, last_time = self._last_checkpoint
+        if not ((self.checkpoint_rows and processed - last_rows >= self.checkpoint_rows) or
+                (self.checkpoint_seconds and time.monotonic() - last_time >= self.checkpoint_seconds)):
+            return
+        
+        with self.profiler.phase('save'):
+            saved = self._save_ontology(category)
+        if not saved:
+            logger.error("检查点保存失败，检查点仍停留在上一次成功保存的位置")
+            return
+        self.checkpoint['committed_rows'] = processed
+        self._write_checkpoint()
+        self._last_checkpoint = (processed, time.monotonic())
+        logger.info(f"检查点已保存: 已提交 {processed} 行")
+    
+    def _write_checkpoint(self):
+        """原子写入检查点文件"""
+        checkpoint_path = self._checkpoint_path()
+        checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        state = dict(
+            self.checkpoint,
+            updated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            stats={key: value for key, value in self.stats.items() if key not in ('total', 'errors')},
+        )
+        tmp_path = checkpoint_path.with_name(f".{checkpoint_path.name}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, checkpoint_path)
+    
+    def _clear_checkpoint(self):
+        """导入完成后删除检查点"""
+        if self.checkpoint:
+            self._checkpoint_path().unlink(missing_ok=True)
+            self.checkpoint = None
+    
+    def _restore_committed(self, rows: pd.DataFrame, category: str):
+        """
+        续传时恢复已提交行的内存状态
+        
+        这些术语已在本体文件中；若其文件内父类或关系目标尚未创建，重新登记待挂接关系。
+        """
+        relation_specs = [
+            spec for spec in self._plan(category).fields
+            if spec.type == 'id_list' and spec.property != 'rdfs:subClassOf' and spec.name in rows.columns
+        ]
+        for (_, row), term_id in zip(rows.iterrows(), rows['tch_id']):
+            if not isinstance(term_id, str):
+                continue
+            owl_class = self.iri_index.get(self._term_iri(term_id))
+            if owl_class is None:
+                continue
+            self.flushed_iris.add(owl_class.iri)
+            for parent_id in self.input_parents.get(term_id, []):
+                parent_iri = self._term_iri(parent_id)
+                if (parent_iri not in self.iri_index and parent_id in self.input_parents
+                        and parent_id not in self.input_cyclic):
+                    self.pending_parents.setdefault(parent_iri, []).append(owl_class)
+            for spec in relation_specs:
+                prop = self._object_property(spec.property)
+                if prop is None:
+                    continue
+                for target_id in spec.parse(row[spec.name]) or []:
+                    target_iri = self._target_iri(target_id)
+                    if target_iri not in self.iri_index and self._target_term_id(target_id) in self.input_parents:
+                        self.pending_restrictions.setdefault(target_iri, []).append((owl_class, prop, spec.name))
+    
+    def _prepare_rows_parallel(self, df: pd.DataFrame, positions: List[int], category: str,
+                               pool: ProcessPoolExecutor) -> Dict[int, Dict[str, Any]]:
+        """
+        在进程池中解析指定行的字段（行已通过列式验证）
+        
+        按 workers 切分为分片，只发送这些行；返回 行位置 -> 解析后的字段值
+        """
+        if not positions:
+            return {}
+        rows = df.iloc[positions]
+        shard_size = -(-len(rows) // self.workers)
+        shards = [rows.iloc[start:start + shard_size] for start in range(0, len(rows), shard_size)]
+        
+        prepared = chain.from_iterable(pool.map(_prepare_shard, shards, [category] * len(shards)))
+        return dict(zip(positions, prepared))
+    
+    def import_manifest(self, manifest_path: str, validate_only: bool = False):
+        """
+        按清单批量导入多个类别
+        
+        配置和本体只加载一次，各类别按依赖顺序导入，全部完成后只保存一次，
+        并生成包含各类别统计的合并报告。
+        
+        Args:
+            manifest_path: 清单文件路径 (YAML)
+            validate_only: 仅验证不导入
+        """
+        entries = self._load_manifest(manifest_path)
+        order = self._category_import_order({category for category, _ in entries})
+        entries.sort(key=lambda entry: order.index(entry[0]))
+        logger.info(f"开始清单导入: {manifest_path}, 共 {len(entries)} 个文件, "
+                    f"类别顺序: {' -> '.join(dict.fromkeys(c for c, _ in entries))}")
+        
+        self._open_error_sink('manifest')
+        
+        if not validate_only:
+            self.load_ontology()
+        
+        results = []
+        for category, file_path in entries:
+            logger.info(f"开始导入术语 - 类别: {category}, 文件: {file_path}")
+            self.stats = self._new_stats()
+            self._import_file(file_path, category, validate_only)
+            results.append((category, file_path, self.stats))
+        
+        # 汇总各类别统计，用于保存判断和合并报告
+        self.stats = self._new_stats()
+        for _, _, stats in results:
+            for key in ('total', 'success', 'failed', 'skipped', 'changed', 'unchanged', 'error_count'):
+                self.stats[key] += stats[key]
+            self.stats['errors'].extend(stats['errors'])
+        
+        if not validate_only:
+            with self.profiler.phase('save'):
+                self._save_ontology(', '.join(dict.fromkeys(c for c, _ in entries)))
+        
+        with self.profiler.phase('report'):
+            self._generate_manifest_report(manifest_path, results, validate_only)
+        self._write_profile('manifest')
+    
+    def _load_manifest(self, manifest_path: str) -> List[tuple]:
+        """
+        加载导入清单
+        
+        清单格式:
+            imports:
+              - category: pattern
+                input: pattern_terms.csv
+        
+        input 为相对路径时以清单文件所在目录为准。
+        
+        Returns:
+            (类别, 文件路径) 列表，保持清单中的顺序
+        """
+        try:
+            manifest_path = Path(manifest_path)
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = yaml.safe_load(f)
+            
+            entries = []
+            for item in manifest['imports']:
+                category = item['category']
+                if category not in CATEGORIES:
+                    raise ValueError(f"未知的术语类别: {category}")
+                file_path = Path(item['input'])
+                if not file_path.is_absolute():
+                    file_path = manifest_path.parent / file_path
+                if not file_path.exists():
+                    raise FileNotFoundError(f"清单中的数据文件不存在: {file_path}")
+                entries.append((category, str(file_path)))
+            
+            logger.info(f"导入清单加载成功: {manifest_path}, 共 {len(entries)} 项")
+            return entries
+        except Exception as e:
+            logger.error(f"导入清单加载失败: {e}")
+            sys.exit(1)
+    
+    def _category_import_order(self, categories: set) -> List[str]:
+        """
+        根据配置中关系字段的 target_class 计算类别导入顺序
+        
+        被引用类别（目标基类所属类别）先于引用它的类别导入；存在相互引用
+        （如 pattern 与 pathomechanism）时按 DEFAULT_IMPORT_ORDER 打破循环。
+        """
+        category_fields = self.config['category_specific_fields']
+        base_to_category = {
+            category_fields[c]['base_class']: c for c in categories if 'base_class' in category_fields.get(c, {})
+        }
+        
+        depends_on = {category: set() for category in categories}
+        for category in categories:
+            for field_config in category_fields.get(category, {}).values():
+                if not isinstance(field_config, dict) or 'property' not in field_config:
+                    continue
+                target = base_to_category.get(field_config.get('target_class'))
+                if target and target != category:
+                    depends_on[category].add(target)
+        
+        order = []
+        remaining = sorted(categories, key=DEFAULT_IMPORT_ORDER.index)
+        while remaining:
+            ready = [c for c in remaining if not (depends_on[c] - set(order))]
+            # 相互引用时取默认顺序最靠前的类别
+            chosen = ready[0] if ready else remaining[0]
+            order.append(chosen)
+            remaining.remove(chosen)
+        return order
+    
+    def plan_import(self, file_path: str, category: str, output_path: Optional[str] = None) -> pd.DataFrame:
+        """
+        生成导入计划（演练），不修改本体文件、也不备份
+        
+        以只读方式加载本体，用输入文件的 tch_id 列与 IRI 索引做集合运算，
+        给出每行将被创建、因已存在而跳过还是因验证失败被拒绝，以及无法解析的父类。
+        
+        Args:
+            file_path: 术语数据文件路径
+            category: 术语类别
+            output_path: 计划输出路径（.json 输出 JSON，其余输出 CSV），
+                         默认 term_import_plan_{category}_{时间戳}_{运行标识}.csv
+            
+        Returns:
+            计划表，列为 row, tch_id, action, field, rule, detail
+        """
+        logger.info(f"开始生成导入计划 - 类别: {category}, 文件: {file_path}")
+        self.load_ontology(backup=False)
+        
+        parents_spec = self._field_spec(category, 'parents')
+        frames = []
+        parent_frames = []
+        row_offset = 0
+        for chunk in self.iter_terms_data(file_path, self._input_columns(category)):
+            row_nums = pd.Series(range(row_offset + 1, row_offset + len(chunk) + 1), index=chunk.index)
+            ids = chunk['tch_id'] if 'tch_id' in chunk.columns else pd.Series(pd.NA, index=chunk.index, dtype=object)
+            
+            # 验证失败的行：每条错误一行
+            errors = self.validate_dataframe(chunk, category, row_offset)
+            rejected = row_nums.isin(errors['row'])
+            frames.append(pd.DataFrame({
+                'row': errors['row'],
+                'tch_id': errors['tch_id'],
+                'action': 'reject',
+                'field': errors['field'],
+                'rule': errors['rule'],
+                'detail': errors['message'],
+            }))
+            
+            # 通过验证的行：tch_id 与 IRI 索引求交即为已存在
+            valid_ids = ids[~rejected].astype(str)
+            exists = valid_ids.map(self._term_iri).isin(self.iri_index.keys())
+            frames.append(pd.DataFrame({
+                'row': row_nums[~rejected],
+                'tch_id': valid_ids,
+                'action': exists.map({True: 'skip', False: 'create'}),
+                'field': None,
+                'rule': None,
+                'detail': exists.map({True: '本体中已存在', False: None}),
+            }))
+            
+            if 'parents' in chunk.columns:
+                parents = chunk.loc[~rejected, 'parents'].map(parents_spec.parse).explode().dropna()
+                parent_frames.append(pd.DataFrame({
+                    'row': row_nums[parents.index],
+                    'tch_id': ids[parents.index],
+                    'parent': parents,
+                }))
+            row_offset += len(chunk)
+        
+        plan = pd.concat(frames, ignore_index=True).sort_values('row', kind='stable', ignore_index=True)
+        
+        # 文件内重复的ID：只有第一次出现会被创建
+        creates = plan['action'].eq('create')
+        duplicated = creates & plan['tch_id'].where(creates).duplicated()
+        plan.loc[duplicated, 'action'] = 'skip'
+        plan.loc[duplicated, 'detail'] = '文件内重复'
+        
+        # 父类既不在本体中，也不是本次将创建的术语
+        if parent_frames:
+            parents = pd.concat(parent_frames, ignore_index=True)
+            created_ids = set(plan.loc[plan['action'].eq('create'), 'tch_id'])
+            resolved = parents['parent'].isin(created_ids) | \
+                parents['parent'].map(self._term_iri).isin(self.iri_index.keys())
+            unresolved = parents[~resolved]
+            plan = pd.concat([plan, pd.DataFrame({
+                'row': unresolved['row'],
+                'tch_id': unresolved['tch_id'],
+                'action': 'unresolved_parent',
+                'field': 'parents',
+                'rule': None,
+                'detail': unresolved['parent'],
+            })], ignore_index=True).sort_values('row', kind='stable', ignore_index=True)
+        
+        summary = plan.drop_duplicates(['row', 'action'])['action'].value_counts()
+        logger.info(
+            f"导入计划: 创建 {summary.get('create', 0)}, 跳过 {summary.get('skip', 0)}, "
+            f"拒绝 {summary.get('reject', 0)}, 父类未解析 {(plan['action'] == 'unresolved_parent').sum()}"
+        )
+        
+        if output_path is None:
+            output_path = self._output_file('plan', category, 'csv')
+        if Path(output_path).suffix.lower() == '.json':
+            plan.to_json(output_path, orient='records', force_ascii=False, indent=2)
+        else:
+            plan.to_csv(output_path, index=False, encoding='utf-8')
+        logger.info(f"导入计划已保存: {output_path}")
+        return plan
+    
+    def emit_component(self, file_path: str, category: str, output_path: Optional[str] = None) -> int:
+        """
+        将术语数据直接写出为 OFN 组件文件（批量导入）
+        
+        不加载本体、不创建 owlready2 类：逐块列式验证后，把通过验证的行按
+        term-import-config.yaml 的字段映射直接转换为 OFN 公理并流式写出，
+        内存占用与术语数量无关。生成的文件可在 tch-edit.owl 中 Import。
+        
+        Args:
+            file_path: 术语数据文件路径
+            category: 术语类别
+            output_path: 组件文件路径，默认为本体目录下 components/{category}_terms.owl
+            
+        Returns:
+            写入的公理条数
+        """
+        logger.info(f"开始生成组件文件 - 类别: {category}, 文件: {file_path}")
+        self._open_error_sink(category)
+        
+        if output_path is None:
+            output_path = Path(self.ontology_path).parent / 'components' / f"{category}_terms.owl"
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # 组件 IRI 与 ODK 约定一致: http://purl.obolibrary.org/obo/tch/components/xxx.owl
+        ontology_iri = self.config['general']['ontology_iri']
+        component_iri = f"{ontology_iri[:-len('.owl')]}/components/{output_path.name}"
+        
+        fields = self._component_fields(category)
+        header = [
+            declaration('AnnotationProperty', property_iri)
+            for property_iri in dict.fromkeys(iri for _, kind, iri in fields if kind == 'annotation')
+            if not property_iri.startswith(STANDARD_PREFIXES['rdfs'])
+        ]
+        header += [
+            declaration('ObjectProperty', property_iri)
+            for property_iri in dict.fromkeys(iri for _, kind, iri in fields if kind == 'some')
+        ]
+        
+        count = write_ontology(
+            output_path, component_iri,
+            chain(header, self._iter_component_axioms(file_path, category, fields)),
+            comment=f"Generated from {Path(file_path).name} ({category}, {datetime.now().strftime('%Y-%m-%d %H:%M:%S')})"
+        )
+        logger.info(f"组件文件已生成: {output_path} ({self.stats['success']} 个术语, {count} 条公理)")
+        logger.info(f"在 tch-edit.owl 中添加 Import(<{component_iri}>) 并在 catalog-v001.xml 中登记后生效")
+        
+        self._generate_report(category, file_path, validate_only=False)
+        return count
+    
+    def _expand_curie(self, curie: str) -> Optional[str]:
+        """将配置中的属性 CURIE（如 IAO:0000115、rdfs:label）展开为完整 IRI"""
+        prefix, _, local = curie.partition(':')
+        if prefix in STANDARD_PREFIXES:
+            return STANDARD_PREFIXES[prefix] + local
+        namespace = self.config.get('external_prefixes', {}).get(prefix)
+        return namespace + local if namespace else None
+    
+    def _component_fields(self, category: str) -> List[tuple]:
+        """
+        组件文件需要写出的字段：[(FieldSpec, 'subclass'|'some'|'annotation', 属性IRI)]
+        
+        字面量字段写为 AnnotationAssertion；rdfs:subClassOf 写为 SubClassOf；
+        其他 id_list 关系字段写为 SubClassOf(X ObjectSomeValuesFrom(p Y))。
+        对象属性（BFO/RO）上的字面量字段无法表示为公理，不写出。
+        """
+        fields = []
+        for spec in self._plan(category).fields:
+            if spec.property == 'rdf:about':
+                continue
+            if spec.property == 'rdfs:subClassOf':
+                fields.append((spec, 'subclass', None))
+                continue
+            is_relation = spec.type == 'id_list'
+            if not is_relation and spec.property.split(':')[0] in ('BFO', 'RO'):
+                continue
+            
+            property_iri = self._expand_curie(spec.property)
+            if property_iri is None:
+                logger.warning(f"属性前缀未在 external_prefixes 中定义，跳过字段 {spec.name}: {spec.property}")
+                continue
+            fields.append((spec, 'some' if is_relation else 'annotation', property_iri))
+        return fields
+    
+    def _iter_component_axioms(self, file_path: str, category: str, fields: List[tuple]) -> Iterator[str]:
+        """逐块验证并生成组件公理，验证结果累计到 self.stats"""
+        base_class_iri = self._plan(category).base_class_iri
+        if self.error_sink is not None:
+            self.error_sink.source = str(file_path)
+        row_offset = 0
+        for chunk in self.iter_terms_data(file_path, self._input_columns(category)):
+            self.stats['total'] += len(chunk)
+            errors = self.validate_dataframe(chunk, category, row_offset)
+            self._record_validation_errors(errors)
+            valid = ~pd.Series(range(row_offset + 1, row_offset + len(chunk) + 1), index=chunk.index).isin(errors['row'])
+            self.stats['failed'] += int((~valid).sum())
+            self.stats['success'] += int(valid.sum())
+            row_offset += len(chunk)
+            
+            chunk = chunk[valid]
+            present = [field for field in fields if field[0].name in chunk.columns]
+            columns = [chunk[spec.name] for spec, _, _ in present]
+            for term_id, *values in zip(chunk['tch_id'], *columns):
+                term_iri = self._term_iri(term_id)
+                yield declaration('Class', term_iri)
+                yield sub_class_of(term_iri, base_class_iri)
+                
+                for (spec, kind, property_iri), value in zip(present, values):
+                    value = spec.parse(value)
+                    if value is None:
+                        continue
+                    if kind == 'subclass':
+                        for parent_id in value:
+                            parent_iri = self._term_iri(parent_id)
+                            if parent_iri != base_class_iri:
+                                yield sub_class_of(term_iri, parent_iri)
+                    elif kind == 'some':
+                        for target_id in value:
+                            target_iri = self._target_iri(target_id)
+                            if target_iri is None:
+                                self._record_error(term_id, f"关系目标ID无法解析: {target_id}",
+                                                   field=spec.name, rule='unresolved_target', value=target_id)
+                                continue
+                            yield sub_class_of_some(term_iri, property_iri, target_iri)
+                    else:
+                        for item in (value if isinstance(value, list) else [value]):
+                            yield annotation_assertion(property_iri, term_iri, item, spec.lang)
+    
+    def _save_ontology(self, category: str) -> bool:
+        """
+        保存本体（仅在成功导入或更新术语时保存）
+        
+        --incremental 下只追加新术语的公理；若 --upsert 更新了已有术语，
+        旧公理无法通过追加移除，此时改为完整保存并记录警告。
+        
+        Returns:
+            本体文件是否与内存状态一致（保存成功或无需保存）
+        """
+        if self.stats['success'] + self.stats['changed'] == 0:
+            logger.warning("没有成功导入或更新任何术语，不保存本体文件以避免数据丢失")
+            logger.info(f"原始文件保持不变: {self.ontology_path}")
+            return True
+        
+        try:
+            # 保存前验证本体内容
+            class_count = len(list(self.ontology.classes()))
+            if class_count == 0:
+                logger.error("本体中没有任何类，拒绝保存以避免数据丢失")
+                logger.warning("可以从备份恢复: python backup_store.py list / restore <时间戳>")
+                return False
+            
+            if self.incremental and self.stats['changed'] == 0:
+                # 仅追加新术语的公理，不重新序列化整个本体
+                axioms = [declaration('AnnotationProperty', prop.iri) for prop in self.new_properties]
+                axioms += [axiom for owl_class in self.new_classes for axiom in self._class_axioms(owl_class)]
+                axioms += self.pending_axioms
+                count = splice_axioms(
+                    self.ontology_path, axioms,
+                    comment=f"Imported {category} terms ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})"
+                )
+                self.flushed_iris.update(owl_class.iri for owl_class in self.new_classes)
+                self.new_classes = []
+                self.new_properties = []
+                self.pending_axioms = []
+                logger.info(f"本体文件增量写入成功: {self.ontology_path} (追加 {count} 条公理)")
             else:
-                logger.warning("没有成功导入任何术语，不保存本体文件以避免数据丢失")
-                logger.info(f"原始文件保持不变: {self.ontology_path}")
+                if self.incremental:
+                    # 追加写入只能新增公理，无法删除已更新术语的旧公理，因此 upsert 更新后必须完整保存
+                    logger.warning(
+                        f"--upsert 更新了 {self.stats['changed']} 个已有术语，增量写入无法移除旧公理，"
+                        f"本次改为完整保存本体"
+                    )
+                # 明确指定格式为 OFN (OWL Functional Syntax)
+                self.ontology.save(file=str(self.ontology_path), format="ofn")
+                logger.info(f"本体文件保存成功: {self.ontology_path} (包含 {class_count} 个类)")
+            self._refresh_world_cache()
+            return True
+        except Exception as e:
+            logger.error(f"本体文件保存失败: {e}")
+            logger.warning("可以从备份恢复: python backup_store.py list / restore <时间戳>")
+            return False
+    
+    def _class_axioms(self, owl_class) -> List[str]:
+        """
+        生成新建类的 OFN 公理
         
-        # 生成报告
-        self._generate_report(category, file_path, validate_only)
+        包括 Declaration、标签/注释/内容指纹的 AnnotationAssertion、指向命名类的 SubClassOf
+        以及 ObjectSomeValuesFrom 关系限定
+        """
+        iri = owl_class.iri
+        axioms = [declaration('Class', iri)]
+        for value in owl_class.label:
+            axioms.append(annotation_assertion(RDFS_LABEL, iri, value, getattr(value, 'lang', None)))
+        for value in owl_class.comment:
+            axioms.append(annotation_assertion(RDFS_COMMENT, iri, value, getattr(value, 'lang', None)))
+        if iri in self.fingerprints:
+            axioms.append(annotation_assertion(self.fingerprint_property.iri, iri, self.fingerprints[iri]))
+        for parent in owl_class.is_a:
+            if hasattr(parent, 'iri'):
+                axioms.append(sub_class_of(iri, parent.iri))
+            elif (isinstance(parent, Restriction) and parent.type == SOME
+                  and hasattr(parent.property, 'iri') and hasattr(parent.value, 'iri')):
+                axioms.append(sub_class_of_some(iri, parent.property.iri, parent.value.iri))
+        return axioms
+    
+    def _output_file(self, kind: str, name: str, suffix: str) -> str:
+        """
+        本次运行的输出文件名: term_import_{kind}_{name}_{开始时间}_{运行标识}.{suffix}
+        
+        时间戳只精确到秒，运行标识保证同一秒内的多次运行（如常驻服务中并发的验证任务）互不覆盖
+        """
+        return f"term_import_{kind}_{name}_{self.run_started}_{self.run_id}.{suffix}"
+    
+    def _open_error_sink(self, name: str):
+        """为本次运行创建错误文件（首条错误写入时才创建）"""
+        if self.error_sink is not None:
+            self.error_sink.close()
+        fmt = self.config['import_options'].get('error_sink_format', 'jsonl')
+        self.error_sink = ErrorSink(self._output_file('errors', name, fmt), fmt)
+    
+    def _record_error(self, term_id: Any, message: str, row: Optional[int] = None, field: Optional[str] = None,
+                      rule: Optional[str] = None, value: Any = None):
+        """记录一条错误：写入错误文件，内存中只保留计数和前几条样例"""
+        if value is not None and not isinstance(value, (list, tuple)) and pd.isna(value):
+            value = None
+        self.stats['error_count'] += 1
+        if len(self.stats['errors']) < ERROR_SAMPLE_SIZE:
+            prefix = f"第 {row} 行 {field}: " if row is not None and field else ''
+            self.stats['errors'].append({
+                'term_id': term_id if isinstance(term_id, str) else 'UNKNOWN',
+                'error': f"{prefix}{message}"
+            })
+        if self.error_sink is not None:
+            self.error_sink.write(term_id, message, row=row, field=field, rule=rule, value=value)
+    
+    def _record_validation_errors(self, errors: pd.DataFrame):
+        """按字段和规则汇总记录验证错误"""
+        if errors.empty:
+            return
+        
+        for (field, rule), count in errors.groupby(['field', 'rule'], sort=False).size().items():
+            logger.error(f"验证失败: 字段 {field}, 规则 {rule}, 共 {count} 行")
+        
+        for error in errors.itertuples(index=False):
+            self._record_error(
+                error.tch_id if not pd.isna(error.tch_id) else None, error.message,
+                row=error.row, field=error.field, rule=error.rule, value=error.value
+            )
     
     def _generate_report(self, category: str, file_path: str, validate_only: bool):
         """生成导入报告"""
@@ -456,27 +1861,112 @@ TCH 本体术语导入报告
 成功: {self.stats['success']}
 失败: {self.stats['failed']}
 跳过: {self.stats['skipped']}
+"""
+        if self.upsert:
+            report += (f"新增: {self.stats['success']}  更新: {self.stats['changed']}  "
+                       f"未变化: {self.stats['unchanged']}\n")
+        report += "\n"
+
+        report += self._format_errors(self.stats)
+        report += self._error_sink_note()
+        report += f"\n{'='*80}\n"
+        
+        self._write_report(report, category)
+    
+    def _generate_manifest_report(self, manifest_path: str, results: List[tuple], validate_only: bool):
+        """生成清单导入的合并报告"""
+        report = f"""
+{'='*80}
+TCH 本体术语导入报告（清单导入）
+{'='*80}
+
+导入时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+清单文件: {manifest_path}
+操作模式: {'仅验证' if validate_only else '导入'}
 
+各类别统计:
+-----------
 """
+        report += "| 类别 | 总计 | 成功 | 失败 | 跳过 | 更新 | 未变化 | 数据文件 |\n"
+        report += "|------|------|------|------|------|------|--------|----------|\n"
+        for category, file_path, stats in results:
+            report += (f"| {category} | {stats['total']} | {stats['success']} | "
+                       f"{stats['failed']} | {stats['skipped']} | {stats['changed']} | "
+                       f"{stats['unchanged']} | {file_path} |\n")
+        report += (f"| 合计 | {self.stats['total']} | {self.stats['success']} | "
+                   f"{self.stats['failed']} | {self.stats['skipped']} | {self.stats['changed']} | "
+                   f"{self.stats['unchanged']} | |\n")
         
-        if self.stats['errors']:
-            report += "\n错误详情:\n-----------\n"
-            for error in self.stats['errors'][:10]:  # 只显示前10个错误
-                report += f"- {error['term_id']}: {error['error']}\n"
-            
-            if len(self.stats['errors']) > 10:
-                report += f"\n... 还有 {len(self.stats['errors']) - 10} 个错误\n"
+        for category, file_path, stats in results:
+            if stats['errors']:
+                report += f"\n[{category}] {file_path}"
+                report += self._format_errors(stats)
+        report += self._error_sink_note()
         
         report += f"\n{'='*80}\n"
         
+        self._write_report(report, 'manifest')
+    
+    @staticmethod
+    def _format_errors(stats: Dict) -> str:
+        """格式化错误详情（只显示前几条样例，完整列表见错误文件）"""
+        errors = stats['errors']
+        if not errors:
+            return ''
+        
+        text = "\n错误详情:\n-----------\n"
+        for error in errors[:ERROR_SAMPLE_SIZE]:
+            text += f"- {error['term_id']}: {error['error']}\n"
+        
+        shown = min(len(errors), ERROR_SAMPLE_SIZE)
+        if stats['error_count'] > shown:
+            text += f"\n... 还有 {stats['error_count'] - shown} 个错误\n"
+        return text
+    
+    def _error_sink_note(self) -> str:
+        """关闭错误文件，返回报告中指向完整错误列表的说明"""
+        if self.error_sink is None:
+            return ''
+        self.error_sink.close()
+        if not self.error_sink.count:
+            return ''
+        return f"\n完整错误列表（{self.error_sink.count} 条）: {self.error_sink.path}\n"
+    
+    def _write_report(self, report: str, name: str):
+        """打印报告并按配置保存到文件"""
+        self.last_report = report
         print(report)
         
         # 保存报告到文件
         if self.config['import_options']['generate_report']:
-            report_file = f"term_import_report_{category}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            report_file = self._output_file('report', name, 'txt')
             with open(report_file, 'w', encoding='utf-8') as f:
                 f.write(report)
             logger.info(f"导入报告已保存: {report_file}")
+    
+    def _write_profile(self, name: str):
+        """--profile 时将各阶段耗时和内存峰值写入 JSON（与导入报告位于同一目录）"""
+        profile_file = self.profiler.write(self._output_file('profile', name, 'json'))
+        if profile_file:
+            logger.info(f"性能记录已保存: {profile_file}")
+
+
+# 进程池子进程中的导入器（只做验证和解析，不加载本体）
+_worker_importer = None
+
+
+def _init_prepare_worker(config: Dict, ontology_path: str, plans: Dict[str, CategoryPlan]):
+    """进程池初始化：用主进程已加载的配置和导入计划创建导入器"""
+    global _worker_importer
+    # fork 出的子进程中没有队列监听线程，直接写入文件和终端
+    logging.getLogger().handlers[:] = _log_handlers
+    _worker_importer = TCHTermImporter(config_path='', ontology_path=ontology_path, config=config)
+    _worker_importer.plans = plans
+
+
+def _prepare_shard(shard: pd.DataFrame, category: str) -> List[Dict[str, Any]]:
+    """子进程中逐行解析一个分片（分片中的行已在主进程中通过列式验证）"""
+    return [_worker_importer.prepare_row(row, category, validated=True) for row in shard.to_dict('records')]
 
 
 def main():
@@ -492,25 +1982,55 @@ def main():
   # 仅验证Herb类术语
   python import_terms.py --category herb --input data/herb_terms.xlsx --validate-only
   
+  # 读取 Excel 中指定的工作表，按 5000 行分批流式处理
+  python import_terms.py --category herb --input data/herb_terms.xlsx --sheet 草药 --chunk-size 5000
+  
   # 使用自定义配置文件
   python import_terms.py --category disease --input data/disease.csv --config my-config.yaml
+  
+  # 按清单一次导入多个类别（本体只加载、保存一次）
+  python import_terms.py --manifest data/import_manifest.yaml
+  
+  # 使用本体缓存，并仅追加新术语的公理（不重写整个 tch-edit.owl）
+  python import_terms.py --category pattern --input data/pattern_terms.csv --cache --incremental
+
+  # 演练：查看哪些术语会被创建、跳过或拒绝，不修改本体
+  python import_terms.py --category pattern --input data/pattern_terms.csv --plan plan.csv
+
+  # 长时间导入：每 5000 行保存一次检查点，中断后续传
+  python import_terms.py --category herb --input data/herb_terms.csv --incremental --checkpoint-rows 5000
+  python import_terms.py --category herb --input data/herb_terms.csv --incremental --checkpoint-rows 5000 --resume
+
+  # 大文件导入：4 个进程并行验证和解析字段
+  python import_terms.py --category herb --input data/herb_terms.csv --workers 4
+
+  # 十万级术语批量导入：直接生成 OFN 组件文件
+  python import_terms.py --category herb --input data/herb_terms.csv --chunk-size 10000 --emit-component
+
+  # 重新导入修订后的文件，只更新内容有变化的术语
+  python import_terms.py --category pattern --input data/pattern_terms.csv --upsert
         """
     )
     
     parser.add_argument(
         '--category',
-        required=True,
-        choices=[
-            'pattern', 'disease', 'symptom', 'sign', 'herb', 'formula',
-            'principle', 'method', 'differentiation', 'pathomechanism'
-        ],
+        choices=CATEGORIES,
         help='术语类别'
     )
     
     parser.add_argument(
         '--input',
-        required=True,
-        help='输入文件路径 (CSV或Excel)'
+        help='输入文件路径 (CSV、Excel、Parquet 或 Arrow IPC)'
+    )
+    
+    parser.add_argument(
+        '--sheet',
+        help='Excel 输入读取的工作表名称或序号（从 0 开始，默认: 第一个工作表）'
+    )
+    
+    parser.add_argument(
+        '--manifest',
+        help='导入清单 (YAML)，列出多组 category/input，本体只加载和保存一次'
     )
     
     parser.add_argument(
@@ -531,20 +2051,130 @@ def main():
         help='仅验证数据，不导入到本体'
     )
     
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        help='CSV 分块读取的行数，大文件内存占用不随行数增长 (默认: 配置 import_options.chunk_size)'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='仅将新术语的公理追加到本体文件末尾，不重新序列化整个本体'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='使用 SQLite 本体缓存，tch-edit.owl 或 imports/ 未变化时跳过 OFN 解析'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='验证和字段解析使用的进程数，本体修改始终在主进程中完成 (默认: 1)'
+    )
+    
+    parser.add_argument(
+        '--checkpoint-rows',
+        type=int,
+        help='每处理多少行保存一次本体和检查点，需要 --incremental (默认: 配置 import_options.checkpoint_rows)'
+    )
+    
+    parser.add_argument(
+        '--checkpoint-seconds',
+        type=float,
+        help='每隔多少秒保存一次本体和检查点，需要 --incremental (默认: 配置 import_options.checkpoint_seconds)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='从上次中断时的检查点继续导入（需使用相同的输入文件和类别）'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='记录各阶段（配置、读取、备份、加载、逐行处理、保存、报告）耗时和内存峰值，写入 term_import_profile_*.json'
+    )
+    
+    parser.add_argument(
+        '--upsert',
+        action='store_true',
+        help='已存在的术语按内容指纹比较，内容变化时更新，未变化时跳过（指纹只在 --upsert 模式下记录，未记录指纹的术语按已变化处理；'
+             '有术语被更新时 --incremental 无法仅追加公理，会改为完整保存本体）'
+    )
+    
+    parser.add_argument(
+        '--emit-component',
+        nargs='?',
+        const='',
+        metavar='OUTPUT',
+        help='批量导入：直接写出 OFN 组件文件（默认 components/{category}_terms.owl），不修改 tch-edit.owl'
+    )
+    
+    parser.add_argument(
+        '--plan',
+        nargs='?',
+        const='',
+        metavar='OUTPUT',
+        help='只生成导入计划（创建/跳过/拒绝/父类未解析），不修改本体；OUTPUT 以 .json 结尾时输出 JSON，否则输出 CSV'
+    )
+    
     args = parser.parse_args()
     
+    if args.manifest:
+        if args.category or args.input:
+            parser.error('--manifest 不能与 --category/--input 同时使用')
+        if args.plan is not None or args.emit_component is not None or args.resume:
+            parser.error('--plan/--emit-component/--resume 需要与 --category/--input 一起使用')
+    elif not (args.category and args.input):
+        parser.error('需要同时指定 --category 和 --input，或使用 --manifest')
+    if (args.checkpoint_rows or args.checkpoint_seconds or args.resume) and not args.incremental:
+        parser.error('--checkpoint-rows/--checkpoint-seconds/--resume 需要与 --incremental 一起使用')
+    
     # 创建导入器
     importer = TCHTermImporter(
         config_path=args.config,
-        ontology_path=args.ontology
+        ontology_path=args.ontology,
+        use_cache=args.cache,
+        incremental=args.incremental,
+        chunk_size=args.chunk_size,
+        upsert=args.upsert,
+        workers=args.workers,
+        checkpoint_rows=args.checkpoint_rows,
+        checkpoint_seconds=args.checkpoint_seconds,
+        resume=args.resume,
+        sheet=args.sheet,
+        profile=args.profile
     )
     
     # 执行导入
-    importer.import_terms(
-        file_path=args.input,
-        category=args.category,
-        validate_only=args.validate_only
-    )
+    if args.manifest:
+        importer.import_manifest(
+            manifest_path=args.manifest,
+            validate_only=args.validate_only
+        )
+    elif args.emit_component is not None:
+        importer.emit_component(
+            file_path=args.input,
+            category=args.category,
+            output_path=args.emit_component or None
+        )
+    elif args.plan is not None:
+        importer.plan_import(
+            file_path=args.input,
+            category=args.category,
+            output_path=args.plan or None
+        )
+    else:
+        importer.import_terms(
+            file_path=args.input,
+            category=args.category,
+            validate_only=args.validate_only
+        )
 
 
 if __name__ == '__main__':
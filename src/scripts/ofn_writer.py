@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OWL Functional Syntax (OFN) 写出工具
+OFN Axiom Writer for TCH Ontology
+
+功能 / Features:
+- 将 IRI、字面量和常用公理格式化为 OFN 文本
+- 将新公理原子地插入到 tch-edit.owl 的结尾括号之前，无需重新序列化整个本体
+- 流式写出完整的 OFN 本体文件（如 ODK components/ 组件），内存占用与公理数量无关
+
+用法 / Usage:
+    from ofn_writer import declaration, annotation_assertion, splice_axioms
+    splice_axioms('tch-edit.owl', [declaration('Class', iri), ...])
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+# ODK 生成的 OFN 文件中总是声明的标准前缀
+STANDARD_PREFIXES = {
+    'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
+    'rdfs': 'http://www.w3.org/2000/01/rdf-schema#',
+    'owl': 'http://www.w3.org/2002/07/owl#',
+    'xsd': 'http://www.w3.org/2001/XMLSchema#',
+}
+
+RDFS_LABEL = STANDARD_PREFIXES['rdfs'] + 'label'
+RDFS_COMMENT = STANDARD_PREFIXES['rdfs'] + 'comment'
+
+
+def ofn_iri(iri: str) -> str:
+    """IRI 转换为 OFN 形式，标准前缀使用缩写"""
+    for prefix, namespace in STANDARD_PREFIXES.items():
+        if iri.startswith(namespace):
+            return f"{prefix}:{iri[len(namespace):]}"
+    return f"<{iri}>"
+
+
+def ofn_literal(value: str, lang: Optional[str] = None) -> str:
+    """字符串字面量转换为 OFN 形式（转义反斜杠和双引号）"""
+    escaped = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'"{escaped}"@{lang}' if lang else f'"{escaped}"'
+
+
+def declaration(entity_type: str, iri: str) -> str:
+    """Declaration 公理，entity_type 如 Class / AnnotationProperty"""
+    return f"Declaration({entity_type}({ofn_iri(iri)}))"
+
+
+def sub_class_of(child_iri: str, parent_iri: str) -> str:
+    """SubClassOf 公理"""
+    return f"SubClassOf({ofn_iri(child_iri)} {ofn_iri(parent_iri)})"
+
+
+def sub_class_of_some(child_iri: str, property_iri: str, filler_iri: str) -> str:
+    """SubClassOf 公理，父类为存在量词限定 ObjectSomeValuesFrom"""
+    return (f"SubClassOf({ofn_iri(child_iri)} "
+            f"ObjectSomeValuesFrom({ofn_iri(property_iri)} {ofn_iri(filler_iri)}))")
+
+
+def annotation_assertion(property_iri: str, subject_iri: str, value: str,
+                         lang: Optional[str] = None) -> str:
+    """AnnotationAssertion 公理（字面量取值）"""
+    return f"AnnotationAssertion({ofn_iri(property_iri)} {ofn_iri(subject_iri)} {ofn_literal(value, lang)})"
+
+
+def prefix_declarations(prefixes: Optional[Dict[str, str]] = None) -> str:
+    """OFN 文件头的 Prefix 声明，默认使用标准前缀"""
+    prefixes = STANDARD_PREFIXES if prefixes is None else prefixes
+    return ''.join(f"Prefix({prefix}:=<{namespace}>)\n" for prefix, namespace in prefixes.items())
+
+
+def _find_closing_paren(f) -> int:
+    """返回文件末尾 Ontology( ... ) 结尾括号的字节偏移"""
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    block_size = 4096
+    while pos > 0:
+        start = max(0, pos - block_size)
+        f.seek(start)
+        chunk = f.read(pos - start)
+        stripped = chunk.rstrip()
+        if stripped:
+            if not stripped.endswith(b')'):
+                raise ValueError("文件末尾不是 Ontology(...) 的结尾括号，无法追加公理")
+            return start + len(stripped) - 1
+        pos = start
+    raise ValueError("文件为空，无法追加公理")
+
+
+def splice_axioms(path, axioms: Iterable[str], comment: Optional[str] = None) -> int:
+    """
+    将公理插入 OFN 文件结尾括号之前
+
+    先复制到同目录临时文件，在临时文件末尾截断并追加公理，fsync 后
+    通过 os.replace 原子替换原文件；任何一步失败时原文件保持不变。
+
+    Args:
+        path: OFN 本体文件路径
+        axioms: 公理文本（每条一行）
+        comment: 插入块前的注释行
+
+    Returns:
+        写入的公理条数
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    count = 0
+
+    shutil.copy(path, tmp_path)
+    try:
+        with open(tmp_path, 'r+b') as f:
+            f.seek(_find_closing_paren(f))
+            f.truncate()
+            f.write(b'\n')
+            if comment:
+                f.write(f"# {comment}\n".encode('utf-8'))
+            for axiom in axioms:
+                f.write(axiom.encode('utf-8'))
+                f.write(b'\n')
+                count += 1
+            f.write(b'\n\n)\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return count
+
+
+def write_ontology(path, ontology_iri: str, axioms: Iterable[str],
+                   comment: Optional[str] = None) -> int:
+    """
+    流式写出完整的 OFN 本体文件
+
+    公理逐条写入同目录临时文件，完成后 fsync 并通过 os.replace 原子替换目标文件；
+    axioms 可以是生成器，整个过程不在内存中保留公理列表。
+
+    Args:
+        path: 输出文件路径
+        ontology_iri: 本体 IRI
+        axioms: 公理文本（每条一行）
+        comment: 写在 Ontology( 之后的注释行
+
+    Returns:
+        写入的公理条数
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    count = 0
+
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(prefix_declarations())
+            f.write(f"\nOntology({ofn_iri(ontology_iri)}\n")
+            if comment:
+                f.write(f"# {comment}\n")
+            f.write('\n')
+            for axiom in axioms:
+                f.write(axiom)
+                f.write('\n')
+                count += 1
+            f.write(')\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return count